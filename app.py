@@ -3,261 +3,544 @@ Steam 리뷰 스크래핑 및 감정 분석 웹 애플리케이션
 Flask를 사용한 간단한 웹 인터페이스
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file
 import os
 import json
-from finalcode import SteamReviewScraper, SentimentAnalyzer
-from visualization import generate_all_visualizations
+import atexit
+import threading
+from finalcode import SteamReviewScraper, SentimentAnalyzer, SENTIMENT_LABELS
+from driver_pool import WebDriverPool
+from jobs import JobManager, JobQueueFull, JobCancelled, FINISHED_STATES
+from sentiment_cache import SentimentCache
+from dataset_store import DatasetStore
+from review_db import DEFAULT_DB_PATH, ReviewDatabase
+from review_storage import PARQUET_COMPRESSION
+from visualization import VISUALIZATION_COLUMNS, generate_all_visualizations
+import io
 import pandas as pd
 
 app = Flask(__name__)
 
-# 전역 변수
-current_df = None
-scraper = None
+# 요청 간에 공유하는 WebDriver 풀 (환경 변수로 크기 조정)
+driver_pool = WebDriverPool(
+    max_size=int(os.environ.get('DRIVER_POOL_SIZE', 2)),
+    warm_size=int(os.environ.get('DRIVER_POOL_WARM', 1)),
+    max_uses=int(os.environ.get('DRIVER_POOL_MAX_USES', 50)),
+    idle_timeout=int(os.environ.get('DRIVER_POOL_IDLE_TIMEOUT', 300))
+)
+atexit.register(driver_pool.close)
+
+# 분석 요청 간에 공유하는 감정 점수 캐시 (디스크 캐시는 재시작 후에도 유지)
+sentiment_cache = SentimentCache(
+    max_entries=int(os.environ.get('SENTIMENT_CACHE_SIZE', 100000)),
+    path=os.environ.get('SENTIMENT_CACHE_PATH', 'sentiment_cache.sqlite') or None
+)
+atexit.register(sentiment_cache.close)
+
+# 데이터셋 ID별로 수집/분석한 리뷰를 보관하는 저장소 (메모리 예산을 넘으면 디스크로 내림)
+dataset_store = DatasetStore(
+    max_bytes=int(os.environ.get('DATASET_MEMORY_MB', 256)) * 1024 * 1024,
+    directory=os.environ.get('DATASET_DIR', 'datasets')
+)
+atexit.register(dataset_store.flush)
+
+# 실행이 끝나도 유지되는 게임별 리뷰 저장소 (스크래핑/분석 결과를 누적)
+review_db = ReviewDatabase(os.environ.get('REVIEW_DB_PATH', DEFAULT_DB_PATH))
+atexit.register(review_db.close)
+
+# 오래 걸리는 작업을 요청 스레드 밖에서 실행하는 작업 관리자
+job_manager = JobManager(
+    max_workers=int(os.environ.get('JOB_WORKERS', 2)),
+    max_pending=int(os.environ.get('JOB_MAX_PENDING', 16))
+)
+atexit.register(job_manager.shutdown)
+
+# 요청 간에 공유하는 감정 분석기 (프로세스당 한 번 생성, 여러 요청 스레드에서 동시에 사용)
 analyzer = None
+analyzer_error = None
+_analyzer_lock = threading.Lock()
+_warmup_started = False
+
+def get_analyzer():
+    """공유 SentimentAnalyzer 반환 (처음 호출 시 생성 및 워밍업, 실패하면 다음 호출에서 다시 시도)"""
+    global analyzer, analyzer_error
+    if analyzer is not None:
+        return analyzer
+    with _analyzer_lock:
+        if analyzer is None:
+            try:
+                shared = SentimentAnalyzer(cache=sentiment_cache,
+                                           linear_model=os.environ.get('SENTIMENT_MODEL_PATH'))
+                # 텍스트 정리와 VADER 엔진을 한 번 실행하여 첫 요청의 지연을 없앰
+                shared.score_batch(shared.clean_texts(['This game is really great fun!']))
+            except Exception as e:
+                analyzer_error = str(e)
+                raise
+            analyzer = shared
+            analyzer_error = None
+    return analyzer
+
+def prewarm_analyzer():
+    """백그라운드에서 감정 분석기를 미리 준비 (여러 번 호출해도 한 번만 실행)"""
+    global _warmup_started
+    if _warmup_started:
+        return
+    _warmup_started = True
+    
+    def _warm():
+        global _warmup_started
+        try:
+            get_analyzer()
+            print("감정 분석기가 준비되었습니다.")
+        except Exception as e:
+            _warmup_started = False
+            print(f"감정 분석기 준비 실패 (요청 시 다시 시도): {e}")
+    threading.Thread(target=_warm, daemon=True).start()
+
+def prewarm_driver_pool():
+    """백그라운드에서 WebDriver를 미리 시작 (Chrome이 없으면 경고만 출력)"""
+    def _prestart():
+        try:
+            driver_pool.prestart()
+            print("WebDriver 풀이 준비되었습니다.")
+        except Exception as e:
+            print(f"WebDriver 미리 시작 실패 (요청 시 다시 시도): {e}")
+    threading.Thread(target=_prestart, daemon=True).start()
 
 @app.route('/')
 def index():
     """메인 페이지"""
     return render_template('index.html')
 
-@app.route('/api/scrape', methods=['POST'])
-def scrape_reviews():
-    """리뷰 스크래핑 API"""
-    global current_df, scraper
+@app.route('/api/ready', methods=['GET'])
+def readiness():
+    """준비 상태 확인 API (감정 분석기 워밍업이 끝나면 200, 그 전에는 503)"""
+    if analyzer is None:
+        prewarm_analyzer()
+    status = {
+        'ready': analyzer is not None,
+        'analyzer': 'ready' if analyzer is not None else ('failed' if analyzer_error else 'warming'),
+        'driver_pool': driver_pool.stats()
+    }
+    if analyzer is None and analyzer_error:
+        status['error'] = analyzer_error
+    return jsonify(status), 200 if status['ready'] else 503
+
+# 스크래핑에 실패하거나 리뷰가 없을 때 사용하는 샘플 리뷰
+SAMPLE_REVIEWS = [
+    {
+        'review_text': 'Great game! I love playing this with my friends. The graphics are amazing and the gameplay is smooth.',
+        'recommended': True,
+        'playtime_at_review': 150.5,
+        'date_posted': '2024-01-15',
+        'review_length': 95
+    },
+    {
+        'review_text': 'This game is terrible. Too many bugs and the servers are always down. Waste of money.',
+        'recommended': False,
+        'playtime_at_review': 5.2,
+        'date_posted': '2024-01-10',
+        'review_length': 78
+    },
+    {
+        'review_text': 'Decent game but needs more content. The mechanics are okay but gets boring after a while.',
+        'recommended': True,
+        'playtime_at_review': 45.0,
+        'date_posted': '2024-01-12',
+        'review_length': 82
+    },
+    {
+        'review_text': 'Amazing experience! Best game I have played in years. Highly recommend to everyone.',
+        'recommended': True,
+        'playtime_at_review': 300.0,
+        'date_posted': '2024-01-20',
+        'review_length': 75
+    },
+    {
+        'review_text': 'Not worth the price. The game is broken and the developers dont care about fixing it.',
+        'recommended': False,
+        'playtime_at_review': 10.5,
+        'date_posted': '2024-01-08',
+        'review_length': 88
+    }
+]
+
+# 진행 이벤트가 없을 때 연결 유지용 주석을 보내는 간격 (초)
+SSE_KEEPALIVE_SECONDS = 15
+
+# 시각화 생성 시 확인할 이미지 파일
+EXPECTED_IMAGES = [
+    'recommendation_distribution.png',
+    'sentiment_boxplot.png',
+    'sentiment_distribution.png',
+    'wordcloud.png',
+    'wordcloud_simple.png',  # 대체 워드 클라우드
+    'playtime_vs_sentiment.png',
+    'sentiment_pie_chart.png',  # 추가 시각화
+    'review_length_distribution.png',
+    'sentiment_score_histogram.png',
+    'playtime_distribution.png',
+    'date_sentiment_trend.png'
+]
+
+# matplotlib 전역 상태를 사용하므로 시각화는 한 번에 하나씩 생성
+_visualize_lock = threading.Lock()
+
+def sample_reviews(num_reviews):
+    """샘플 리뷰를 num_reviews개만큼 반복하여 반환"""
+    return (SAMPLE_REVIEWS * (num_reviews // len(SAMPLE_REVIEWS) + 1))[:num_reviews]
+
+def _check_cancelled(job):
+    """작업으로 실행 중이면 취소 요청 확인 (요청 스레드에서 바로 실행하면 job은 None)"""
+    if job is not None:
+        job.check_cancelled()
+
+def _progress(job):
+    """작업으로 실행 중이면 진행 이벤트를 기록하고 취소 요청을 확인하는 콜백"""
+    return job.report if job is not None else None
+
+def _get_dataset(params, analyzed=False):
+    """
+    매개변수의 dataset_id로 데이터셋 조회
+    
+    Raises:
+        ValueError: dataset_id가 없거나 데이터셋을 찾을 수 없거나, analyzed=True인데 감정 분석 전인 경우
+    """
+    dataset_id = params.get('dataset_id')
+    if not dataset_id:
+        raise ValueError('dataset_id가 필요합니다. 먼저 리뷰를 스크래핑해주세요.')
+    df = dataset_store.get(dataset_id)
+    if df is None or df.empty:
+        raise ValueError(f'데이터셋을 찾을 수 없습니다: {dataset_id}')
+    if analyzed and 'compound_score' not in df.columns:
+        raise ValueError('먼저 감정 분석을 수행해주세요.')
+    return dataset_id, df
+
+# 리뷰 저장소 조회 시 /api/data가 한 번에 반환하는 최대 행 수
+MAX_PAGE_SIZE = 1000
+
+def _review_filters(params):
+    """
+    매개변수에서 리뷰 저장소 조회 조건 추출 (game_id, recommended, sentiment_label, date_from, date_to)
+    
+    Raises:
+        ValueError: 조건 값이 잘못된 경우
+    """
+    filters = {'game_id': params.get('game_id')}
+    recommended = params.get('recommended')
+    if isinstance(recommended, str):
+        if recommended.lower() not in ('true', 'false', '1', '0'):
+            raise ValueError(f'recommended는 true 또는 false여야 합니다: {recommended}')
+        recommended = recommended.lower() in ('true', '1')
+    filters['recommended'] = recommended
+    sentiment_label = params.get('sentiment_label') or None
+    if sentiment_label is not None and sentiment_label not in SENTIMENT_LABELS:
+        raise ValueError(f'알 수 없는 감정 레이블입니다: {sentiment_label} ({", ".join(SENTIMENT_LABELS)} 중 선택)')
+    filters['sentiment_label'] = sentiment_label
+    filters['date_from'] = params.get('date_from') or None
+    filters['date_to'] = params.get('date_to') or None
+    return filters
+
+def run_scrape(job, params):
+    """
+    리뷰 스크래핑 단계 (실패하거나 리뷰가 없으면 샘플 데이터 사용)
+    수집한 리뷰는 새 데이터셋으로 저장하고, 같은 작업의 다음 단계가 사용하도록 params['dataset_id']에 기록합니다.
     
+    Raises:
+        ValueError: 리뷰를 수집할 수 없는 경우
+    """
+    game_id = params.get('game_id', '730')
+    game_name = params.get('game_name', 'Counter Strike 2')
+    num_reviews = int(params.get('num_reviews', 50))
+    
+    # 스크래퍼 초기화
+    scraper = SteamReviewScraper(game_id, game_name, progress=_progress(job))
+    
+    # 스크래핑 시도 (실패 시 샘플 데이터 자동 생성)
+    sample = False
     try:
-        data = request.json
-        game_id = data.get('game_id', '730')
-        game_name = data.get('game_name', 'Counter Strike 2')
-        num_reviews = int(data.get('num_reviews', 50))
-        
-        # 스크래퍼 초기화
-        scraper = SteamReviewScraper(game_id, game_name)
-        
-        # 스크래핑 시도 (실패 시 샘플 데이터 자동 생성)
-        try:
-            scraper.scrape_reviews_selenium(num_reviews=num_reviews, delay=2)
-        except Exception as e:
-            print(f"스크래핑 실패, 샘플 데이터 생성: {e}")
-            # 샘플 데이터 생성
-            sample_reviews = [
-                {
-                    'review_text': 'Great game! I love playing this with my friends. The graphics are amazing and the gameplay is smooth.',
-                    'recommended': True,
-                    'playtime_at_review': 150.5,
-                    'date_posted': '2024-01-15',
-                    'review_length': 95
-                },
-                {
-                    'review_text': 'This game is terrible. Too many bugs and the servers are always down. Waste of money.',
-                    'recommended': False,
-                    'playtime_at_review': 5.2,
-                    'date_posted': '2024-01-10',
-                    'review_length': 78
-                },
-                {
-                    'review_text': 'Decent game but needs more content. The mechanics are okay but gets boring after a while.',
-                    'recommended': True,
-                    'playtime_at_review': 45.0,
-                    'date_posted': '2024-01-12',
-                    'review_length': 82
-                },
-                {
-                    'review_text': 'Amazing experience! Best game I have played in years. Highly recommend to everyone.',
-                    'recommended': True,
-                    'playtime_at_review': 300.0,
-                    'date_posted': '2024-01-20',
-                    'review_length': 75
-                },
-                {
-                    'review_text': 'Not worth the price. The game is broken and the developers dont care about fixing it.',
-                    'recommended': False,
-                    'playtime_at_review': 10.5,
-                    'date_posted': '2024-01-08',
-                    'review_length': 88
-                }
-            ]
-            scraper.reviews = sample_reviews * (num_reviews // 5 + 1)
-            scraper.reviews = scraper.reviews[:num_reviews]
-        
-        # DataFrame으로 변환
-        current_df = scraper.to_dataframe()
-        
-        # 리뷰가 없는 경우 체크
-        if current_df is None or current_df.empty:
-            # 샘플 데이터 생성
-            sample_reviews = [
-                {
-                    'review_text': 'Great game! I love playing this with my friends. The graphics are amazing and the gameplay is smooth.',
-                    'recommended': True,
-                    'playtime_at_review': 150.5,
-                    'date_posted': '2024-01-15',
-                    'review_length': 95
-                },
-                {
-                    'review_text': 'This game is terrible. Too many bugs and the servers are always down. Waste of money.',
-                    'recommended': False,
-                    'playtime_at_review': 5.2,
-                    'date_posted': '2024-01-10',
-                    'review_length': 78
-                },
-                {
-                    'review_text': 'Decent game but needs more content. The mechanics are okay but gets boring after a while.',
-                    'recommended': True,
-                    'playtime_at_review': 45.0,
-                    'date_posted': '2024-01-12',
-                    'review_length': 82
-                },
-                {
-                    'review_text': 'Amazing experience! Best game I have played in years. Highly recommend to everyone.',
-                    'recommended': True,
-                    'playtime_at_review': 300.0,
-                    'date_posted': '2024-01-20',
-                    'review_length': 75
-                },
-                {
-                    'review_text': 'Not worth the price. The game is broken and the developers dont care about fixing it.',
-                    'recommended': False,
-                    'playtime_at_review': 10.5,
-                    'date_posted': '2024-01-08',
-                    'review_length': 88
-                }
-            ]
-            scraper.reviews = sample_reviews * (num_reviews // 5 + 1)
-            scraper.reviews = scraper.reviews[:num_reviews]
-            current_df = scraper.to_dataframe()
-        
-        if current_df is None or current_df.empty:
-            return jsonify({
-                'success': False,
-                'message': '리뷰를 수집할 수 없습니다. 게임 ID를 확인하거나 나중에 다시 시도해주세요.'
-            }), 400
-        
+        # 풀에서 미리 시작된 WebDriver를 빌려 사용하고 반납
+        with driver_pool.driver(timeout=60) as driver:
+            _check_cancelled(job)
+            scraper.driver = driver
+            try:
+                scraper.scrape_reviews_selenium(num_reviews=num_reviews, delay=2)
+            finally:
+                scraper.close()
+    except JobCancelled:
+        raise
+    except Exception as e:
+        print(f"스크래핑 실패, 샘플 데이터 생성: {e}")
+        scraper.reviews = sample_reviews(num_reviews)
+        sample = True
+    _check_cancelled(job)
+    
+    # DataFrame으로 변환 (리뷰가 없으면 샘플 데이터 사용)
+    df = scraper.to_dataframe()
+    if df is None or df.empty:
+        scraper.reviews = sample_reviews(num_reviews)
+        df = scraper.to_dataframe()
+        sample = True
+    
+    if df is None or df.empty:
+        raise ValueError('리뷰를 수집할 수 없습니다. 게임 ID를 확인하거나 나중에 다시 시도해주세요.')
+    stored = 0
+    if not sample:
+        # 실제 수집한 리뷰만 리뷰 저장소에 누적 (game_id 컬럼이 있으면 분석 결과도 저장)
+        df['game_id'] = str(game_id)
+        stored = review_db.upsert(df, game_name=game_name)
+    dataset_id = dataset_store.create(df)
+    params['dataset_id'] = dataset_id
+    
+    return {
+        'message': f'{len(df)}개의 리뷰를 수집했습니다.',
+        'count': len(df),
+        'stored': stored,
+        'dataset_id': dataset_id
+    }
+
+def run_analyze(job, params):
+    """
+    감정 분석 단계 (결과는 같은 데이터셋에 저장)
+    
+    Raises:
+        ValueError: 데이터셋이 없거나 알 수 없는 엔진인 경우
+        FileNotFoundError: 선형 모델 파일이 없는 경우
+    """
+    dataset_id, df = _get_dataset(params)
+    
+    # 점수 계산 엔진 선택 ('vader' 또는 'linear')
+    backend = params.get('backend', 'vader')
+    if backend not in SentimentAnalyzer.BACKENDS:
+        raise ValueError(f'알 수 없는 감정 분석 엔진입니다: {backend}')
+    
+    # 공유 분석기로 감정 분석 수행
+    df = get_analyzer().analyze_dataframe(df.copy(), backend=backend, progress=_progress(job))
+    _check_cancelled(job)
+    dataset_store.put(dataset_id, df)
+    if 'game_id' in df.columns:
+        review_db.upsert(df)
+    
+    # 통계 계산
+    stats = {
+        'total_reviews': len(df),
+        'recommended': int(df['recommended'].sum()),
+        'not_recommended': int((~df['recommended']).sum()),
+        'avg_compound_score': float(df['compound_score'].mean()),
+        'recommended_avg_score': float(df[df['recommended']]['compound_score'].mean()) if df['recommended'].sum() > 0 else 0,
+        'not_recommended_avg_score': float(df[~df['recommended']]['compound_score'].mean()) if (~df['recommended']).sum() > 0 else 0,
+        'sentiment_distribution': {label: int(count) for label, count in df['sentiment_label'].value_counts().items() if count > 0}
+    }
+    
+    return {
+        'message': '감정 분석이 완료되었습니다.',
+        'stats': stats,
+        'dataset_id': dataset_id
+    }
+
+def run_visualize(job, params):
+    """
+    시각화 생성 단계 (이미지는 데이터셋 디렉토리에 저장)
+    dataset_id 없이 game_id가 주어지면 리뷰 저장소에서 조건(_review_filters)에 맞는 분석된 리뷰의
+    그래프용 컬럼만 조회하여 새 데이터셋으로 만든 뒤 시각화합니다.
+    
+    Raises:
+        ValueError: 데이터셋이 없거나 감정 분석 전인 경우
+    """
+    if not params.get('dataset_id') and params.get('game_id'):
+        df = review_db.query(columns=VISUALIZATION_COLUMNS, analyzed=True, **_review_filters(params))
+        if df.empty:
+            raise ValueError(f"리뷰 저장소에 게임 {params['game_id']}의 분석된 리뷰가 없습니다.")
+        params['dataset_id'] = dataset_store.create(df)
+    dataset_id, df = _get_dataset(params, analyzed=True)
+    output_dir = dataset_store.dataset_dir(dataset_id)
+    
+    # 시각화 생성
+    with _visualize_lock:
+        _check_cancelled(job)
+        generate_all_visualizations(df, progress=_progress(job), output_dir=output_dir)
+    
+    # 생성된 이미지 파일 확인
+    image_files = [img for img in EXPECTED_IMAGES if os.path.exists(os.path.join(output_dir, img))]
+    
+    message = '시각화가 생성되었습니다.'
+    if 'wordcloud.png' not in image_files:
+        message += ' (워드 클라우드는 생성되지 않았습니다. wordcloud 패키지가 필요합니다.)'
+    
+    return {
+        'message': message,
+        'images': image_files,
+        'image_urls': [f'/api/datasets/{dataset_id}/images/{img}' for img in image_files],
+        'dataset_id': dataset_id
+    }
+
+# 작업으로 실행할 수 있는 단계 (등록한 순서대로 실행)
+JOB_STEPS = {
+    'scrape': run_scrape,
+    'analyze': run_analyze,
+    'visualize': run_visualize
+}
+
+def _run_now(step):
+    """단계를 요청 스레드에서 바로 실행하고 기존 API 형식으로 응답"""
+    try:
+        result = step(None, request.get_json(silent=True) or {})
+    except (ValueError, FileNotFoundError) as e:
         return jsonify({
-            'success': True,
-            'message': f'{len(current_df)}개의 리뷰를 수집했습니다.',
-            'count': len(current_df)
-        })
-        
+            'success': False,
+            'message': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
             'message': f'오류 발생: {str(e)}'
         }), 500
+    return jsonify({'success': True, **result})
+
+@app.route('/api/scrape', methods=['POST'])
+def scrape_reviews():
+    """리뷰 스크래핑 API (요청 스레드에서 실행, 오래 걸리면 /api/jobs 사용)"""
+    return _run_now(run_scrape)
 
 @app.route('/api/analyze', methods=['POST'])
 def analyze_sentiment():
-    """감정 분석 API"""
-    global current_df, analyzer
+    """감정 분석 API (요청 스레드에서 실행, 오래 걸리면 /api/jobs 사용)"""
+    return _run_now(run_analyze)
+
+@app.route('/api/visualize', methods=['POST'])
+def create_visualizations():
+    """시각화 생성 API (요청 스레드에서 실행, 오래 걸리면 /api/jobs 사용)"""
+    return _run_now(run_visualize)
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    작업 등록 API (바로 작업 ID 반환)
+    요청 본문: {"steps": ["scrape", "analyze", "visualize"], 나머지는 단계 매개변수 (game_id, num_reviews, backend 등)}
+    """
+    data = request.get_json(silent=True) or {}
+    steps = data.get('steps', list(JOB_STEPS))
+    if isinstance(steps, str):
+        steps = [steps]
+    unknown = [name for name in steps if name not in JOB_STEPS]
+    if not steps or unknown:
+        return jsonify({
+            'success': False,
+            'message': f'알 수 없는 작업 단계입니다: {", ".join(map(str, unknown))} ({", ".join(JOB_STEPS)} 중 선택)'
+        }), 400
+    if data.get('backend', 'vader') not in SentimentAnalyzer.BACKENDS:
+        return jsonify({
+            'success': False,
+            'message': f'알 수 없는 감정 분석 엔진입니다: {data.get("backend")}'
+        }), 400
     
+    params = {key: value for key, value in data.items() if key != 'steps'}
     try:
-        if current_df is None or current_df.empty:
-            return jsonify({
-                'success': False,
-                'message': '먼저 리뷰를 스크래핑해주세요.'
-            }), 400
-        
-        # 감정 분석 수행
-        analyzer = SentimentAnalyzer()
-        current_df = analyzer.analyze_dataframe(current_df.copy())
-        
-        # 결과 저장
-        current_df.to_csv('game_reviews.csv', index=False, encoding='utf-8-sig')
-        
-        # 통계 계산
-        stats = {
-            'total_reviews': len(current_df),
-            'recommended': int(current_df['recommended'].sum()),
-            'not_recommended': int((~current_df['recommended']).sum()),
-            'avg_compound_score': float(current_df['compound_score'].mean()),
-            'recommended_avg_score': float(current_df[current_df['recommended']]['compound_score'].mean()) if current_df['recommended'].sum() > 0 else 0,
-            'not_recommended_avg_score': float(current_df[~current_df['recommended']]['compound_score'].mean()) if (~current_df['recommended']).sum() > 0 else 0,
-            'sentiment_distribution': current_df['sentiment_label'].value_counts().to_dict()
-        }
-        
+        job = job_manager.submit([(name, JOB_STEPS[name]) for name in steps], params)
+    except JobQueueFull as e:
         return jsonify({
-            'success': True,
-            'message': '감정 분석이 완료되었습니다.',
-            'stats': stats
-        })
-        
-    except Exception as e:
+            'success': False,
+            'message': str(e)
+        }), 429
+    return jsonify({
+        'success': True,
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': f'/api/jobs/{job.id}'
+    }), 202
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """작업 목록 조회 API"""
+    return jsonify({
+        'success': True,
+        'jobs': [job.to_dict() for job in job_manager.list()]
+    })
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """작업 상태 및 결과 조회 API"""
+    job = job_manager.get(job_id)
+    if job is None:
         return jsonify({
             'success': False,
-            'message': f'오류 발생: {str(e)}'
-        }), 500
+            'message': '작업을 찾을 수 없습니다.'
+        }), 404
+    return jsonify({'success': True, **job.to_dict()})
 
-@app.route('/api/visualize', methods=['POST'])
-def create_visualizations():
-    """시각화 생성 API"""
-    try:
-        if not os.path.exists('game_reviews.csv'):
-            return jsonify({
-                'success': False,
-                'message': 'game_reviews.csv 파일이 없습니다. 먼저 감정 분석을 수행해주세요.'
-            }), 400
-        
-        # 시각화 생성
-        generate_all_visualizations('game_reviews.csv')
-        
-        # 생성된 이미지 파일 확인
-        image_files = []
-        expected_images = [
-            'recommendation_distribution.png',
-            'sentiment_boxplot.png',
-            'sentiment_distribution.png',
-            'wordcloud.png',
-            'wordcloud_simple.png',  # 대체 워드 클라우드
-            'playtime_vs_sentiment.png',
-            'sentiment_pie_chart.png',  # 추가 시각화
-            'review_length_distribution.png',
-            'sentiment_score_histogram.png',
-            'playtime_distribution.png',
-            'date_sentiment_trend.png'
-        ]
-        
-        for img in expected_images:
-            if os.path.exists(img):
-                image_files.append(img)
-        
-        message = '시각화가 생성되었습니다.'
-        if 'wordcloud.png' not in image_files:
-            message += ' (워드 클라우드는 생성되지 않았습니다. wordcloud 패키지가 필요합니다.)'
-        
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+    progress/step/result/status 이벤트를 순서대로 보내고 작업이 끝나면 종료합니다.
+    다시 연결할 때는 Last-Event-ID 헤더 (또는 after 쿼리)로 받은 이벤트 이후부터 보냅니다.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
         return jsonify({
-            'success': True,
-            'message': message,
-            'images': image_files
-        })
-        
-    except Exception as e:
+            'success': False,
+            'message': '작업을 찾을 수 없습니다.'
+        }), 404
+    try:
+        last_seq = int(request.headers.get('Last-Event-ID') or request.args.get('after', 0))
+    except ValueError:
+        last_seq = 0
+    
+    def stream():
+        seq = last_seq
+        while True:
+            events = job.events_after(seq, timeout=SSE_KEEPALIVE_SECONDS)
+            for event in events:
+                seq = event['seq']
+                yield f"id: {seq}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+            if job.status in FINISHED_STATES and not job.events_after(seq):
+                return
+            if not events:
+                # 프록시가 유휴 연결을 끊지 않도록 주석 줄 전송
+                yield ": keep-alive\n\n"
+    
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """작업 취소 API (실행 중인 작업은 현재 단계가 끝나면 중단)"""
+    job = job_manager.cancel(job_id)
+    if job is None:
         return jsonify({
             'success': False,
-            'message': f'오류 발생: {str(e)}'
-        }), 500
+            'message': '작업을 찾을 수 없습니다.'
+        }), 404
+    return jsonify({'success': True, **job.to_dict()})
 
 @app.route('/api/data', methods=['GET'])
 def get_data():
-    """데이터 조회 API"""
-    global current_df
+    """
+    데이터 조회 API
+    ?dataset_id=...: 데이터셋의 처음 100개 리뷰
+    ?game_id=...: 리뷰 저장소에서 조건에 맞는 리뷰를 최근 작성 순으로 조회
+        (recommended, sentiment_label, date_from, date_to, limit(기본 100, 최대 1000), offset)
+    """
+    if not request.args.get('dataset_id') and request.args.get('game_id'):
+        return _query_reviews(request.args)
+    try:
+        dataset_id, df = _get_dataset(request.args)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
     
     try:
-        if current_df is None or current_df.empty:
-            return jsonify({
-                'success': False,
-                'message': '데이터가 없습니다.'
-            }), 400
-        
         # 샘플 데이터만 반환 (너무 많으면 브라우저가 느려질 수 있음)
-        sample_size = min(100, len(current_df))
-        sample_df = current_df.head(sample_size)
+        sample_size = min(100, len(df))
+        sample_df = df.head(sample_size)
         
         return jsonify({
             'success': True,
+            'dataset_id': dataset_id,
             'data': sample_df.to_dict('records'),
-            'total_count': len(current_df),
+            'total_count': len(df),
             'sample_count': sample_size
         })
         
@@ -267,29 +550,86 @@ def get_data():
             'message': f'오류 발생: {str(e)}'
         }), 500
 
+def _query_reviews(args):
+    """리뷰 저장소 조회 (필요한 행만 SQLite에서 읽음)"""
+    try:
+        filters = _review_filters(args)
+        limit = min(max(int(args.get('limit', 100)), 0), MAX_PAGE_SIZE)
+        offset = max(int(args.get('offset', 0)), 0)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    df = review_db.query(limit=limit, offset=offset, **filters)
+    return jsonify({
+        'success': True,
+        'game_id': filters['game_id'],
+        # 분석 전 리뷰의 점수 등 결측값은 null로 반환
+        'data': df.astype(object).where(df.notna(), None).to_dict('records'),
+        'total_count': review_db.count(**filters),
+        'sample_count': len(df),
+        'offset': offset
+    })
+
+@app.route('/api/games', methods=['GET'])
+def list_games():
+    """리뷰 저장소에 저장된 게임 목록 API"""
+    return jsonify({'success': True, 'games': review_db.games()})
+
 @app.route('/api/download', methods=['GET'])
 def download_csv():
-    """CSV 파일 다운로드"""
-    if not os.path.exists('game_reviews.csv'):
+    """데이터셋을 파일로 다운로드 (?dataset_id=...&format=csv|parquet, 기본값: csv)"""
+    try:
+        dataset_id, df = _get_dataset(request.args)
+    except ValueError as e:
         return jsonify({
             'success': False,
-            'message': '파일이 없습니다.'
+            'message': str(e)
         }), 404
     
-    return send_file('game_reviews.csv', as_attachment=True, download_name='game_reviews.csv')
-
-@app.route('/images/<filename>')
-def get_image(filename):
-    """이미지 파일 제공"""
-    # 현재 디렉토리에서 이미지 파일 찾기
-    if os.path.exists(filename):
-        return send_file(filename, mimetype='image/png')
-    # static/images 폴더에서 찾기
-    image_path = os.path.join('static', 'images', filename)
-    if os.path.exists(image_path):
-        return send_file(image_path, mimetype='image/png')
-    # 파일이 없으면 404 반환
-    return jsonify({'error': 'Image not found'}), 404
+    file_format = request.args.get('format', 'csv')
+    if file_format == 'parquet':
+        data = io.BytesIO()
+        df.to_parquet(data, engine='pyarrow', compression=PARQUET_COMPRESSION, index=False)
+        data.seek(0)
+        return send_file(data, mimetype='application/vnd.apache.parquet', as_attachment=True,
+                         download_name='game_reviews.parquet')
+    if file_format != 'csv':
+        return jsonify({
+            'success': False,
+            'message': f'지원하지 않는 형식입니다: {file_format} (csv 또는 parquet)'
+        }), 400
+    
+    data = df.to_csv(index=False).encode('utf-8-sig')
+    return send_file(io.BytesIO(data), mimetype='text/csv', as_attachment=True,
+                     download_name='game_reviews.csv')
+
+@app.route('/api/datasets', methods=['GET'])
+def dataset_stats():
+    """데이터셋 저장소 상태 조회 API"""
+    return jsonify({'success': True, **dataset_store.stats()})
+
+@app.route('/api/datasets/<dataset_id>', methods=['DELETE'])
+def delete_dataset(dataset_id):
+    """데이터셋과 결과 파일 삭제 API"""
+    if not dataset_store.delete(dataset_id):
+        return jsonify({
+            'success': False,
+            'message': '데이터셋을 찾을 수 없습니다.'
+        }), 404
+    return jsonify({'success': True, 'dataset_id': dataset_id})
+
+@app.route('/api/datasets/<dataset_id>/images/<filename>')
+def get_dataset_image(dataset_id, filename):
+    """데이터셋별 시각화 이미지 제공"""
+    if not dataset_store.is_valid_id(dataset_id) or filename not in EXPECTED_IMAGES:
+        return jsonify({'error': 'Image not found'}), 404
+    path = os.path.join(dataset_store.directory, dataset_id, filename)
+    if not os.path.exists(path):
+        return jsonify({'error': 'Image not found'}), 404
+    return send_file(os.path.abspath(path), mimetype='image/png')
 
 if __name__ == '__main__':
     # templates 폴더 생성 확인
@@ -303,5 +643,10 @@ if __name__ == '__main__':
     print("\n서버를 중지하려면 Ctrl+C를 누르세요.")
     print("=" * 50)
     
+    # 디버그 리로더의 감시 프로세스에서는 Chrome과 분석기를 준비하지 않음
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        prewarm_driver_pool()
+        prewarm_analyzer()
+    
     app.run(debug=True, host='0.0.0.0', port=5000)
 
@@ -0,0 +1,278 @@
+"""
+여러 Steam 게임의 리뷰를 동시에 스크래핑하는 asyncio 기반 엔진
+게임마다 cursor 체인을 하나씩 돌리고, 전역 동시 요청 수와 호스트별 요청 속도를 제한합니다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+
+import requests
+
+from finalcode import SteamReviewScraper, STEAM_REVIEWS_API, create_session
+from rate_limiter import TransientError, call_with_retry_async, get_shared_limiter
+from scrape_state import ScrapeCheckpoint
+
+
+class AsyncScrapeEngine:
+    """여러 게임의 cursor 체인을 동시에 진행하는 스크래핑 엔진"""
+
+    def __init__(self, max_concurrency=16, requests_per_second=10.0, api_url=None, checkpoint_dir=None,
+                 seen_index=None, watermarks=None, max_retries=4, burst=None):
+        """
+        Args:
+            max_concurrency: 전체 게임에 걸친 동시 요청 수 상한
+            requests_per_second: 호스트별 초당 최대 요청 수 (None이면 제한 없음)
+                같은 프로세스의 다른 작업자와 공유하는 적응형 제한기를 사용하며, 이 값은 상한으로만 적용됨
+            api_url: 리뷰 JSON 엔드포인트 템플릿 ('{game_id}' 포함, 기본값: Steam appreviews)
+            checkpoint_dir: 게임별 체크포인트 디렉토리 (지정하면 중단된 지점부터 재개)
+            seen_index: 모든 게임이 공유하는 scrape_state.SeenReviewIndex (선택,
+                checkpoint_dir가 없으면 받은 리뷰를 저장한 뒤 save_seen()을 호출해야 다음 실행에서 건너뜀)
+            watermarks: scrape_state.DeltaWatermarks (지정하면 최신순으로 워터마크 이후 리뷰만 가져옴)
+            max_retries: 일시적 오류 발생 시 페이지당 최대 재시도 횟수
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (기본값: requests_per_second의 정수 부분)
+        """
+        self.max_concurrency = max_concurrency
+        self.api_url = api_url or STEAM_REVIEWS_API
+        self.checkpoint_dir = checkpoint_dir
+        self.seen_index = seen_index
+        self.watermarks = watermarks
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+        self.burst = burst
+        self._limiters = {}
+        self._semaphore = None
+        self._executor = None
+        self._session = None
+
+    def _make_scraper(self, game):
+        """게임 ID 또는 (게임 ID, 게임 이름) 튜플로 공유 세션을 사용하는 스크래퍼 생성"""
+        game_id, game_name = game if isinstance(game, (tuple, list)) else (game, str(game))
+        api_url = self.api_url.format(game_id=game_id)
+        scraper = SteamReviewScraper(game_id, game_name, api_url=api_url, seen_index=self.seen_index,
+                                     rate_limiter=self._limiter_for(api_url))
+        scraper.session = self._session
+        return scraper
+
+    def save_seen(self):
+        """지금까지 내보낸 리뷰의 ID를 seen_index 파일에 기록 (소비자가 리뷰를 저장한 뒤 호출)"""
+        if self.seen_index is not None:
+            self.seen_index.save()
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        # 모든 게임이 하나의 keep-alive 연결 풀을 공유
+        self._session = create_session(pool_size=self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+        self._executor = None
+        self._session = None
+
+    def _limiter_for(self, api_url):
+        """이 엔진의 속도 상한을 적용한 호스트별 공유 제한기 반환 (requests_per_second가 None이면 None)"""
+        if not self.requests_per_second:
+            return None
+        host = urlparse(api_url).netloc
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            rate = self.requests_per_second
+            burst = self.burst or max(1, int(rate))
+            # 다른 작업자가 먼저 만들었으면 이 엔진의 상한만 적용 (그 작업자의 감속 상태는 유지)
+            limiter = self._limiters[host] = get_shared_limiter(host, rate=rate, burst=burst)
+            limiter.apply_cap(rate, burst)
+        return limiter
+
+    async def _fetch(self, scraper, cursor, review_filter='all'):
+        """동시성 상한과 호스트별 속도 제한을 지켜 한 페이지를 가져옴 (일시적 오류는 재시도)"""
+        loop = asyncio.get_running_loop()
+
+        async def _request():
+            async with self._semaphore:
+                return await loop.run_in_executor(
+                    self._executor, lambda: scraper.fetch_page(cursor, review_filter=review_filter)
+                )
+
+        return await call_with_retry_async(_request, self._limiter_for(scraper.api_url), self.max_retries)
+
+    async def _write(self, func, *args, **kwargs):
+        """체크포인트/인덱스/워터마크 저장(fsync 포함)을 작업 스레드에서 실행하여 이벤트 루프를 막지 않음"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def _stream_delta(self, scraper, max_pages):
+        """
+        워터마크 이후에 작성된 리뷰만 최신순으로 내보냄
+        워터마크 갱신 규칙은 SteamReviewScraper.iter_new_reviews와 같음 (첫 실행은 항상 저장)
+        """
+        watermark = self.watermarks.get(scraper.game_id)
+        cursor = "*"
+        newest = None
+        caught_up = False
+
+        for page in range(max_pages):
+            try:
+                json_data = await self._fetch(scraper, cursor, review_filter='recent')
+            except (requests.RequestException, ValueError, TransientError) as e:
+                print(f"[{scraper.game_id}] 페이지 {page + 1} 스크래핑 중 오류: {e}")
+                break
+
+            raw_reviews = json_data.get('reviews') or []
+            page_reviews, page_newest, reached = scraper.parse_delta_page(raw_reviews, watermark)
+            await self._write(scraper.commit_page, None, None, page_reviews)
+            if page_newest is not None:
+                newest = page_newest if newest is None else max(newest, page_newest)
+            if page_reviews:
+                yield page_reviews
+
+            next_cursor = json_data.get('cursor', '')
+            if reached or not raw_reviews or not next_cursor or next_cursor == cursor:
+                caught_up = True
+                break
+            cursor = next_cursor
+
+        # 기존 워터마크까지 따라잡지 못했으면 갱신하지 않음 (첫 실행은 지킬 이전 구간이 없으므로 저장)
+        if newest is not None and (caught_up or watermark is None):
+            self.watermarks.update(scraper.game_id, newest)
+            await self._write(self.watermarks.save)
+
+    async def stream(self, game, num_pages=5):
+        """
+        한 게임의 리뷰를 페이지 단위로 내보내는 비동기 제너레이터
+
+        Args:
+            game: 게임 ID 또는 (게임 ID, 게임 이름) 튜플
+            num_pages: 가져올 최대 페이지 수
+
+        Yields:
+            페이지별 리뷰 레코드 리스트 (체크포인트에서 복원한 리뷰는 페이지 크기로 나누어 먼저 전달)
+        """
+        scraper = self._make_scraper(game)
+        if self.watermarks is not None:
+            async for batch in self._stream_delta(scraper, num_pages):
+                yield batch
+            return
+
+        checkpoint = ScrapeCheckpoint(scraper.game_id, self.checkpoint_dir) if self.checkpoint_dir else None
+        cursor, start_page, saved_batches = scraper.resume_from(checkpoint)
+        # 복원한 리뷰도 페이지 크기로 읽어 내보냄 (stream_all의 max_pending 배압 유지)
+        for batch in saved_batches:
+            yield batch
+        if checkpoint is not None and checkpoint.complete:
+            return
+
+        for page in range(start_page, num_pages):
+            try:
+                json_data = await self._fetch(scraper, cursor)
+            except (requests.RequestException, ValueError, TransientError) as e:
+                print(f"[{scraper.game_id}] 페이지 {page + 1} 스크래핑 중 오류: {e}")
+                return
+
+            if not json_data.get('reviews'):
+                if checkpoint is not None:
+                    await self._write(checkpoint.mark_complete)
+                return
+
+            page_reviews = scraper.parse_reviews(json_data['reviews'])
+            next_cursor = json_data.get('cursor', '')
+            finished = not next_cursor or next_cursor == cursor
+            await self._write(scraper.commit_page, checkpoint, next_cursor, page_reviews, complete=finished)
+
+            yield page_reviews
+
+            if finished:
+                return
+            cursor = next_cursor
+
+    async def stream_all(self, games, num_pages=5, max_pending=8):
+        """
+        여러 게임의 리뷰 배치를 도착하는 순서대로 내보내는 비동기 제너레이터
+        소비 속도가 느리면 max_pending개의 배치가 쌓인 시점에서 스크래핑이 멈춥니다.
+        한 게임에서 예상하지 못한 오류가 나면 나머지 게임의 배치를 모두 내보낸 뒤 첫 오류를 다시 발생시킵니다
+        (scrape_all과 같이 일부만 수집된 결과가 정상 종료로 보이지 않도록).
+
+        Yields:
+            (게임 ID, 리뷰 레코드 리스트) 튜플
+        """
+        queue = asyncio.Queue(maxsize=max_pending)
+        done = object()
+        errors = []
+
+        async def _produce(game):
+            game_id = game[0] if isinstance(game, (tuple, list)) else game
+            cancelled = False
+            try:
+                async for batch in self.stream(game, num_pages):
+                    await queue.put((game_id, batch))
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            except Exception as e:
+                errors.append(e)
+            finally:
+                # 소비자가 중간에 멈춰 취소된 경우에는 읽는 쪽이 없으므로 종료 표시를 보내지 않음
+                # (가득 찬 큐에 넣으려고 기다리면 gather가 끝나지 않음)
+                if not cancelled:
+                    await queue.put(done)
+
+        tasks = [asyncio.create_task(_produce(game)) for game in games]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+            if errors:
+                raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect(self, game, num_pages):
+        reviews = []
+        async for batch in self.stream(game, num_pages):
+            reviews.extend(batch)
+        return reviews
+
+    async def scrape_all(self, games, num_pages=5):
+        """
+        여러 게임의 리뷰를 동시에 스크래핑
+
+        Args:
+            games: 게임 ID 또는 (게임 ID, 게임 이름) 튜플의 리스트
+            num_pages: 게임별 최대 페이지 수
+
+        Returns:
+            {게임 ID: 리뷰 레코드 리스트} 딕셔너리
+        """
+        game_ids = [game[0] if isinstance(game, (tuple, list)) else game for game in games]
+        results = await asyncio.gather(*(self._collect(game, num_pages) for game in games))
+        return dict(zip(game_ids, results))
+
+
+def scrape_games(games, num_pages=5, max_concurrency=16, requests_per_second=10.0, api_url=None,
+                 checkpoint_dir=None, seen_index=None, watermarks=None):
+    """
+    동기 코드에서 여러 게임을 동시에 스크래핑하는 편의 함수
+    checkpoint_dir 없이 seen_index를 넘기면 결과를 저장한 뒤 seen_index.save()를 호출하세요.
+
+    Returns:
+        {게임 ID: 리뷰 레코드 리스트} 딕셔너리
+    """
+    async def _run():
+        engine = AsyncScrapeEngine(max_concurrency, requests_per_second, api_url, checkpoint_dir,
+                                   seen_index, watermarks)
+        async with engine:
+            return await engine.scrape_all(games, num_pages)
+
+    results = asyncio.run(_run())
+    total = sum(len(reviews) for reviews in results.values())
+    print(f"{len(results)}개 게임에서 총 {total}개의 리뷰를 수집했습니다.")
+    return results
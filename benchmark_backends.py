@@ -0,0 +1,101 @@
+"""
+감정 분석 엔진 비교 스크립트 (VADER vs 해시 BoW 선형 모델)
+리뷰 파일(Parquet 또는 CSV)을 학습/평가용으로 나누어 선형 모델을 학습한 뒤, 평가용 리뷰에 대해
+처리 속도와 두 엔진의 일치도, 추천 여부(recommended) 예측 정확도를 출력합니다.
+
+실행:
+    python benchmark_backends.py [game_reviews.parquet]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from finalcode import SentimentAnalyzer, sentiment_labels
+from linear_sentiment import LinearSentimentModel
+from review_storage import DEFAULT_REVIEWS_FILE, load_reviews
+
+
+def _timed(func, repeat):
+    """func()를 repeat번 실행하여 가장 빠른 실행 시간과 결과를 반환"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_benchmark(csv_file=DEFAULT_REVIEWS_FILE, test_size=0.2, repeat=3, seed=0):
+    """
+    두 엔진의 속도와 일치도 비교
+
+    Args:
+        csv_file: review_text와 recommended 컬럼이 있는 리뷰 파일 (.parquet 또는 .csv)
+        test_size: 평가용으로 남길 리뷰 비율
+        repeat: 속도 측정 반복 횟수 (가장 빠른 값 사용)
+        seed: 학습/평가 분할 시드
+
+    Returns:
+        비교 결과 딕셔너리
+    """
+    df = load_reviews(csv_file, columns=['review_text', 'recommended'])
+    analyzer = SentimentAnalyzer()
+    cleaned = analyzer.clean_texts(df['review_text']).tolist()
+    recommended = df['recommended'].astype(bool).to_numpy()
+
+    order = np.random.default_rng(seed).permutation(len(df))
+    n_test = max(1, int(len(df) * test_size))
+    test_idx, train_idx = order[:n_test], order[n_test:]
+
+    model = LinearSentimentModel().fit([cleaned[i] for i in train_idx], recommended[train_idx])
+    analyzer.linear_model = model
+    test_texts = [cleaned[i] for i in test_idx]
+
+    vader_time, vader = _timed(lambda: analyzer.score_batch(test_texts, 'vader'), repeat)
+    linear_time, linear = _timed(lambda: analyzer.score_batch(test_texts, 'linear'), repeat)
+
+    vader_labels = np.asarray(sentiment_labels(vader['compound']))
+    linear_labels = np.asarray(sentiment_labels(linear['compound']))
+    actual = recommended[test_idx]
+    if np.std(vader['compound']) > 0 and np.std(linear['compound']) > 0:
+        correlation = float(np.corrcoef(vader['compound'], linear['compound'])[0, 1])
+    else:
+        correlation = float('nan')
+
+    return {
+        'train_reviews': len(train_idx),
+        'test_reviews': n_test,
+        'vader_per_second': n_test / vader_time if vader_time > 0 else float('inf'),
+        'linear_per_second': n_test / linear_time if linear_time > 0 else float('inf'),
+        'speedup': vader_time / linear_time if linear_time > 0 else float('inf'),
+        'label_agreement': float(np.mean(vader_labels == linear_labels)),
+        'compound_correlation': correlation,
+        'vader_accuracy': float(np.mean((vader['compound'] >= 0) == actual)),
+        'linear_accuracy': float(np.mean((linear['compound'] >= 0) == actual)),
+        'confusion': pd.crosstab(pd.Series(vader_labels, name='vader'), pd.Series(linear_labels, name='linear'))
+    }
+
+
+def print_report(result):
+    """비교 결과 출력"""
+    print("\n=== 감정 분석 엔진 비교 ===")
+    print(f"학습 리뷰 수: {result['train_reviews']}, 평가 리뷰 수: {result['test_reviews']}")
+    print("\n[처리 속도]")
+    print(f"VADER: {result['vader_per_second']:,.0f} 리뷰/초")
+    print(f"선형 모델: {result['linear_per_second']:,.0f} 리뷰/초 ({result['speedup']:.1f}배)")
+    print("\n[VADER와의 일치도]")
+    print(f"감정 레이블 일치율: {result['label_agreement'] * 100:.1f}%")
+    print(f"compound 점수 상관계수: {result['compound_correlation']:.3f}")
+    print("\n[추천 여부 예측 정확도 (compound >= 0 → 추천)]")
+    print(f"VADER: {result['vader_accuracy'] * 100:.1f}%")
+    print(f"선형 모델: {result['linear_accuracy'] * 100:.1f}%")
+    print("\n[레이블 교차표 (행: VADER, 열: 선형 모델)]")
+    print(result['confusion'])
+
+
+if __name__ == "__main__":
+    print_report(run_benchmark(*sys.argv[1:2]))
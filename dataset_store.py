@@ -0,0 +1,150 @@
+"""
+데이터셋 ID별로 여러 DataFrame을 보관하는 저장소
+전체 메모리 사용량이 예산을 넘으면 가장 오래 사용하지 않은 데이터셋을 디스크에 내려 두고 (LRU),
+다시 요청하면 디스크에서 불러옵니다. 데이터셋마다 디렉토리가 있어 시각화 이미지 등 결과 파일도 함께 보관합니다.
+"""
+
+import os
+import re
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+
+from review_storage import load_reviews, save_reviews
+
+# create()가 만드는 데이터셋 ID 형식 (경로로 사용하므로 이 형식만 허용)
+DATASET_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+
+
+class _Entry:
+    """메모리에 올라와 있는 데이터셋"""
+
+    def __init__(self, df, dirty):
+        self.df = df
+        self.nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        # 디스크에 저장된 내용과 다르면 True (내려 둘 때 다시 저장)
+        self.dirty = dirty
+
+
+class DatasetStore:
+    """메모리 예산이 있는 LRU 데이터셋 저장소 (초과분은 디스크로 내림)"""
+
+    # 컬럼 dtype(범주형 레이블 등)을 유지하는 압축 Parquet으로 저장
+    DATA_FILE = 'data.parquet'
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, directory='datasets'):
+        """
+        Args:
+            max_bytes: 메모리에 올려 둘 데이터셋의 총 크기 상한 (바이트, 가장 최근 데이터셋 하나는 항상 유지)
+            directory: 데이터셋별 디렉토리를 만들 상위 디렉토리
+        """
+        self.max_bytes = max_bytes
+        self.directory = os.path.abspath(directory)
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+        self.spills = 0
+        self.loads = 0
+
+    @staticmethod
+    def is_valid_id(dataset_id):
+        return isinstance(dataset_id, str) and DATASET_ID_RE.match(dataset_id) is not None
+
+    def dataset_dir(self, dataset_id):
+        """데이터셋의 결과 파일 디렉토리 (없으면 생성)"""
+        if not self.is_valid_id(dataset_id):
+            raise KeyError(f"잘못된 데이터셋 ID입니다: {dataset_id}")
+        path = os.path.join(self.directory, dataset_id)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _data_path(self, dataset_id):
+        return os.path.join(self.directory, dataset_id, self.DATA_FILE)
+
+    def create(self, df):
+        """새 데이터셋으로 저장하고 ID 반환"""
+        dataset_id = uuid.uuid4().hex
+        self.put(dataset_id, df)
+        return dataset_id
+
+    def put(self, dataset_id, df):
+        """데이터셋 저장 (같은 ID가 있으면 교체)"""
+        if not self.is_valid_id(dataset_id):
+            raise KeyError(f"잘못된 데이터셋 ID입니다: {dataset_id}")
+        with self._lock:
+            self._memory[dataset_id] = _Entry(df, dirty=True)
+            self._memory.move_to_end(dataset_id)
+            self._evict()
+
+    def get(self, dataset_id):
+        """데이터셋 반환 (메모리에 없으면 디스크에서 불러옴, 없거나 잘못된 ID면 None)"""
+        if not self.is_valid_id(dataset_id):
+            return None
+        with self._lock:
+            entry = self._memory.get(dataset_id)
+            if entry is not None:
+                self._memory.move_to_end(dataset_id)
+                return entry.df
+            path = self._data_path(dataset_id)
+            if not os.path.exists(path):
+                return None
+            df = load_reviews(path)
+            self.loads += 1
+            self._memory[dataset_id] = _Entry(df, dirty=False)
+            self._evict()
+            return df
+
+    def __contains__(self, dataset_id):
+        with self._lock:
+            return dataset_id in self._memory or (
+                self.is_valid_id(dataset_id) and os.path.exists(self._data_path(dataset_id))
+            )
+
+    def delete(self, dataset_id):
+        """데이터셋과 결과 파일 삭제 (있었으면 True)"""
+        if not self.is_valid_id(dataset_id):
+            return False
+        with self._lock:
+            existed = self._memory.pop(dataset_id, None) is not None
+            path = os.path.join(self.directory, dataset_id)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+                existed = True
+            return existed
+
+    def _spill(self, dataset_id, entry):
+        """데이터셋을 디스크에 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = os.path.join(self.dataset_dir(dataset_id), self.DATA_FILE)
+        root, ext = os.path.splitext(path)
+        tmp_path = root + '.tmp' + ext  # 확장자로 저장 형식을 고르므로 확장자 유지
+        save_reviews(entry.df, tmp_path)
+        os.replace(tmp_path, path)
+        entry.dirty = False
+        self.spills += 1
+
+    def _evict(self):
+        """메모리 예산을 넘는 동안 가장 오래 사용하지 않은 데이터셋을 디스크로 내림"""
+        total = sum(entry.nbytes for entry in self._memory.values())
+        while total > self.max_bytes and len(self._memory) > 1:
+            dataset_id, entry = self._memory.popitem(last=False)
+            if entry.dirty:
+                self._spill(dataset_id, entry)
+            total -= entry.nbytes
+
+    def flush(self):
+        """메모리에만 있는 변경 내용을 모두 디스크에 저장 (종료 시 호출)"""
+        with self._lock:
+            for dataset_id, entry in self._memory.items():
+                if entry.dirty:
+                    self._spill(dataset_id, entry)
+
+    def stats(self):
+        """저장소 상태"""
+        with self._lock:
+            return {
+                'in_memory': len(self._memory),
+                'memory_bytes': sum(entry.nbytes for entry in self._memory.values()),
+                'max_bytes': self.max_bytes,
+                'spills': self.spills,
+                'loads': self.loads
+            }
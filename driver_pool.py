@@ -0,0 +1,215 @@
+"""
+미리 시작해 둔 Chrome WebDriver를 여러 요청이 빌려 쓰는 풀
+Flask 요청마다 Chrome을 새로 띄우는 비용(수 초)을 없애기 위해 사용합니다.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from finalcode import create_driver
+
+
+class _PooledDriver:
+    """풀에서 관리하는 WebDriver와 사용 기록"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.last_used = time.monotonic()
+
+
+class WebDriverPool:
+    """크기가 제한된 WebDriver 풀 (상태 확인, 유휴 정리, N회 사용 후 재시작)"""
+
+    def __init__(self, max_size=2, warm_size=1, max_uses=50, idle_timeout=300, lean=True, factory=None):
+        """
+        Args:
+            max_size: 동시에 존재할 수 있는 최대 WebDriver 수
+            warm_size: 유휴 정리 후에도 항상 띄워 둘 WebDriver 수
+            max_uses: 이 횟수만큼 사용한 WebDriver는 종료하고 새로 시작 (메모리 누수 방지)
+            idle_timeout: 이 시간(초) 동안 사용하지 않은 WebDriver는 종료
+            lean: create_driver()에 전달할 lean 옵션
+            factory: WebDriver 생성 함수 (기본값: finalcode.create_driver)
+        """
+        self.max_size = max_size
+        self.warm_size = min(warm_size, max_size)
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.factory = factory or (lambda: create_driver(lean))
+        self._idle = deque()
+        self._borrowed = {}
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._janitor = threading.Thread(target=self._janitor_loop, daemon=True)
+        self._janitor.start()
+
+    def prestart(self):
+        """warm_size만큼 WebDriver를 미리 시작"""
+        while True:
+            with self._cond:
+                if self._closed or self._total >= self.warm_size:
+                    return
+                self._total += 1
+            try:
+                entry = _PooledDriver(self.factory())
+            except Exception:
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    @staticmethod
+    def _is_healthy(entry):
+        """WebDriver 세션이 살아 있는지 확인"""
+        try:
+            entry.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(entry):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self, timeout=None):
+        """
+        WebDriver를 빌려옴 (유휴 WebDriver가 없고 풀이 가득 차면 반납될 때까지 대기)
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            WebDriver
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while not self._idle and self._total >= self.max_size:
+                    if self._closed:
+                        raise RuntimeError("WebDriver 풀이 종료되었습니다.")
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("사용 가능한 WebDriver가 없습니다.")
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise RuntimeError("WebDriver 풀이 종료되었습니다.")
+                entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    self._total += 1
+
+            if entry is None:
+                try:
+                    entry = _PooledDriver(self.factory())
+                except Exception:
+                    with self._cond:
+                        self._total -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._is_healthy(entry):
+                # 죽은 세션은 버리고 다시 시도
+                self._discard(entry)
+                continue
+
+            entry.uses += 1
+            with self._cond:
+                self._borrowed[id(entry.driver)] = entry
+            return entry.driver
+
+    def release(self, driver, discard=False):
+        """
+        빌려온 WebDriver를 반납
+
+        Args:
+            driver: acquire()로 받은 WebDriver
+            discard: True면 풀에 돌려놓지 않고 종료 (오류가 난 세션 등)
+        """
+        with self._cond:
+            entry = self._borrowed.pop(id(driver), None)
+        if entry is None:
+            return
+        if discard or self._closed or entry.uses >= self.max_uses:
+            self._discard(entry)
+            return
+        entry.last_used = time.monotonic()
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    def _discard(self, entry):
+        self._quit(entry)
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """
+        with 문으로 WebDriver를 빌리고 반납
+        WebDriver/세션 오류가 나면 폐기하고, 작업 취소 등 그 외 예외는 세션이 멀쩡하므로 풀에 돌려놓습니다.
+        """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except WebDriverException:
+            self.release(driver, discard=True)
+            raise
+        finally:
+            # 이미 폐기했으면 아무것도 하지 않음
+            self.release(driver)
+
+    def evict_idle(self):
+        """idle_timeout을 넘긴 유휴 WebDriver 종료 (warm_size만큼은 유지)"""
+        now = time.monotonic()
+        expired = []
+        with self._cond:
+            keep = deque()
+            while self._idle:
+                entry = self._idle.popleft()
+                if now - entry.last_used > self.idle_timeout and self._total - len(expired) > self.warm_size:
+                    expired.append(entry)
+                else:
+                    keep.append(entry)
+            self._idle = keep
+        for entry in expired:
+            self._discard(entry)
+        return len(expired)
+
+    def _janitor_loop(self):
+        interval = max(1.0, self.idle_timeout / 2)
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed, timeout=interval)
+                if self._closed:
+                    return
+            self.evict_idle()
+
+    def stats(self):
+        """풀 상태 (전체/유휴/대여 중 WebDriver 수)"""
+        with self._cond:
+            return {
+                'total': self._total,
+                'idle': len(self._idle),
+                'in_use': len(self._borrowed),
+                'max_size': self.max_size
+            }
+
+    def close(self):
+        """모든 유휴 WebDriver 종료 (대여 중인 WebDriver는 반납 시 종료)"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for entry in idle:
+            self._discard(entry)
@@ -3,155 +3,661 @@ Steam Game Review Scraping and Sentiment Analysis
 This script scrapes Steam game reviews and performs sentiment analysis using NLTK and VADER.
 """
 
+import os
 import time
+import json
+import numpy as np
 import pandas as pd
 import re
-from datetime import datetime
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.sentiment import SentimentIntensityAnalyzer
-import ssl
+from nltk_resources import english_stopwords, vader_analyzer
+from vader_batch import BatchVader, SCORE_COLUMNS
+from linear_sentiment import LinearSentimentModel, DEFAULT_MODEL_PATH
+from rate_limiter import ThrottledError, TransientError, call_with_retry, get_shared_limiter
+from review_storage import DEFAULT_REVIEWS_FILE, ReviewWriter, iter_review_chunks, save_reviews
 import warnings
 warnings.filterwarnings('ignore')
 
-# SSL 인증서 검증 임시 비활성화 (NLTK 다운로드용)
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
-
-# NLTK 데이터 다운로드
-print("NLTK 데이터를 다운로드하는 중...")
-nltk.download('stopwords', quiet=True)
-nltk.download('punkt', quiet=True)
-nltk.download('punkt_tab', quiet=True)  # 최신 NLTK 버전용
-nltk.download('averaged_perceptron_tagger', quiet=True)
-nltk.download('vader_lexicon', quiet=True)
+# Steam 리뷰 JSON 엔드포인트
+STEAM_REVIEWS_API = "https://store.steampowered.com/appreviews/{game_id}"
+# 페이지당 요청하는 리뷰 수 (API 최대값)
+REVIEWS_PER_PAGE = 100
+# 아직 처리하지 않은 리뷰 노드의 필드를 한 번에 추출하고, 처리한 노드를 정리한 뒤 다음 스크롤까지 수행하는 스크립트
+# arguments[0]: 최대 추출 개수, arguments[1]: DOM에 남겨둘 처리 완료 노드 수
+EXTRACT_REVIEWS_JS = """
+const limit = arguments[0], keep = arguments[1];
+const out = [];
+for (const el of document.querySelectorAll('.app_review:not([data-scraped])')) {
+    if (out.length >= limit) break;
+    el.setAttribute('data-scraped', '1');
+    const content = el.querySelector('.app_review_content');
+    const hours = el.querySelector('.hours');
+    const date = el.querySelector('.date_posted');
+    // 같은 원문의 리뷰를 구분하기 위한 리뷰 ID(투표 버튼/본문 요소의 id)와 작성자 프로필 링크
+    const idNode = el.querySelector('[id^="RecommendationVoteUpBtn"], [id^="ReviewContent"]');
+    const idMatch = idNode ? idNode.id.match(/(\\d+)$/) : null;
+    const author = el.querySelector('a[href*="/profiles/"], a[href*="/id/"]');
+    let recommended = el.className.indexOf('Recommended') !== -1;
+    if (!recommended) {
+        for (const title of el.querySelectorAll('div[class*="title"]')) {
+            if (title.textContent.indexOf('Recommended') !== -1) { recommended = true; break; }
+        }
+    }
+    out.push({
+        text: content ? content.innerText : null,
+        recommended: recommended,
+        hours: hours ? hours.innerText : '',
+        date: date ? date.innerText : '',
+        id: idMatch ? idMatch[1] : null,
+        author: author ? author.href : null
+    });
+}
+const done = document.querySelectorAll('.app_review[data-scraped]');
+for (let i = 0; i < done.length - keep; i++) done[i].remove();
+window.scrollTo(0, document.body.scrollHeight);
+return {reviews: out, height: document.body.scrollHeight};
+"""
+# 스크롤 후 새 리뷰 노드가 생기거나 페이지 높이가 바뀌었는지 확인하는 스크립트
+# arguments[0]: 마지막으로 확인한 페이지 높이
+NEW_CONTENT_JS = """
+return document.querySelectorAll('.app_review:not([data-scraped])').length > 0
+    || document.body.scrollHeight !== arguments[0];
+"""
+# 텍스트만 읽으므로 이미지, 폰트, 스타일시트, 미디어 요청은 차단
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.css',
+    '*.mp4', '*.webm', '*.m3u8'
+]
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+# 확인된 ChromeDriver 경로를 저장하는 파일 (이후 실행은 네트워크 조회 없이 재사용)
+DRIVER_PATH_CACHE = '.chromedriver_path'
+
+# 리뷰 페이지에 표시되는 작성 날짜 형식 ('Posted: 3 March, 2023', 'Posted: March 3' 등)
+REVIEW_DATE_FORMATS = ('%d %B, %Y', '%B %d, %Y', '%d %b, %Y', '%b %d, %Y')
+# 올해 작성된 리뷰는 연도 없이 표시됨
+REVIEW_DATE_FORMATS_NO_YEAR = ('%d %B', '%B %d', '%d %b', '%b %d')
+ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+def parse_review_date(text, today=None):
+    """
+    리뷰 작성 날짜를 'YYYY-MM-DD'로 변환
+    
+    Args:
+        text: ISO 날짜 또는 리뷰 페이지의 날짜 문자열 ('Posted: 3 March' 등)
+        today: 연도가 없는 날짜의 기준일 (기본값: 오늘, 미래 날짜가 되면 작년으로 처리)
+        
+    Returns:
+        ISO 날짜 문자열 (해석할 수 없으면 None)
+    """
+    if text is None or pd.isna(text):
+        return None
+    text = re.sub(r'^(posted|updated)\s*:?\s*', '', str(text).strip(), flags=re.IGNORECASE).strip()
+    candidates = []
+    if ISO_DATE_RE.match(text):
+        candidates.append((text[:10], '%Y-%m-%d'))
+    candidates += [(text, fmt) for fmt in REVIEW_DATE_FORMATS]
+    for value, fmt in candidates:
+        try:
+            return datetime.strptime(value, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    
+    today = today or date.today()
+    for fmt in REVIEW_DATE_FORMATS_NO_YEAR:
+        # 2월 29일도 해석되도록 연도를 붙여서 파싱
+        for year in (today.year, today.year - 1):
+            try:
+                parsed = datetime.strptime(f"{text} {year}", f"{fmt} %Y").date()
+            except ValueError:
+                continue
+            if parsed <= today:
+                return parsed.isoformat()
+    return None
+
+def create_session(pool_size=10):
+    """keep-alive 연결 풀을 사용하는 requests 세션 생성"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept': 'application/json'
+    })
+    return session
+
+_driver_path = None
+
+def resolve_driver_path(cache_file=DRIVER_PATH_CACHE):
+    """
+    ChromeDriver 실행 파일 경로를 한 번만 확인하고 캐시
+    CHROMEDRIVER_PATH 환경 변수 → 캐시 파일 → webdriver-manager(네트워크 조회) 순서로 확인
+    """
+    global _driver_path
+    if _driver_path and os.path.exists(_driver_path):
+        return _driver_path
+    
+    path = os.environ.get('CHROMEDRIVER_PATH')
+    if not path and os.path.exists(cache_file):
+        with open(cache_file, encoding='utf-8') as f:
+            path = f.read().strip()
+    if not path or not os.path.exists(path):
+        path = ChromeDriverManager().install()
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            f.write(path)
+    
+    _driver_path = path
+    return path
+
+def create_driver(lean=True):
+    """
+    헤드리스 Chrome WebDriver 생성
+    
+    Args:
+        lean: True면 eager 페이지 로드 전략을 사용하고 이미지/폰트/CSS/미디어 요청을 차단
+    """
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # 백그라운드 실행
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+    if lean:
+        # DOMContentLoaded 시점에 반환 (이미지 등 하위 리소스 로드를 기다리지 않음)
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2
+        })
+    
+    service = Service(resolve_driver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    if lean:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+    return driver
 
 class SteamReviewScraper:
     """Steam 게임 리뷰를 스크래핑하는 클래스"""
     
-    def __init__(self, game_id, game_name="Counter Strike 2"):
+    def __init__(self, game_id, game_name="Counter Strike 2", api_url=None, seen_index=None, driver=None,
+                 rate_limiter=None, max_retries=4, progress=None):
         """
         Args:
             game_id: Steam 게임 ID
             game_name: 게임 이름 (기본값: Counter Strike 2)
+            api_url: 리뷰 JSON 엔드포인트 (기본값: Steam appreviews, 테스트용 스텁 서버 지정 가능)
+            seen_index: 이전 실행에서 수집한 리뷰를 건너뛰기 위한 scrape_state.SeenReviewIndex (선택,
+                체크포인트 없이 사용하면 리뷰를 저장한 뒤 save_seen() 호출)
+            driver: 외부(예: driver_pool.WebDriverPool)에서 빌려온 WebDriver (close() 시 종료하지 않음)
+            rate_limiter: rate_limiter.AdaptiveRateLimiter (기본값: 프로세스 전체에서 호스트별로 공유하는 제한기)
+            max_retries: 일시적 오류(429, 5xx, JSON 오류 등) 발생 시 페이지당 최대 재시도 횟수
+            progress: 진행 상황 콜백 - progress({'stage': 'scrape', 'done', 'total', 'unit', 'reviews'})
+                형태의 이벤트 딕셔너리로 호출 (선택)
         """
         self.game_id = game_id
         self.game_name = game_name
-        self.base_url = f"https://store.steampowered.com/appreviews/{game_id}?json=1"
+        self.api_url = api_url or STEAM_REVIEWS_API.format(game_id=game_id)
+        self.base_url = f"{self.api_url}?json=1"
         self.reviews = []
-        self.driver = None
+        self.driver = driver
+        self.owns_driver = False
+        self.session = None
+        self.seen_index = seen_index
+        self.skipped_reviews = 0
+        self.rate_limiter = rate_limiter or get_shared_limiter(urlparse(self.api_url).netloc)
+        self.max_retries = max_retries
+        self.retry_base_delay = 1.0
+        self.progress = progress
+        
+    def report_progress(self, done, total, unit, reviews):
+        """진행 상황 콜백이 있으면 스크래핑 진행 이벤트 전달"""
+        if self.progress is not None:
+            self.progress({'stage': 'scrape', 'done': done, 'total': total, 'unit': unit, 'reviews': reviews})
         
-    def setup_driver(self):
-        """Chrome WebDriver 설정"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')  # 백그라운드 실행
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+    def setup_driver(self, lean=True):
+        """
+        Chrome WebDriver 설정
+        
+        Args:
+            lean: True면 eager 페이지 로드 전략을 사용하고 이미지/폰트/CSS/미디어 요청을 차단
+        """
+        self.driver = create_driver(lean)
+        self.owns_driver = True
         print("Chrome WebDriver가 설정되었습니다.")
         
-    def scrape_reviews(self, num_pages=5, delay=2):
+    def wait_for_new_content(self, last_height, timeout):
+        """
+        스크롤 후 새 리뷰 노드가 추가되거나 페이지 높이가 바뀔 때까지 대기
+        
+        Args:
+            last_height: 마지막으로 확인한 페이지 높이
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            새 콘텐츠가 감지되면 True, 시간 초과면 False
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(NEW_CONTENT_JS, last_height)
+            )
+            return True
+        except TimeoutException:
+            return False
+        
+    def setup_session(self, pool_size=10):
+        """
+        keep-alive 연결 풀을 사용하는 HTTP 세션 설정 (Selenium 없이 JSON API 호출용)
+        
+        Args:
+            pool_size: 호스트별로 유지할 최대 연결 수
+        """
+        self.session = create_session(pool_size)
+        
+    @staticmethod
+    def parse_review(review):
+        """Steam API의 리뷰 객체를 리뷰 레코드(dict)로 변환"""
+        return {
+            'recommendationid': review.get('recommendationid'),
+            'review_text': review.get('review', ''),
+            'recommended': review.get('voted_up', False),
+            'playtime_at_review': review.get('author', {}).get('playtime_at_review', 0),
+            'date_posted': datetime.fromtimestamp(review.get('timestamp_created', 0)).strftime('%Y-%m-%d'),
+            'review_length': len(review.get('review', ''))
+        }
+        
+    def parse_reviews(self, raw_reviews):
+        """
+        한 페이지의 API 리뷰 목록을 레코드 리스트로 변환
+        seen_index가 설정되어 있으면 이미 수집한 리뷰는 레코드를 만들지 않고 건너뜀
+        (인덱스에 추가하는 것은 commit_page에서 페이지를 기록할 때)
+        """
+        if self.seen_index is None:
+            return [self.parse_review(review) for review in raw_reviews]
+        
+        records = []
+        page_ids = set()
+        for review in raw_reviews:
+            review_id = review.get('recommendationid')
+            if review_id is not None:
+                if review_id in page_ids or review_id in self.seen_index:
+                    self.skipped_reviews += 1
+                    continue
+                page_ids.add(review_id)
+            records.append(self.parse_review(review))
+        return records
+        
+    def commit_page(self, checkpoint, next_cursor, page_reviews, complete=False):
+        """
+        페이지 처리 결과를 체크포인트에 기록하고 리뷰 ID를 seen_index에 추가
+        인덱스 파일에는 리뷰가 체크포인트에 저장된 경우에만 바로 기록합니다. 체크포인트가 없으면 ID는 이번 실행의
+        중복 제거에만 쓰이고, 리뷰를 분석/저장한 뒤 save_seen()을 호출해야 다음 실행에서 건너뜁니다.
+        (저장 전에 실패한 리뷰가 다음 실행에서도 계속 건너뛰어져 누락되지 않도록)
+        """
+        if checkpoint is not None:
+            checkpoint.save_page(next_cursor, page_reviews, complete=complete)
+        if self.seen_index is not None:
+            for review in page_reviews:
+                if review.get('recommendationid') is not None:
+                    self.seen_index.add(review['recommendationid'])
+            if checkpoint is not None:
+                self.seen_index.save()
+        
+    def save_seen(self):
+        """수집한 리뷰 ID를 인덱스 파일에 기록 (체크포인트 없이 스크래핑했다면 리뷰를 저장한 뒤 호출)"""
+        if self.seen_index is not None:
+            self.seen_index.save()
+        
+    def fetch_page(self, cursor="*", timeout=30, review_filter='all'):
+        """
+        리뷰 JSON 엔드포인트에서 한 페이지를 가져옴
+        
+        Args:
+            cursor: Steam 페이지 cursor (첫 페이지는 "*")
+            timeout: 요청 타임아웃 (초)
+            review_filter: 'all' (유용성 순) 또는 'recent' (작성 시간 역순)
+            
+        Returns:
+            파싱된 JSON 응답 (dict)
+        """
+        if self.session is None:
+            self.setup_session()
+        params = {
+            'json': 1,
+            'cursor': cursor,
+            'num_per_page': REVIEWS_PER_PAGE,
+            'filter': review_filter,
+            'language': 'all',
+            'purchase_type': 'all'
+        }
+        response = self.session.get(self.api_url, params=params, timeout=timeout)
+        if response.status_code in (429, 503):
+            retry_after = response.headers.get('Retry-After')
+            raise ThrottledError(
+                f"HTTP {response.status_code}: 요청 속도 제한",
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+        response.raise_for_status()
+        # 응답 바이트를 바로 파싱 (텍스트 디코딩 단계 생략)
+        json_data = json.loads(response.content)
+        if json_data.get('success', 1) != 1:
+            raise TransientError(f"Steam API 오류 응답 (success={json_data.get('success')})")
+        return json_data
+        
+    def fetch_page_with_retry(self, cursor="*", review_filter='all'):
+        """공유 속도 제한기를 거쳐 페이지를 가져오고, 일시적 오류는 백오프 후 재시도"""
+        return call_with_retry(
+            lambda: self.fetch_page(cursor, review_filter=review_filter),
+            limiter=self.rate_limiter,
+            max_retries=self.max_retries,
+            base_delay=self.retry_base_delay
+        )
+        
+    def fetch_page_selenium(self, cursor="*", delay=2):
+        """
+        WebDriver로 리뷰 JSON 한 페이지를 열어 파싱 (fetch_page와 같은 오류 규칙)
+        
+        Args:
+            cursor: 페이지 cursor
+            delay: 응답 본문이 렌더링되기를 기다리는 최대 시간 (초)
+            
+        Raises:
+            TransientError: 본문에서 JSON을 찾지 못했거나 Steam이 오류 응답을 준 경우
+            json.JSONDecodeError: 응답 본문이 잘려 JSON으로 파싱할 수 없는 경우
+        """
+        url = f"{self.base_url}&cursor={cursor}&num_per_page={REVIEWS_PER_PAGE}&filter=all&language=all"
+        self.driver.get(url)
+        # 응답 본문이 렌더링될 때까지만 대기 (최대 delay초)
+        try:
+            WebDriverWait(self.driver, delay, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script("return document.body && document.body.innerText.length > 0")
+            )
+        except TimeoutException:
+            pass
+        
+        # 페이지 소스에서 JSON 데이터 찾기 (<pre>로 감싸지 않았으면 중괄호 범위를 직접 파싱)
+        page_source = self.driver.page_source
+        json_match = re.search(r'<pre[^>]*>(.*?)</pre>', page_source, re.DOTALL)
+        if json_match:
+            body = json_match.group(1)
+        else:
+            json_start = page_source.find('{')
+            json_end = page_source.rfind('}') + 1
+            if json_start == -1 or json_end <= json_start:
+                raise TransientError("응답에서 JSON 데이터를 찾을 수 없습니다.")
+            body = page_source[json_start:json_end]
+        json_data = json.loads(body)
+        if json_data.get('success', 1) != 1:
+            raise TransientError(f"Steam API 오류 응답 (success={json_data.get('success')})")
+        return json_data
+        
+    def resume_from(self, checkpoint):
+        """
+        체크포인트에 저장된 리뷰와 이어서 스크래핑할 위치를 반환
+        
+        Args:
+            checkpoint: scrape_state.ScrapeCheckpoint 객체 (None이면 처음부터)
+            
+        Returns:
+            (cursor, 완료된 페이지 수, 복원된 리뷰를 페이지 크기로 나누어 읽는 이터레이터) 튜플
+            (복원한 리뷰를 한 번에 메모리에 올리지 않음)
+        """
+        if checkpoint is None:
+            return "*", 0, iter(())
+        if checkpoint.pages:
+            print(f"체크포인트에서 재개: 페이지 {checkpoint.pages}까지 완료, "
+                  f"{checkpoint.state['review_count']}개 리뷰 복원")
+        return checkpoint.cursor, checkpoint.pages, checkpoint.iter_reviews(REVIEWS_PER_PAGE)
+        
+    def iter_reviews(self, num_pages=5, delay=0, checkpoint=None):
+        """
+        HTTP API에서 리뷰를 페이지 단위로 가져오며 바로 내보내는 제너레이터
+        self.reviews에 쌓지 않으므로 메모리 사용량은 한 페이지 분량으로 유지됩니다.
+        
+        Args:
+            num_pages: 스크래핑할 페이지 수
+            delay: 페이지 간 대기 시간 (초)
+            checkpoint: 페이지마다 진행 상태를 저장할 ScrapeCheckpoint (선택)
+            
+        Yields:
+            페이지별 리뷰 레코드 리스트 (체크포인트에서 복원한 리뷰는 페이지 크기로 나누어 먼저 전달)
+        """
+        cursor, page, saved_batches = self.resume_from(checkpoint)
+        collected = 0
+        for batch in saved_batches:
+            collected += len(batch)
+            yield batch
+        if checkpoint is not None and checkpoint.complete:
+            return
+        
+        while page < num_pages:
+            try:
+                json_data = self.fetch_page_with_retry(cursor)
+            except (requests.RequestException, ValueError, TransientError) as e:
+                print(f"페이지 {page + 1} 스크래핑 중 오류: {e}")
+                return
+            
+            if not json_data.get('reviews'):
+                print(f"페이지 {page + 1}에 리뷰가 없습니다.")
+                if checkpoint is not None:
+                    checkpoint.mark_complete()
+                return
+            
+            page_reviews = self.parse_reviews(json_data['reviews'])
+            page += 1
+            collected += len(page_reviews)
+            
+            # 다음 페이지를 위한 cursor 업데이트
+            next_cursor = json_data.get('cursor', '')
+            finished = not next_cursor or next_cursor == cursor
+            self.commit_page(checkpoint, next_cursor, page_reviews, complete=finished)
+            print(f"페이지 {page} 완료: {collected}개 리뷰 수집됨")
+            self.report_progress(page, num_pages, 'pages', collected)
+            yield page_reviews
+            if finished:
+                return
+            cursor = next_cursor
+            
+            if delay and page < num_pages:
+                time.sleep(delay)
+        
+    def scrape_reviews_http(self, num_pages=5, delay=0, checkpoint=None):
+        """
+        WebDriver 없이 HTTP 세션으로 리뷰 JSON API를 직접 호출하여 스크래핑
+        
+        Args:
+            num_pages: 스크래핑할 페이지 수
+            delay: 페이지 간 대기 시간 (초)
+            checkpoint: 페이지마다 진행 상태를 저장할 ScrapeCheckpoint (선택)
+        """
+        print(f"{self.game_name}의 리뷰를 HTTP API로 스크래핑하는 중...")
+        
+        for page_reviews in self.iter_reviews(num_pages, delay, checkpoint):
+            self.reviews.extend(page_reviews)
+        
+        print(f"총 {len(self.reviews)}개의 리뷰를 수집했습니다.")
+        if self.skipped_reviews:
+            print(f"이미 수집된 리뷰 {self.skipped_reviews}개를 건너뛰었습니다.")
+        
+    def parse_delta_page(self, raw_reviews, watermark):
+        """
+        최신순 페이지에서 워터마크보다 새로운 리뷰만 레코드로 변환
+        
+        Args:
+            raw_reviews: API 리뷰 목록 (작성 시간 역순)
+            watermark: 이전 실행에서 본 가장 최신 timestamp_created (없으면 None)
+            
+        Returns:
+            (레코드 리스트, 이 페이지에서 가장 최신 timestamp, 워터마크 도달 여부) 튜플
+        """
+        fresh = []
+        newest = None
+        reached = False
+        for review in raw_reviews:
+            created = review.get('timestamp_created', 0)
+            if watermark is not None and created <= watermark:
+                reached = True
+                break
+            newest = created if newest is None else max(newest, created)
+            fresh.append(review)
+        return self.parse_reviews(fresh), newest, reached
+        
+    def iter_new_reviews(self, watermarks, max_pages=20, delay=0):
+        """
+        마지막 실행 이후 새로 작성된 리뷰를 페이지 단위로 내보내는 제너레이터 (최신순 조회, 워터마크에서 중단)
+        워터마크는 끝까지 소비했을 때만 갱신됩니다. 기존 워터마크까지 따라잡지 못하면 갱신하지 않지만,
+        첫 실행(워터마크 없음)은 지킬 이전 구간이 없으므로 max_pages에서 멈춰도 가장 최신 시각을 저장합니다.
+        
+        Args:
+            watermarks: 게임별 최신 timestamp를 저장하는 scrape_state.DeltaWatermarks
+            max_pages: 최대 페이지 수 (첫 실행 시 전체 기록을 가져오지 않도록 제한)
+            delay: 페이지 간 대기 시간 (초)
+            
+        Yields:
+            페이지별 새 리뷰 레코드 리스트
+        """
+        watermark = watermarks.get(self.game_id)
+        cursor = "*"
+        newest = None
+        caught_up = False
+        collected = 0
+        
+        for page in range(max_pages):
+            try:
+                json_data = self.fetch_page_with_retry(cursor, review_filter='recent')
+            except (requests.RequestException, ValueError, TransientError) as e:
+                print(f"페이지 {page + 1} 스크래핑 중 오류: {e}")
+                break
+            
+            raw_reviews = json_data.get('reviews') or []
+            page_reviews, page_newest, reached = self.parse_delta_page(raw_reviews, watermark)
+            self.commit_page(None, None, page_reviews)
+            if page_newest is not None:
+                newest = page_newest if newest is None else max(newest, page_newest)
+            collected += len(page_reviews)
+            print(f"페이지 {page + 1} 완료: 새 리뷰 {collected}개")
+            self.report_progress(page + 1, max_pages, 'pages', collected)
+            if page_reviews:
+                yield page_reviews
+            
+            next_cursor = json_data.get('cursor', '')
+            if reached or not raw_reviews or not next_cursor or next_cursor == cursor:
+                caught_up = True
+                break
+            cursor = next_cursor
+            
+            if delay:
+                time.sleep(delay)
+        
+        # 워터마크까지 빈틈없이 따라잡았거나 첫 실행인 경우에만 워터마크를 앞당김
+        if newest is None:
+            return
+        if caught_up or watermark is None:
+            watermarks.update(self.game_id, newest)
+            watermarks.save()
+        else:
+            print(f"최대 페이지 수({max_pages})에 도달하여 워터마크를 갱신하지 않았습니다.")
+        
+    def scrape_reviews_delta(self, watermarks, max_pages=20, delay=0):
+        """
+        마지막 실행 이후 새로 작성된 리뷰만 스크래핑 (최신순 조회, 워터마크에서 중단)
+        
+        Args:
+            watermarks: 게임별 최신 timestamp를 저장하는 scrape_state.DeltaWatermarks
+            max_pages: 최대 페이지 수 (첫 실행 시 전체 기록을 가져오지 않도록 제한)
+            delay: 페이지 간 대기 시간 (초)
+        """
+        print(f"{self.game_name}의 새 리뷰를 스크래핑하는 중... (워터마크: {watermarks.get(self.game_id)})")
+        
+        for page_reviews in self.iter_new_reviews(watermarks, max_pages, delay):
+            self.reviews.extend(page_reviews)
+        
+        print(f"총 {len(self.reviews)}개의 새 리뷰를 수집했습니다.")
+        if self.skipped_reviews:
+            print(f"이미 수집된 리뷰 {self.skipped_reviews}개를 건너뛰었습니다.")
+        
+    def scrape_reviews(self, num_pages=5, delay=2, checkpoint=None):
         """
         Steam 리뷰 스크래핑
         
         Args:
             num_pages: 스크래핑할 페이지 수
             delay: 페이지 간 대기 시간 (초)
+            checkpoint: 페이지마다 진행 상태를 저장할 ScrapeCheckpoint (선택)
         """
+        cursor, page, saved_batches = self.resume_from(checkpoint)
+        for batch in saved_batches:
+            self.reviews.extend(batch)
+        if checkpoint is not None and checkpoint.complete:
+            print(f"총 {len(self.reviews)}개의 리뷰를 수집했습니다.")
+            return
+        
         if not self.driver:
             self.setup_driver()
             
         print(f"{self.game_name}의 리뷰를 스크래핑하는 중...")
         
-        cursor = "*"
-        page = 0
-        
         while page < num_pages:
             try:
-                url = f"{self.base_url}&cursor={cursor}&num_per_page=100&filter=all&language=all"
-                self.driver.get(url)
-                time.sleep(delay)
-                
-                # JSON 응답 파싱
-                page_source = self.driver.page_source
-                
-                # JSON 데이터 추출 (간단한 방법)
-                import json
-                try:
-                    # 페이지 소스에서 JSON 데이터 찾기
-                    json_match = re.search(r'<pre[^>]*>(.*?)</pre>', page_source, re.DOTALL)
-                    if json_match:
-                        json_data = json.loads(json_match.group(1))
-                    else:
-                        # 직접 JSON 파싱 시도
-                        json_start = page_source.find('{')
-                        json_end = page_source.rfind('}') + 1
-                        if json_start != -1 and json_end > json_start:
-                            json_data = json.loads(page_source[json_start:json_end])
-                        else:
-                            print(f"페이지 {page + 1}에서 JSON 데이터를 찾을 수 없습니다.")
-                            break
-                    
-                    if 'reviews' in json_data and json_data['reviews']:
-                        for review in json_data['reviews']:
-                            review_data = {
-                                'review_text': review.get('review', ''),
-                                'recommended': review.get('voted_up', False),
-                                'playtime_at_review': review.get('author', {}).get('playtime_at_review', 0),
-                                'date_posted': datetime.fromtimestamp(review.get('timestamp_created', 0)).strftime('%Y-%m-%d'),
-                                'review_length': len(review.get('review', ''))
-                            }
-                            self.reviews.append(review_data)
-                        
-                        # 다음 페이지를 위한 cursor 업데이트
-                        cursor = json_data.get('cursor', '')
-                        if not cursor or cursor == '*':
-                            break
-                            
-                        page += 1
-                        print(f"페이지 {page} 완료: {len(self.reviews)}개 리뷰 수집됨")
-                    else:
-                        print(f"페이지 {page + 1}에 리뷰가 없습니다.")
-                        break
-                        
-                except json.JSONDecodeError as e:
-                    print(f"JSON 파싱 오류: {e}")
-                    break
-                except Exception as e:
-                    print(f"오류 발생: {e}")
-                    break
-                    
-            except Exception as e:
+                json_data = call_with_retry(
+                    lambda: self.fetch_page_selenium(cursor, delay),
+                    limiter=self.rate_limiter,
+                    max_retries=self.max_retries,
+                    base_delay=self.retry_base_delay
+                )
+            except (WebDriverException, ValueError, TransientError) as e:
                 print(f"페이지 {page + 1} 스크래핑 중 오류: {e}")
                 break
+            
+            if not json_data.get('reviews'):
+                print(f"페이지 {page + 1}에 리뷰가 없습니다.")
+                if checkpoint is not None:
+                    checkpoint.mark_complete()
+                break
+            
+            page_reviews = self.parse_reviews(json_data['reviews'])
+            self.reviews.extend(page_reviews)
+            
+            # 다음 페이지를 위한 cursor 업데이트
+            next_cursor = json_data.get('cursor', '')
+            finished = not next_cursor or next_cursor == cursor
+            self.commit_page(checkpoint, next_cursor, page_reviews, complete=finished)
+            page += 1
+            print(f"페이지 {page} 완료: {len(self.reviews)}개 리뷰 수집됨")
+            self.report_progress(page, num_pages, 'pages', len(self.reviews))
+            if finished:
+                break
+            cursor = next_cursor
         
         print(f"총 {len(self.reviews)}개의 리뷰를 수집했습니다.")
+        if self.skipped_reviews:
+            print(f"이미 수집된 리뷰 {self.skipped_reviews}개를 건너뛰었습니다.")
         
-    def scrape_reviews_selenium(self, num_reviews=100, delay=2):
+    def scrape_reviews_selenium(self, num_reviews=100, delay=2, keep_nodes=20):
         """
         Selenium을 사용하여 Steam 리뷰 페이지에서 직접 스크래핑
         
         Args:
             num_reviews: 수집할 리뷰 수
-            delay: 페이지 스크롤 간 대기 시간
+            delay: 스크롤 후 새 리뷰가 로드되기를 기다리는 최대 시간 (초)
+            keep_nodes: 스크롤 위치 유지를 위해 DOM에 남겨둘 처리 완료 리뷰 노드 수
         """
         if not self.driver:
             self.setup_driver()
@@ -161,7 +667,6 @@ class SteamReviewScraper:
         # Steam 리뷰 페이지로 이동
         review_url = f"https://store.steampowered.com/app/{self.game_id}/#app_reviews_hash"
         self.driver.get(review_url)
-        time.sleep(3)
         
         # 페이지가 로드될 때까지 대기
         try:
@@ -174,70 +679,55 @@ class SteamReviewScraper:
         
         # 페이지 스크롤하여 더 많은 리뷰 로드
         scroll_pause_time = delay
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        last_height = self.driver.execute_script(
+            "window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;"
+        )
         
         while len(self.reviews) < num_reviews:
-            # 페이지 끝까지 스크롤
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause_time)
+            # 새 리뷰가 로드되는 즉시 진행 (고정 대기 없음)
+            self.wait_for_new_content(last_height, scroll_pause_time)
             
-            # 리뷰 요소 찾기
-            review_elements = self.driver.find_elements(By.CLASS_NAME, "app_review")
-            
-            for element in review_elements[len(self.reviews):]:
-                if len(self.reviews) >= num_reviews:
-                    break
-                    
-                try:
-                    # 리뷰 텍스트 추출
-                    review_text_elem = element.find_element(By.CLASS_NAME, "app_review_content")
-                    review_text = review_text_elem.text.strip()
-                    
-                    # 추천 여부 확인
-                    recommended = "Recommended" in element.get_attribute("class") or \
-                                 element.find_elements(By.XPATH, ".//div[contains(@class, 'title') and contains(text(), 'Recommended')]")
-                    
-                    # 플레이 시간 추출 시도
-                    playtime = 0
-                    try:
-                        playtime_elem = element.find_element(By.CLASS_NAME, "hours")
-                        playtime_text = playtime_elem.text
-                        playtime_match = re.search(r'(\d+\.?\d*)', playtime_text)
-                        if playtime_match:
-                            playtime = float(playtime_match.group(1))
-                    except:
-                        pass
-                    
-                    # 날짜 추출 시도
-                    date_posted = datetime.now().strftime('%Y-%m-%d')
-                    try:
-                        date_elem = element.find_element(By.CLASS_NAME, "date_posted")
-                        date_posted = date_elem.text.strip()
-                    except:
-                        pass
-                    
-                    review_data = {
-                        'review_text': review_text,
-                        'recommended': bool(recommended),
-                        'playtime_at_review': playtime,
-                        'date_posted': date_posted,
-                        'review_length': len(review_text)
-                    }
-                    
-                    self.reviews.append(review_data)
-                    
-                except Exception as e:
-                    continue
+            # 새 리뷰 필드 추출 + 처리한 노드 정리 + 다음 스크롤을 한 번의 스크립트 호출로 수행
+            result = self.driver.execute_script(
+                EXTRACT_REVIEWS_JS, num_reviews - len(self.reviews), keep_nodes
+            )
+            batch = result['reviews']
+            self.reviews.extend(
+                record for record in map(self.parse_dom_review, batch) if record is not None
+            )
+            self.report_progress(len(self.reviews), num_reviews, 'reviews', len(self.reviews))
             
             # 새로운 높이 확인
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            if not batch and result['height'] == last_height:
                 # 더 이상 새로운 콘텐츠가 없음
                 break
-            last_height = new_height
+            last_height = result['height']
         
         print(f"총 {len(self.reviews)}개의 리뷰를 수집했습니다.")
         
+    @staticmethod
+    def parse_dom_review(item):
+        """EXTRACT_REVIEWS_JS가 반환한 리뷰 필드를 리뷰 레코드(dict)로 변환"""
+        if item.get('text') is None:
+            return None
+        review_text = item['text'].strip()
+        
+        # 플레이 시간 추출 시도
+        playtime = 0
+        playtime_match = re.search(r'(\d+\.?\d*)', item.get('hours') or '')
+        if playtime_match:
+            playtime = float(playtime_match.group(1))
+        
+        return {
+            'review_text': review_text,
+            'recommended': bool(item.get('recommended')),
+            'playtime_at_review': playtime,
+            'date_posted': parse_review_date(item.get('date')),
+            'review_length': len(review_text),
+            'recommendationid': item.get('id'),
+            'author': item.get('author')
+        }
+        
     def to_dataframe(self):
         """수집한 리뷰를 pandas DataFrame으로 변환"""
         if not self.reviews:
@@ -246,69 +736,396 @@ class SteamReviewScraper:
         return pd.DataFrame(self.reviews)
     
     def close(self):
-        """WebDriver 종료"""
-        if self.driver:
+        """WebDriver 및 HTTP 세션 종료 (빌려온 WebDriver는 종료하지 않고 참조만 해제)"""
+        if self.driver and self.owns_driver:
             self.driver.quit()
             print("WebDriver가 종료되었습니다.")
+        self.driver = None
+        if self.session:
+            self.session.close()
+            self.session = None
+
+
+# 특수 문자 제거용 패턴 (알파벳과 공백만 유지)
+NON_ALPHA_RE = re.compile(r'[^a-zA-Z\s]')
+
+# 알파벳과 공백만 남은 텍스트에서 word_tokenize(Treebank)가 나누는 유일한 경우 (CONTRACTIONS2 중 아포스트로피가 없는 것)
+TREEBANK_SPLITS = {
+    'cannot': ('can', 'not'),
+    'gimme': ('gim', 'me'),
+    'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'),
+    'lemme': ('lem', 'me'),
+    'wanna': ('wan', 'na'),
+}
+
+
+# compound 점수에 따른 감정 레이블 (이 값 이상이면 긍정, 음수 값 이하면 부정)
+SENTIMENT_THRESHOLD = 0.05
+SENTIMENT_LABELS = ['positive', 'neutral', 'negative']
+
+
+def sentiment_labels(compound):
+    """
+    compound 점수 배열을 감정 레이블 범주형(Categorical)으로 변환
+    
+    Args:
+        compound: compound 점수 배열
+    """
+    compound = np.asarray(compound, dtype=np.float64)
+    codes = np.select([compound >= SENTIMENT_THRESHOLD, compound <= -SENTIMENT_THRESHOLD], [0, 2], default=1)
+    return pd.Categorical.from_codes(codes, categories=SENTIMENT_LABELS)
+
+
+class SentimentSummary:
+    """
+    감정 분석 결과의 요약 통계 누적기
+    청크별로 update()하여 전체 데이터를 메모리에 올리지 않고 통계를 계산합니다.
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.recommended = 0
+        self.compound_sum = 0.0
+        self.recommended_compound_sum = 0.0
+        self.not_recommended_compound_sum = 0.0
+        self.label_counts = dict.fromkeys(SENTIMENT_LABELS, 0)
+    
+    def update(self, df):
+        """analyze_dataframe 결과 (recommended, compound_score, sentiment_label 컬럼)를 누적"""
+        compound = df['compound_score'].to_numpy(dtype=np.float64)
+        recommended = df['recommended'].astype(bool).to_numpy()
+        self.total += len(df)
+        self.recommended += int(recommended.sum())
+        self.compound_sum += float(compound.sum())
+        self.recommended_compound_sum += float(compound[recommended].sum())
+        self.not_recommended_compound_sum += float(compound[~recommended].sum())
+        for label, count in df['sentiment_label'].value_counts().items():
+            self.label_counts[label] = self.label_counts.get(label, 0) + int(count)
+        return self
+    
+    @property
+    def not_recommended(self):
+        return self.total - self.recommended
+    
+    @staticmethod
+    def _mean(total, count):
+        return total / count if count else float('nan')
+    
+    def to_dict(self):
+        """요약 통계 딕셔너리"""
+        return {
+            'total_reviews': self.total,
+            'recommended': self.recommended,
+            'not_recommended': self.not_recommended,
+            'sentiment_distribution': dict(self.label_counts),
+            'avg_compound': self._mean(self.compound_sum, self.total),
+            'avg_compound_recommended': self._mean(self.recommended_compound_sum, self.recommended),
+            'avg_compound_not_recommended': self._mean(self.not_recommended_compound_sum, self.not_recommended)
+        }
+    
+    def print_report(self):
+        """기본 통계 출력"""
+        total = max(self.total, 1)
+        print("\n=== 감정 분석 결과 ===")
+        print(f"전체 리뷰 수: {self.total}")
+        print(f"추천 리뷰: {self.recommended} ({self.recommended/total*100:.1f}%)")
+        print(f"비추천 리뷰: {self.not_recommended} ({self.not_recommended/total*100:.1f}%)")
+        print(f"\n감정 분포:")
+        for label, count in self.label_counts.items():
+            print(f"{label}: {count}")
+        stats = self.to_dict()
+        print(f"\n평균 Compound Score: {stats['avg_compound']:.3f}")
+        print(f"추천 리뷰 평균 Score: {stats['avg_compound_recommended']:.3f}")
+        print(f"비추천 리뷰 평균 Score: {stats['avg_compound_not_recommended']:.3f}")
 
 
 class SentimentAnalyzer:
     """리뷰 텍스트에 대한 감정 분석 클래스"""
     
-    def __init__(self):
-        self.sia = SentimentIntensityAnalyzer()
-        self.stop_words = set(stopwords.words('english'))
+    # 선택할 수 있는 점수 계산 엔진
+    BACKENDS = ('vader', 'linear')
+    # 토큰 캐시가 이 크기를 넘으면 비움 (메모리 상한)
+    MAX_CACHED_TOKENS = 500000
+    
+    def __init__(self, cache=None, linear_model=None):
+        """
+        Args:
+            cache: 정리된 텍스트별 VADER 점수를 재사용할 sentiment_cache.SentimentCache (선택)
+            linear_model: 'linear' 엔진으로 사용할 LinearSentimentModel 또는 모델 파일 경로
+                (기본값: sentiment_model.npz, 처음 사용할 때 불러옴)
+        """
+        # NLTK 데이터는 로컬 경로에서 처음 사용할 때 한 번만 불러옴 (없으면 NLTKResourceError)
+        self.sia = vader_analyzer()
+        self.stop_words = english_stopwords()
+        self.cache = cache
+        self.linear_model = linear_model
+        self._backend_lock = threading.Lock()
+        # 사전과 규칙 표를 한 번만 준비한 일괄 VADER 엔진
+        self.vader = BatchVader.from_analyzer(self.sia)
+        # 토큰별 불용어 처리 결과 캐시 (토큰 -> 남길 문자열, 버릴 토큰은 '')
+        self._token_cache = {}
         
+    def _filter_token(self, token):
+        """토큰을 word_tokenize와 같이 나누고 불용어/짧은 단어를 제거한 결과"""
+        words = TREEBANK_SPLITS.get(token, (token,))
+        kept = ' '.join(word for word in words if word not in self.stop_words and len(word) > 2)
+        self._token_cache[token] = kept
+        return kept
+    
+    def _clean_stripped(self, text):
+        """소문자 변환과 특수 문자 제거가 끝난 텍스트의 토큰화 및 불용어 제거"""
+        cache = self._token_cache
+        if len(cache) > self.MAX_CACHED_TOKENS:
+            cache.clear()
+        parts = []
+        for token in text.split():
+            kept = cache.get(token)
+            if kept is None:
+                kept = self._filter_token(token)
+            if kept:
+                parts.append(kept)
+        return ' '.join(parts)
+    
     def clean_text(self, text):
         """텍스트 정리 및 전처리"""
         if not isinstance(text, str):
             return ""
         
-        # 소문자 변환
-        text = text.lower()
-        
-        # 특수 문자 제거 (알파벳과 공백만 유지)
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        
-        # 토큰화
-        tokens = word_tokenize(text)
+        # 소문자 변환, 특수 문자 제거 후 토큰화 및 불용어 제거
+        return self._clean_stripped(NON_ALPHA_RE.sub('', text.lower()))
+    
+    def clean_texts(self, texts):
+        """
+        여러 텍스트를 한 번에 정리 (clean_text와 같은 결과)
         
-        # 불용어 제거
-        tokens = [word for word in tokens if word not in self.stop_words and len(word) > 2]
+        Args:
+            texts: 텍스트 Series 또는 리스트 (문자열이 아닌 값은 빈 문자열로 처리)
         
-        return ' '.join(tokens)
+        Returns:
+            정리된 텍스트 Series (입력이 Series면 같은 인덱스 유지)
+        """
+        index = texts.index if isinstance(texts, pd.Series) else None
+        # 문자열 연산이 Python re 규칙을 따르도록 object dtype으로 처리
+        texts = pd.Series(texts, index=index, dtype=object)
+        is_text = texts.map(lambda x: isinstance(x, str)).astype(bool)
+        stripped = texts.where(is_text, '').str.lower().str.replace(NON_ALPHA_RE, '', regex=True)
+        return pd.Series([self._clean_stripped(text) for text in stripped], index=texts.index, dtype=object)
     
     def analyze_sentiment(self, text):
-        """VADER를 사용한 감정 분석"""
+        """VADER를 사용한 감정 분석 (캐시가 있으면 같은 텍스트의 점수를 재사용)"""
         if not isinstance(text, str) or not text.strip():
             return {'compound': 0.0, 'pos': 0.0, 'neu': 0.0, 'neg': 0.0}
         
+        if self.cache is not None:
+            scores = self.cache.get(text)
+            if scores is not None:
+                return scores
+        
         scores = self.sia.polarity_scores(text)
+        if self.cache is not None:
+            self.cache.put(text, scores)
         return scores
     
-    def analyze_dataframe(self, df):
-        """DataFrame의 모든 리뷰에 대해 감정 분석 수행"""
-        print("감정 분석을 수행하는 중...")
+    def get_backend(self, backend='vader'):
+        """
+        이름으로 점수 계산 엔진 반환
+        엔진은 score_batch(texts)로 {'compound', 'pos', 'neu', 'neg': 배열} 딕셔너리를 반환합니다.
+        """
+        if backend == 'vader':
+            return self.vader
+        if backend == 'linear':
+            # 여러 요청 스레드가 공유하는 경우에도 모델은 한 번만 불러옴
+            with self._backend_lock:
+                if not isinstance(self.linear_model, LinearSentimentModel):
+                    path = self.linear_model or DEFAULT_MODEL_PATH
+                    if not os.path.exists(path):
+                        raise FileNotFoundError(
+                            f"선형 감정 모델 파일이 없습니다: {path} (python linear_sentiment.py로 먼저 학습하세요)"
+                        )
+                    self.linear_model = LinearSentimentModel.load(path)
+                return self.linear_model
+        raise ValueError(f"알 수 없는 감정 분석 엔진입니다: {backend} ({', '.join(self.BACKENDS)} 중 선택)")
+    
+    def score_batch(self, texts, backend='vader'):
+        """
+        여러 텍스트의 점수를 NumPy 배열로 계산 (vader 엔진은 analyze_sentiment와 같은 값)
+        
+        Returns:
+            {'compound', 'pos', 'neu', 'neg': float64 배열} 딕셔너리
+        """
+        return self.get_backend(backend).score_batch(texts)
+    
+    def score_texts(self, texts, n_jobs=1, chunk_size=5000, backend='vader', on_chunk=None):
+        """
+        여러 텍스트의 감정 점수 계산
+        
+        Args:
+            texts: 텍스트 Series 또는 리스트
+            n_jobs: 사용할 프로세스 수 (1이면 현재 프로세스에서 처리, None 또는 -1이면 CPU 코어 수)
+            chunk_size: 프로세스에 한 번에 보낼 텍스트 수
+            backend: 점수 계산 엔진 ('vader' 또는 'linear')
+            on_chunk: chunk_size개 이하의 텍스트를 계산할 때마다 계산한 텍스트 수로 호출할 함수 (선택)
+                캐시에서 찾은 텍스트와 중복 텍스트는 호출 횟수에 포함되지 않음
+        
+        Returns:
+            {'compound', 'pos', 'neu', 'neg': float64 배열} 딕셔너리 (texts와 같은 순서)
+        """
+        if backend != 'vader':
+            # 선형 모델은 전체를 행렬-벡터 곱 한 번으로 처리하므로 프로세스 풀과 캐시를 사용하지 않음
+            return self.score_batch(list(texts), backend)
+        if n_jobs is None or n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        if self.cache is None:
+            return self._compute_scores(list(texts), n_jobs, chunk_size, on_chunk)
+        
+        # 중복 텍스트는 한 번만, 캐시에 없는 텍스트만 계산
+        texts = [text if isinstance(text, str) else '' for text in texts]
+        results = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = self.cache.get(text) if text.strip() else None
+            if cached is None:
+                missing.append(text)
+            else:
+                results[text] = tuple(cached[name] for name in SCORE_COLUMNS)
+        computed = self._compute_scores(missing, n_jobs, chunk_size, on_chunk)
+        for text, values in zip(missing, zip(*(computed[name].tolist() for name in SCORE_COLUMNS))):
+            results[text] = values
+            if text.strip():
+                self.cache.put(text, dict(zip(SCORE_COLUMNS, values)))
+        self.cache.flush()
+        scores = np.array([results[text] for text in texts], dtype=np.float64).reshape(-1, len(SCORE_COLUMNS))
+        return {name: scores[:, k] for k, name in enumerate(SCORE_COLUMNS)}
+    
+    def _compute_scores(self, texts, n_jobs, chunk_size, on_chunk=None):
+        """캐시 없이 점수 배열 계산 (n_jobs > 1이면 프로세스 풀 사용)"""
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        n_jobs = min(n_jobs, len(chunks))
+        if not chunks or (n_jobs <= 1 and on_chunk is None):
+            return self.score_batch(texts)
+        
+        parts = []
+        if n_jobs <= 1:
+            for chunk in chunks:
+                parts.append(self.score_batch(chunk))
+                on_chunk(len(chunk))
+        else:
+            # 각 프로세스는 시작할 때 VADER 사전을 한 번만 불러옴
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_score_worker) as executor:
+                for chunk, part in zip(chunks, executor.map(_score_chunk, chunks)):
+                    parts.append(part)
+                    if on_chunk is not None:
+                        on_chunk(len(chunk))
+        return {name: np.concatenate([part[name] for part in parts]) for name in SCORE_COLUMNS}
+    
+    def analyze_dataframe(self, df, n_jobs=1, chunk_size=5000, backend='vader', progress=None):
+        """
+        DataFrame의 모든 리뷰에 대해 감정 분석 수행
         
+        Args:
+            df: review_text 컬럼이 있는 DataFrame
+            n_jobs: 감정 점수 계산에 사용할 프로세스 수 (None 또는 -1이면 CPU 코어 수)
+            chunk_size: 프로세스에 한 번에 보낼 리뷰 수
+            backend: 점수 계산 엔진 ('vader' 또는 학습된 해시 BoW 선형 모델 'linear')
+            progress: 진행 상황 콜백 - 점수를 계산한 청크마다 progress({'stage': 'analyze', 'done', 'total',
+                'unit'})로, 끝나면 감정 분포(sentiment_distribution)를 더해 한 번 더 호출 (선택)
+        """
+        print("감정 분석을 수행하는 중...")
+        df = self._score_frame(df, n_jobs, chunk_size, backend, progress)
+        print("감정 분석이 완료되었습니다.")
+        return df
+    
+    def _score_frame(self, df, n_jobs, chunk_size, backend, progress=None):
+        """정리된 텍스트, 점수, 감정 레이블 컬럼 추가"""
         # 텍스트 정리
-        df['cleaned_text'] = df['review_text'].apply(self.clean_text)
+        df['cleaned_text'] = self.clean_texts(df['review_text'])
+        return self.add_scores(df, n_jobs, chunk_size, backend, progress)
+    
+    def add_scores(self, df, n_jobs=1, chunk_size=5000, backend='vader', progress=None):
+        """cleaned_text 컬럼이 있는 DataFrame에 점수와 감정 레이블 컬럼 추가 (progress는 analyze_dataframe과 같음)"""
+        total = len(df)
+        done = 0
         
-        # 감정 분석
-        sentiment_scores = df['cleaned_text'].apply(self.analyze_sentiment)
+        def on_chunk(count):
+            nonlocal done
+            done = min(done + count, total)
+            progress({'stage': 'analyze', 'done': done, 'total': total, 'unit': 'reviews'})
         
-        # 점수를 별도 컬럼으로 분리
-        df['compound_score'] = sentiment_scores.apply(lambda x: x['compound'])
-        df['positive_score'] = sentiment_scores.apply(lambda x: x['pos'])
-        df['neutral_score'] = sentiment_scores.apply(lambda x: x['neu'])
-        df['negative_score'] = sentiment_scores.apply(lambda x: x['neg'])
+        # 감정 분석 (점수 배열을 그대로 컬럼으로 사용)
+        scores = self.score_texts(df['cleaned_text'], n_jobs, chunk_size, backend,
+                                  on_chunk if progress is not None else None)
+        df['compound_score'] = scores['compound']
+        df['positive_score'] = scores['pos']
+        df['neutral_score'] = scores['neu']
+        df['negative_score'] = scores['neg']
         
         # 감정 레이블 추가
-        df['sentiment_label'] = df['compound_score'].apply(
-            lambda x: 'positive' if x >= 0.05 else ('negative' if x <= -0.05 else 'neutral')
-        )
+        df['sentiment_label'] = sentiment_labels(scores['compound'])
         
-        print("감정 분석이 완료되었습니다.")
+        if progress is not None:
+            progress({'stage': 'analyze', 'done': total, 'total': total, 'unit': 'reviews',
+                      'sentiment_distribution': {label: int(count) for label, count
+                                                 in df['sentiment_label'].value_counts().items()}})
         return df
+    
+    def analyze_file(self, input_file, output_file, rows_per_chunk=50000, n_jobs=1, chunk_size=5000,
+                     backend='vader'):
+        """
+        리뷰 파일(Parquet 또는 CSV)을 청크 단위로 읽어 감정 분석 결과를 출력 파일에 이어 쓰기
+        한 번에 rows_per_chunk개 리뷰만 메모리에 올리므로 메모리 사용량이 전체 크기와 무관하게 유지됩니다.
+        
+        Args:
+            input_file: review_text와 recommended 컬럼이 있는 리뷰 파일 (.parquet 또는 .csv)
+            output_file: 분석 결과 파일 (analyze_dataframe 결과와 같은 컬럼, 확장자로 형식 선택, 덮어씀)
+            rows_per_chunk: 한 번에 읽어 처리할 리뷰 수
+            n_jobs, chunk_size, backend: analyze_dataframe과 같음
+        
+        Returns:
+            전체 리뷰의 SentimentSummary
+        """
+        if os.path.abspath(input_file) == os.path.abspath(output_file):
+            raise ValueError("입력 파일과 출력 파일은 달라야 합니다.")
+        
+        summary = SentimentSummary()
+        print(f"'{input_file}'을 {rows_per_chunk}개 리뷰씩 감정 분석하는 중...")
+        with ReviewWriter(output_file) as writer:
+            for chunk in iter_review_chunks(input_file, rows_per_chunk):
+                chunk = self._score_frame(chunk, n_jobs, chunk_size, backend)
+                writer.write(chunk)
+                summary.update(chunk)
+                print(f"{summary.total}개 리뷰 처리 완료")
+        print(f"결과가 '{output_file}'에 저장되었습니다.")
+        return summary
+
+
+# 감정 점수 계산 작업자 프로세스의 분석기 (프로세스마다 한 번 생성)
+_worker_analyzer = None
+
+
+def _init_score_worker():
+    global _worker_analyzer
+    _worker_analyzer = SentimentAnalyzer()
+
+
+def _score_chunk(texts):
+    return _worker_analyzer.score_batch(texts)
+
+
+def analyze_file_main(input_file, output_file=None, rows_per_chunk=50000):
+    """
+    이미 수집한 리뷰 파일(Parquet 또는 CSV)을 청크 단위로 감정 분석 (대용량 데이터용)
+    
+    실행:
+        python finalcode.py <리뷰 파일> [결과 파일] [청크당 리뷰 수]
+    """
+    if output_file is None:
+        root, ext = os.path.splitext(input_file)
+        output_file = f"{root}_analyzed{ext or '.parquet'}"
+    analyzer = SentimentAnalyzer()
+    summary = analyzer.analyze_file(input_file, output_file, int(rows_per_chunk))
+    summary.print_report()
+    return summary
 
 
 def main():
@@ -326,11 +1143,13 @@ def main():
         print("\n=== Steam 리뷰 스크래핑 시작 ===\n")
         
         # 실제 스크래핑 시도
+        sample = False
         try:
             scraper.scrape_reviews_selenium(num_reviews=50, delay=2)
         except Exception as e:
             print(f"스크래핑 중 오류 발생: {e}")
             print("샘플 데이터를 생성합니다...")
+            sample = True
             # 샘플 데이터 생성
             sample_reviews = [
                 {
@@ -384,20 +1203,22 @@ def main():
             df = analyzer.analyze_dataframe(df)
             
             # 결과 저장
-            output_file = 'game_reviews.csv'
-            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            output_file = DEFAULT_REVIEWS_FILE
+            save_reviews(df, output_file)
             print(f"\n결과가 '{output_file}'에 저장되었습니다.")
             
+            # 실제 수집한 리뷰는 리뷰 저장소에 누적 (샘플 데이터는 저장하지 않음)
+            if not sample:
+                from review_db import ReviewDatabase
+                review_db = ReviewDatabase()
+                try:
+                    count = review_db.upsert(df, game_id=game_id, game_name=game_name)
+                finally:
+                    review_db.close()
+                print(f"{count}개 리뷰를 리뷰 저장소 '{review_db.path}'에 저장했습니다.")
+            
             # 기본 통계 출력
-            print("\n=== 감정 분석 결과 ===")
-            print(f"전체 리뷰 수: {len(df)}")
-            print(f"추천 리뷰: {df['recommended'].sum()} ({df['recommended'].sum()/len(df)*100:.1f}%)")
-            print(f"비추천 리뷰: {(~df['recommended']).sum()} ({(~df['recommended']).sum()/len(df)*100:.1f}%)")
-            print(f"\n감정 분포:")
-            print(df['sentiment_label'].value_counts())
-            print(f"\n평균 Compound Score: {df['compound_score'].mean():.3f}")
-            print(f"추천 리뷰 평균 Score: {df[df['recommended']]['compound_score'].mean():.3f}")
-            print(f"비추천 리뷰 평균 Score: {df[~df['recommended']]['compound_score'].mean():.3f}")
+            SentimentSummary().update(df).print_report()
             
         else:
             print("수집된 데이터가 없습니다.")
@@ -408,5 +1229,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        analyze_file_main(*sys.argv[1:4])
+    else:
+        main()
 
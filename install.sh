@@ -28,7 +28,7 @@ fi
 echo ""
 
 echo "[4/4] NLTK 데이터 다운로드 중..."
-python3 -c "import nltk; import ssl; ssl._create_default_https_context = ssl._create_unverified_context; nltk.download('stopwords', quiet=True); nltk.download('punkt', quiet=True); nltk.download('punkt_tab', quiet=True); nltk.download('vader_lexicon', quiet=True); nltk.download('averaged_perceptron_tagger', quiet=True); print('NLTK 데이터 다운로드 완료!')"
+python3 setup_nltk.py
 if [ $? -ne 0 ]; then
     echo "[경고] NLTK 데이터 다운로드 중 오류가 발생했습니다."
     echo "수동으로 다운로드할 수 있습니다."
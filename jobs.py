@@ -0,0 +1,228 @@
+"""
+웹 요청과 분리하여 오래 걸리는 작업(스크래핑, 감정 분석, 시각화)을 실행하는 작업 관리자
+작업을 등록하면 바로 작업 ID를 돌려주고, 크기가 제한된 스레드 풀에서 실행합니다.
+여러 단계(예: 스크래핑 → 분석 → 시각화)를 하나의 작업으로 묶어 순서대로 실행할 수 있습니다.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """작업이 취소 요청을 받아 중단된 경우"""
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 너무 많아 새 작업을 받을 수 없는 경우"""
+
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class Job:
+    """
+    작업 하나의 상태
+    단계 함수는 step(job, params)로 호출되며, 반환값은 result[단계 이름]에 저장됩니다.
+    진행 상황은 job.emit(이벤트 딕셔너리)로 기록하고, 순번(seq)이 붙은 이벤트를 events_after()로 읽습니다.
+    """
+
+    # 보관할 최근 이벤트 수 (오래된 이벤트부터 버림)
+    MAX_EVENTS = 1000
+
+    def __init__(self, steps, params=None):
+        """
+        Args:
+            steps: (단계 이름, 함수) 리스트 (순서대로 실행)
+            params: 모든 단계에 전달할 매개변수 딕셔너리
+        """
+        self.id = uuid.uuid4().hex
+        self.steps = list(steps)
+        self.params = dict(params or {})
+        self.status = QUEUED
+        self.current_step = None
+        self.result = {}
+        self.error = None
+        self.created_at = _now()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self.progress = None
+        self._cancel_event = threading.Event()
+        self._events = deque(maxlen=self.MAX_EVENTS)
+        self._next_seq = 1
+        self._events_cond = threading.Condition()
+
+    @property
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def emit(self, event, kind='progress'):
+        """
+        이벤트 기록 (종류: progress, step, result, status)
+        진행 이벤트는 마지막 진행 상황(progress)으로도 보관됩니다.
+        """
+        with self._events_cond:
+            event = {'seq': self._next_seq, 'type': kind, 'step': self.current_step, **event}
+            self._next_seq += 1
+            self._events.append(event)
+            if kind == 'progress':
+                self.progress = event
+            self._events_cond.notify_all()
+        return event
+
+    def report(self, event):
+        """진행 이벤트를 기록하고 취소 요청 확인 (스크래퍼/분석기/시각화의 progress 콜백으로 사용)"""
+        self.emit(event)
+        self.check_cancelled()
+
+    def events_after(self, seq=0, timeout=None):
+        """
+        seq보다 뒤에 기록된 이벤트 리스트
+        새 이벤트가 없고 작업이 끝나지 않았으면 timeout초까지 기다림 (None이면 기다리지 않음)
+        """
+        with self._events_cond:
+            if timeout is not None and self.status not in FINISHED_STATES and \
+                    (not self._events or self._events[-1]['seq'] <= seq):
+                self._events_cond.wait(timeout)
+            return [event for event in self._events if event['seq'] > seq]
+
+    def _set_status(self, status):
+        self.status = status
+        if status in FINISHED_STATES:
+            self.finished_at = _now()
+        self.emit({'status': status, 'error': self.error}, kind='status')
+
+    def check_cancelled(self):
+        """취소 요청을 받았으면 JobCancelled 발생 (단계 함수가 중간중간 호출)"""
+        if self._cancel_event.is_set():
+            raise JobCancelled(f"작업 {self.id}이 취소되었습니다.")
+
+    def run(self):
+        """모든 단계를 순서대로 실행 (작업 스레드에서 호출)"""
+        if self.status != QUEUED:
+            return
+        self.started_at = _now()
+        self._set_status(RUNNING)
+        try:
+            for name, step in self.steps:
+                self.check_cancelled()
+                self.current_step = name
+                self.emit({}, kind='step')
+                self.result[name] = step(self, self.params)
+                self.emit({'result': self.result[name]}, kind='result')
+            self.current_step = None
+            self._set_status(SUCCEEDED)
+        except JobCancelled:
+            self._set_status(CANCELLED)
+        except Exception as e:
+            self.error = str(e)
+            self._set_status(FAILED)
+
+    def to_dict(self):
+        """API 응답용 상태 딕셔너리"""
+        return {
+            'job_id': self.id,
+            'steps': [name for name, _ in self.steps],
+            'status': self.status,
+            'current_step': self.current_step,
+            'progress': self.progress,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class JobManager:
+    """크기가 제한된 스레드 풀에서 작업을 실행하고 상태를 보관하는 관리자"""
+
+    def __init__(self, max_workers=2, max_pending=16, max_history=100):
+        """
+        Args:
+            max_workers: 동시에 실행할 최대 작업 수
+            max_pending: 대기 + 실행 중인 작업 수 상한 (넘으면 JobQueueFull)
+            max_history: 상태를 보관할 완료된 작업 수 (오래된 것부터 삭제)
+        """
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _active_count(self):
+        return sum(1 for job in self._jobs.values() if job.status not in FINISHED_STATES)
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATES]
+        for job_id in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job_id]
+
+    def submit(self, steps, params=None):
+        """
+        작업 등록 (바로 반환)
+
+        Args:
+            steps: (단계 이름, 함수) 리스트 - 함수는 step(job, params)로 호출
+            params: 단계 함수에 전달할 매개변수 딕셔너리
+
+        Returns:
+            등록된 Job
+
+        Raises:
+            JobQueueFull: 대기 + 실행 중인 작업이 max_pending개 이상인 경우
+        """
+        job = Job(steps, params)
+        with self._lock:
+            if self._active_count() >= self.max_pending:
+                raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 (최대 {self.max_pending}개). 잠시 후 다시 시도하세요.")
+            self._prune()
+            self._jobs[job.id] = job
+            job.future = self._executor.submit(job.run)
+        return job
+
+    def get(self, job_id):
+        """작업 ID로 Job 조회 (없으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self):
+        """보관 중인 작업 목록 (등록 순)"""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id):
+        """
+        작업 취소 요청
+        대기 중인 작업은 바로 취소되고, 실행 중인 작업은 다음 단계 전이나 단계 함수가
+        check_cancelled()를 호출할 때 중단됩니다.
+
+        Returns:
+            Job (없으면 None)
+        """
+        job = self.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return job
+        job._cancel_event.set()
+        if job.future.cancel():
+            job._set_status(CANCELLED)
+        return job
+
+    def shutdown(self, wait=False):
+        """대기 중인 작업을 취소하고 풀 종료"""
+        for job in self.list():
+            if job.status not in FINISHED_STATES:
+                self.cancel(job.id)
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,207 @@
+"""
+해시 BoW(bag-of-words) 선형 감정 모델 (NumPy만 사용)
+리뷰의 추천 여부(recommended)로 학습한 로지스틱 회귀로, 대량 리뷰를 희소 행렬-벡터 곱 한 번으로 점수화합니다.
+
+학습:
+    python linear_sentiment.py [game_reviews.parquet] [sentiment_model.npz]
+"""
+
+import itertools
+import sys
+import zlib
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MODEL_PATH = 'sentiment_model.npz'
+
+
+class HashedFeatures:
+    """정리된 텍스트를 해시된 유니그램/바이그램 특징의 희소 행렬(COO)로 변환"""
+
+    # 토큰 해시 캐시가 이 크기를 넘으면 비움 (메모리 상한)
+    MAX_CACHED_TOKENS = 500000
+
+    def __init__(self, n_features=2 ** 18, bigrams=True):
+        """
+        Args:
+            n_features: 해시 공간 크기
+            bigrams: 인접한 두 단어도 특징으로 사용할지 여부
+        """
+        self.n_features = n_features
+        self.bigrams = bigrams
+        self._buckets = {}
+
+    def _hash(self, token):
+        # 프로세스마다 달라지는 hash() 대신 crc32 사용 (저장한 모델을 다른 프로세스에서도 사용)
+        bucket = self._buckets.get(token)
+        if bucket is None:
+            bucket = self._buckets[token] = zlib.crc32(token.encode('utf-8'))
+        return bucket
+
+    def transform(self, texts):
+        """
+        Args:
+            texts: 정리된 텍스트 리스트 (문자열이 아닌 값은 빈 텍스트로 처리)
+
+        Returns:
+            (rows, cols, data, lengths): 희소 행렬의 행/열/값 배열과 텍스트별 특징 수
+            행마다 값은 1/sqrt(특징 수)
+        """
+        split = [text.split() if isinstance(text, str) else [] for text in texts]
+        n_tokens = np.fromiter(map(len, split), dtype=np.int64, count=len(split))
+        doc_ids = np.repeat(np.arange(len(split)), n_tokens)
+
+        # 고유 토큰만 해시한 뒤 전체 토큰에 펼침
+        if len(self._buckets) > self.MAX_CACHED_TOKENS:
+            self._buckets.clear()
+        codes, uniques = pd.factorize(np.fromiter(itertools.chain.from_iterable(split), dtype=object,
+                                                  count=int(n_tokens.sum())))
+        hashes = np.fromiter((self._hash(token) for token in uniques), dtype=np.int64,
+                             count=len(uniques))[codes]
+
+        rows = [doc_ids]
+        cols = [hashes % self.n_features]
+        if self.bigrams and len(hashes) > 1:
+            same_doc = doc_ids[:-1] == doc_ids[1:]
+            rows.append(doc_ids[:-1][same_doc])
+            cols.append((hashes[:-1][same_doc] * 1000003 + hashes[1:][same_doc]) % self.n_features)
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+
+        lengths = np.bincount(rows, minlength=len(split))
+        scale = 1.0 / np.sqrt(np.maximum(lengths, 1))
+        return rows, cols, scale[rows], lengths
+
+
+def _sparse_dot(rows, cols, data, weights, n_rows):
+    """희소 행렬과 가중치 벡터의 곱"""
+    return np.bincount(rows, weights=data * weights[cols], minlength=n_rows)
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -35, 35)))
+
+
+class LinearSentimentModel:
+    """추천 여부로 학습한 해시 BoW 로지스틱 회귀 감정 모델"""
+
+    def __init__(self, n_features=2 ** 18, bigrams=True):
+        self.features = HashedFeatures(n_features, bigrams)
+        self.weights = np.zeros(n_features, dtype=np.float64)
+        self.bias = 0.0
+
+    def fit(self, texts, labels, epochs=5, batch_size=256, learning_rate=0.5, l2=1e-6, seed=0):
+        """
+        미니배치 Adagrad로 로지스틱 회귀 학습
+
+        Args:
+            texts: 정리된 리뷰 텍스트 리스트
+            labels: 추천 여부 (True/1 = 긍정)
+            epochs: 전체 데이터 반복 횟수
+            batch_size: 미니배치 크기
+            learning_rate: Adagrad 학습률
+            l2: L2 정규화 계수
+            seed: 셔플 시드
+        """
+        rows, cols, data, lengths = self.features.transform(texts)
+        y = np.asarray(labels, dtype=np.float64)
+        n_docs = len(y)
+        n_features = self.features.n_features
+        # 미니배치 행을 빠르게 꺼내기 위해 행 순서로 정렬 (CSR)
+        order = np.argsort(rows, kind='stable')
+        indices, data = cols[order], data[order]
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        grad_sq = np.full(n_features, 1e-8)
+        bias_sq = 1e-8
+        rng = np.random.default_rng(seed)
+
+        for _ in range(epochs):
+            order = rng.permutation(n_docs)
+            for start in range(0, n_docs, batch_size):
+                docs = order[start:start + batch_size]
+                # 미니배치 행만 모은 CSR
+                starts = indptr[docs]
+                counts = indptr[docs + 1] - starts
+                offsets = np.cumsum(counts) - counts
+                positions = np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+                rows = np.repeat(np.arange(len(docs)), counts)
+                cols = indices[positions]
+                values = data[positions]
+
+                z = np.bincount(rows, weights=values * self.weights[cols], minlength=len(docs)) + self.bias
+                residual = (_sigmoid(z) - y[docs]) / len(docs)
+
+                grad = np.bincount(cols, weights=values * residual[rows], minlength=n_features)
+                touched = np.unique(cols)
+                grad = grad[touched] + l2 * self.weights[touched]
+                grad_sq[touched] += grad * grad
+                self.weights[touched] -= learning_rate * grad / np.sqrt(grad_sq[touched])
+
+                bias_grad = residual.sum()
+                bias_sq += bias_grad * bias_grad
+                self.bias -= learning_rate * bias_grad / np.sqrt(bias_sq)
+        return self
+
+    def predict_proba(self, texts):
+        """긍정(추천) 확률 배열"""
+        rows, cols, data, _ = self.features.transform(texts)
+        return _sigmoid(_sparse_dot(rows, cols, data, self.weights, len(texts)) + self.bias)
+
+    def score_batch(self, texts):
+        """
+        VADER 엔진과 같은 형태의 점수 배열
+        compound = 2p - 1 (p: 긍정 확률), pos/neg는 compound의 양/음 부분, neu = 1 - |compound|
+        단어가 없는 텍스트는 모두 0
+
+        Returns:
+            {'compound', 'pos', 'neu', 'neg': float64 배열} 딕셔너리
+        """
+        texts = list(texts)
+        rows, cols, data, lengths = self.features.transform(texts)
+        proba = _sigmoid(_sparse_dot(rows, cols, data, self.weights, len(texts)) + self.bias)
+        # 단어가 없는 텍스트는 VADER와 같이 0점
+        has_words = lengths > 0
+        compound = np.where(has_words, 2.0 * proba - 1.0, 0.0)
+        return {
+            'compound': compound,
+            'pos': np.clip(compound, 0.0, None),
+            'neu': np.where(has_words, 1.0 - np.abs(compound), 0.0),
+            'neg': np.clip(-compound, 0.0, None)
+        }
+
+    def save(self, path=DEFAULT_MODEL_PATH):
+        """가중치를 .npz 파일로 저장"""
+        np.savez_compressed(path, weights=self.weights, bias=self.bias,
+                            bigrams=self.features.bigrams)
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL_PATH):
+        """save()로 저장한 모델 불러오기"""
+        with np.load(path) as saved:
+            model = cls(len(saved['weights']), bool(saved['bigrams']))
+            model.weights = saved['weights'].astype(np.float64)
+            model.bias = float(saved['bias'])
+        return model
+
+
+def train_from_csv(csv_file='game_reviews.parquet', model_path=DEFAULT_MODEL_PATH, **fit_kwargs):
+    """
+    review_text와 recommended 컬럼이 있는 리뷰 파일(Parquet 또는 CSV)로 모델을 학습하고 저장
+
+    Returns:
+        학습된 LinearSentimentModel
+    """
+    from finalcode import SentimentAnalyzer
+    from review_storage import load_reviews
+
+    df = load_reviews(csv_file, columns=['review_text', 'recommended'])
+    cleaned = SentimentAnalyzer().clean_texts(df['review_text'])
+    model = LinearSentimentModel().fit(cleaned.tolist(), df['recommended'].astype(bool), **fit_kwargs)
+    model.save(model_path)
+    print(f"{len(df)}개 리뷰로 학습한 모델을 '{model_path}'에 저장했습니다.")
+    return model
+
+
+if __name__ == "__main__":
+    train_from_csv(*sys.argv[1:3])
@@ -0,0 +1,106 @@
+"""
+NLTK 데이터 관리 모듈
+- 로컬 NLTK 데이터 경로만 확인하며 (네트워크 사용 없음), 필요한 데이터는 처음 사용할 때 프로세스당 한 번만 불러옵니다.
+- 데이터가 없으면 기다리지 않고 바로 NLTKResourceError를 발생시킵니다.
+- 설치는 'python setup_nltk.py'로 한 번만 수행합니다 (download()).
+"""
+
+import threading
+
+# SentimentAnalyzer가 사용하는 NLTK 데이터 {이름: nltk.data 경로}
+REQUIRED_RESOURCES = {
+    'stopwords': 'corpora/stopwords',
+    'vader_lexicon': 'sentiment/vader_lexicon.zip',
+}
+
+PROVISION_COMMAND = 'python setup_nltk.py'
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+class NLTKResourceError(LookupError):
+    """필요한 NLTK 데이터가 로컬에 없는 경우"""
+
+
+def missing_resources(names=None, paths=None):
+    """
+    로컬에 없는 NLTK 데이터 이름 리스트
+
+    Args:
+        names: 확인할 데이터 이름 (기본값: REQUIRED_RESOURCES 전체)
+        paths: 검색할 디렉토리 리스트 (기본값: nltk.data.path)
+    """
+    import nltk
+
+    missing = []
+    for name in names or REQUIRED_RESOURCES:
+        try:
+            nltk.data.find(REQUIRED_RESOURCES[name], paths=paths)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+
+def require(names=None, paths=None):
+    """필요한 NLTK 데이터가 모두 있는지 확인하고, 없으면 NLTKResourceError 발생"""
+    missing = missing_resources(names, paths)
+    if missing:
+        import nltk
+
+        searched = paths if paths is not None else nltk.data.path
+        raise NLTKResourceError(
+            f"NLTK 데이터가 없습니다: {', '.join(missing)}. "
+            f"네트워크가 되는 환경에서 '{PROVISION_COMMAND}'를 한 번 실행하거나, "
+            f"NLTK_DATA 환경 변수로 데이터 경로를 지정하세요. (검색한 경로: {', '.join(searched)})"
+        )
+
+
+def _load_once(key, loader):
+    with _lock:
+        if key not in _loaded:
+            _loaded[key] = loader()
+        return _loaded[key]
+
+
+def english_stopwords():
+    """영어 불용어 집합 (프로세스당 한 번 로드)"""
+    def _load():
+        require(['stopwords'])
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+
+    return _load_once('stopwords', _load)
+
+
+def vader_analyzer():
+    """VADER 사전을 불러온 SentimentIntensityAnalyzer (프로세스당 한 번 로드, 읽기 전용으로 공유)"""
+    def _load():
+        require(['vader_lexicon'])
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        return SentimentIntensityAnalyzer()
+
+    return _load_once('vader_lexicon', _load)
+
+
+def download(names=None, download_dir=None):
+    """
+    NLTK 데이터를 내려받음 (일회성 설치용, 이미 있으면 건너뜀)
+
+    Args:
+        names: 내려받을 데이터 이름 (기본값: REQUIRED_RESOURCES 전체)
+        download_dir: 저장 디렉토리 (기본값: NLTK 기본 경로)
+
+    Returns:
+        내려받지 못한 데이터 이름 리스트
+    """
+    import nltk
+
+    paths = [download_dir] if download_dir else None
+    failed = []
+    for name in names or REQUIRED_RESOURCES:
+        if not missing_resources([name], paths):
+            continue
+        if not nltk.download(name, download_dir=download_dir, quiet=True):
+            failed.append(name)
+    return failed
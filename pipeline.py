@@ -0,0 +1,204 @@
+"""
+스크래핑 → 텍스트 정리 → 감정 점수 계산을 동시에 진행하는 파이프라인
+단계마다 스레드 하나가 크기가 제한된 큐로 다음 단계에 페이지를 넘기므로, 앞 페이지를 분석하는 동안
+다음 페이지를 내려받습니다. 점수 계산이 밀리면 큐가 차서 스크래핑이 멈추고 (배압),
+메모리에는 큐 크기만큼의 페이지만 남습니다.
+
+실행:
+    python pipeline.py <게임 ID> [페이지 수] [결과 파일 (.parquet 또는 .csv)]
+"""
+
+import queue
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from finalcode import SentimentAnalyzer, SentimentSummary, SteamReviewScraper
+from review_db import DEFAULT_DB_PATH, ReviewDatabase
+from review_storage import DEFAULT_REVIEWS_FILE, ReviewWriter
+
+# 단계 사이 큐의 끝을 알리는 표시
+_DONE = object()
+
+
+class _StageError:
+    """앞 단계에서 발생한 예외를 다음 단계로 전달하는 래퍼"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class ReviewPipeline:
+    """페이지 단위 리뷰를 스크래핑/정리/점수 계산 단계로 겹쳐 처리하는 파이프라인"""
+
+    def __init__(self, analyzer=None, queue_size=2, backend='vader'):
+        """
+        Args:
+            analyzer: 사용할 SentimentAnalyzer (기본값: 새로 생성)
+            queue_size: 단계 사이 큐에 쌓아 둘 최대 페이지 수 (배압 기준)
+            backend: 점수 계산 엔진 ('vader' 또는 'linear')
+        """
+        self.analyzer = analyzer or SentimentAnalyzer()
+        self.queue_size = queue_size
+        self.backend = backend
+        # 단계별 작업 시간 (대기 시간 제외, 초)과 전체 소요 시간
+        self.stats = {}
+
+    def _put(self, out, item, stop):
+        """중단 요청을 확인하며 큐에 넣음 (큐가 가득 차면 대기)"""
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source, stop):
+        """중단 요청을 확인하며 큐에서 꺼냄 (중단되면 _DONE)"""
+        while not stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _scrape_stage(self, pages, out, stop):
+        pages = iter(pages)
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    break
+                finally:
+                    self.stats['scrape'] += time.perf_counter() - start
+                if page and not self._put(out, pd.DataFrame(page), stop):
+                    break
+        except Exception as e:
+            self._put(out, _StageError(e), stop)
+            return
+        finally:
+            # 중간에 멈춘 경우에도 스크래퍼 제너레이터 정리 (체크포인트/세션)
+            close = getattr(pages, 'close', None)
+            if close is not None:
+                close()
+        self._put(out, _DONE, stop)
+
+    def _clean_stage(self, source, out, stop):
+        while True:
+            item = self._get(source, stop)
+            if item is _DONE or isinstance(item, _StageError):
+                self._put(out, item, stop)
+                return
+            start = time.perf_counter()
+            try:
+                item['cleaned_text'] = self.analyzer.clean_texts(item['review_text'])
+            except Exception as e:
+                self._put(out, _StageError(e), stop)
+                return
+            finally:
+                self.stats['clean'] += time.perf_counter() - start
+            if not self._put(out, item, stop):
+                return
+
+    def iter_scored(self, pages):
+        """
+        페이지별 리뷰 레코드를 받아 감정 분석이 끝난 DataFrame을 페이지 단위로 내보내는 제너레이터
+        점수 계산은 호출한 스레드에서, 스크래핑과 정리는 별도 스레드에서 진행됩니다.
+        제너레이터를 중간에 닫으면 앞 단계도 멈춥니다.
+
+        Args:
+            pages: 페이지별 리뷰 레코드 리스트를 내보내는 이터러블 (예: scraper.iter_reviews(...))
+
+        Yields:
+            analyze_dataframe 결과와 같은 컬럼의 DataFrame
+        """
+        self.stats = {'scrape': 0.0, 'clean': 0.0, 'score': 0.0, 'wall': 0.0}
+        stop = threading.Event()
+        scraped = queue.Queue(maxsize=self.queue_size)
+        cleaned = queue.Queue(maxsize=self.queue_size)
+        threads = [
+            threading.Thread(target=self._scrape_stage, args=(pages, scraped, stop), daemon=True),
+            threading.Thread(target=self._clean_stage, args=(scraped, cleaned, stop), daemon=True)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = self._get(cleaned, stop)
+                if item is _DONE:
+                    return
+                if isinstance(item, _StageError):
+                    raise item.error
+                start = time.perf_counter()
+                df = self.analyzer.add_scores(item, backend=self.backend)
+                self.stats['score'] += time.perf_counter() - start
+                yield df
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            self.stats['wall'] = time.perf_counter() - started
+
+    def run(self, pages):
+        """
+        파이프라인을 끝까지 실행하여 전체 결과 DataFrame 반환 (리뷰가 없으면 None)
+        """
+        frames = list(self.iter_scored(pages))
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True)
+
+    def write_file(self, pages, output_file, review_db=None, game_id=None, game_name=None):
+        """
+        파이프라인 결과를 페이지마다 파일(확장자로 Parquet/CSV 선택)에 이어 쓰고 요약 통계 반환
+        (결과를 메모리에 모으지 않음)
+        review_db가 있으면 페이지마다 한 트랜잭션으로 리뷰 저장소에도 upsert합니다.
+        """
+        summary = SentimentSummary()
+        with ReviewWriter(output_file) as writer:
+            for df in self.iter_scored(pages):
+                writer.write(df)
+                if review_db is not None:
+                    review_db.upsert(df, game_id=game_id, game_name=game_name)
+                summary.update(df)
+        return summary
+
+
+def run_game(game_id, num_pages=10, output_file=DEFAULT_REVIEWS_FILE, queue_size=2, db_path=DEFAULT_DB_PATH):
+    """
+    게임 리뷰를 HTTP API로 스크래핑하면서 바로 감정 분석하여 파일과 리뷰 저장소(db_path, None이면 생략)에 저장
+
+    Returns:
+        SentimentSummary
+    """
+    scraper = SteamReviewScraper(game_id, game_name=game_id)
+    pipeline = ReviewPipeline(queue_size=queue_size)
+    review_db = ReviewDatabase(db_path) if db_path else None
+    try:
+        summary = pipeline.write_file(scraper.iter_reviews(int(num_pages)), output_file,
+                                      review_db=review_db, game_id=game_id)
+    finally:
+        scraper.close()
+        if review_db is not None:
+            review_db.close()
+    print(f"\n결과가 '{output_file}'에 저장되었습니다.")
+    if review_db is not None:
+        print(f"리뷰 저장소 '{db_path}'에 {summary.total}개 리뷰를 저장했습니다.")
+    stats = pipeline.stats
+    print(f"소요 시간: {stats['wall']:.1f}초 (스크래핑 {stats['scrape']:.1f}초, "
+          f"정리 {stats['clean']:.1f}초, 점수 계산 {stats['score']:.1f}초)")
+    summary.print_report()
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    run_game(*sys.argv[1:4])
@@ -0,0 +1,202 @@
+"""
+스크래핑 작업자들이 공유하는 적응형 요청 속도 제한기
+- AdaptiveRateLimiter: 토큰 버킷 + 스로틀링 시 지수적 감속, 성공 시 점진적 복구 (AIMD)
+- call_with_retry / call_with_retry_async: 일시적 오류를 지터가 있는 지수 백오프로 재시도
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+
+import requests
+
+
+class TransientError(Exception):
+    """재시도하면 성공할 수 있는 오류 (Steam이 success != 1 응답을 준 경우 등)"""
+
+
+class ThrottledError(TransientError):
+    """서버가 요청 속도 제한을 알린 경우 (HTTP 429/503)"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# 재시도하는 오류: 연결 오류/시간 초과, 잘린 응답 본문의 JSON 파싱 오류 (그 외 ValueError는 코드 오류로 보고 바로 전달)
+RETRYABLE_ERRORS = (TransientError, requests.ConnectionError, requests.Timeout,
+                    json.JSONDecodeError, requests.exceptions.JSONDecodeError)
+
+
+def is_retryable(exc):
+    """재시도할 가치가 있는 오류인지 판단 (HTTP 오류는 429와 5xx만)"""
+    if isinstance(exc, RETRYABLE_ERRORS):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def backoff_delay(attempt, base_delay=1.0, max_delay=60.0):
+    """attempt번째 재시도 전 대기 시간 (full jitter 지수 백오프)"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class AdaptiveRateLimiter:
+    """
+    스레드/코루틴 모두에서 사용할 수 있는 적응형 토큰 버킷
+    스로틀링을 받으면 속도를 backoff_factor배로 줄이고, 성공할 때마다 increase_step만큼 max_rate까지 올립니다.
+    """
+
+    def __init__(self, rate=4.0, burst=4, min_rate=0.1, max_rate=None, backoff_factor=0.5, increase_step=0.05):
+        """
+        Args:
+            rate: 시작 초당 요청 수
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (버킷 크기)
+            min_rate: 감속 시 하한
+            max_rate: 복구 시 상한 (기본값: rate)
+            backoff_factor: 스로틀링 시 속도에 곱할 값
+            increase_step: 성공 응답마다 늘릴 초당 요청 수
+        """
+        self.rate = float(rate)
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = float(max_rate or rate)
+        self.backoff_factor = backoff_factor
+        self.increase_step = increase_step
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def apply_cap(self, rate, burst=None):
+        """
+        공유 제한기에 호출자의 상한을 적용 (상한은 낮출 수만 있음)
+        다른 작업자가 정한 더 낮은 상한과 스로틀링으로 줄어든 현재 속도는 그대로 유지합니다.
+
+        Args:
+            rate: 초당 요청 수 상한
+            burst: 버킷 크기 상한 (선택)
+        """
+        with self._lock:
+            self.max_rate = min(self.max_rate, float(rate))
+            self.rate = min(self.rate, self.max_rate)
+            if burst is not None:
+                self.burst = min(self.burst, burst)
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def _reserve(self):
+        """토큰 하나를 예약하고 요청 전에 기다려야 할 시간을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self):
+        """요청을 보내도 될 때까지 대기 (동기)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """요청을 보내도 될 때까지 대기 (비동기)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        """정상 응답: 속도를 조금씩 복구"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttle(self, retry_after=None):
+        """
+        스로틀링 응답: 속도를 줄이고 쌓인 토큰을 비움
+
+        Args:
+            retry_after: 서버가 알려준 대기 시간 (초, 선택)
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
+_shared_limiters = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter(host, **kwargs):
+    """
+    프로세스 전체에서 호스트별로 공유하는 속도 제한기 반환
+    처음 호출할 때의 kwargs로 생성되며, 이후 호출은 같은 객체를 반환합니다.
+    이미 생성된 제한기의 상한을 더 낮추려면 apply_cap()을 사용하세요.
+    """
+    with _shared_lock:
+        limiter = _shared_limiters.get(host)
+        if limiter is None:
+            limiter = _shared_limiters[host] = AdaptiveRateLimiter(**kwargs)
+        return limiter
+
+
+def _record_failure(limiter, exc):
+    if limiter is not None and isinstance(exc, ThrottledError):
+        limiter.on_throttle(exc.retry_after)
+
+
+def call_with_retry(func, limiter=None, max_retries=4, base_delay=1.0, max_delay=60.0):
+    """
+    속도 제한을 지키며 func()를 호출하고, 일시적 오류는 지수 백오프로 재시도
+
+    Args:
+        func: 인자 없는 호출 가능 객체
+        limiter: AdaptiveRateLimiter (None이면 속도 제한 없음)
+        max_retries: 최대 재시도 횟수
+        base_delay: 첫 재시도 대기 시간의 기준값 (초)
+        max_delay: 재시도 대기 시간 상한 (초)
+    """
+    for attempt in range(max_retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            result = func()
+        except Exception as e:
+            # 마지막 시도의 스로틀링도 공유 제한기에 반영한 뒤 전달
+            _record_failure(limiter, e)
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            print(f"일시적 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+            time.sleep(delay)
+            continue
+        if limiter is not None:
+            limiter.on_success()
+        return result
+
+
+async def call_with_retry_async(func, limiter=None, max_retries=4, base_delay=1.0, max_delay=60.0):
+    """call_with_retry의 비동기 버전 (func는 인자 없는 코루틴 함수)"""
+    for attempt in range(max_retries + 1):
+        if limiter is not None:
+            await limiter.acquire_async()
+        try:
+            result = await func()
+        except Exception as e:
+            # 마지막 시도의 스로틀링도 공유 제한기에 반영한 뒤 전달
+            _record_failure(limiter, e)
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            print(f"일시적 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+            await asyncio.sleep(delay)
+            continue
+        if limiter is not None:
+            limiter.on_success()
+        return result
@@ -0,0 +1,281 @@
+"""
+실행이 끝나도 유지되는 SQLite 리뷰 저장소
+리뷰는 (game_id, recommendationid)를 키로 한 행씩 저장되며, 스크래핑/감정 분석 결과를 한 트랜잭션으로
+일괄 upsert합니다. 게임, 작성 날짜, 추천 여부, 감정 레이블 인덱스가 있어 여러 게임의 리뷰를 쌓아 두고도
+조건에 맞는 행과 필요한 컬럼만 pandas로 읽을 수 있습니다.
+"""
+
+import hashlib
+import sqlite3
+import threading
+
+import pandas as pd
+
+from finalcode import SENTIMENT_LABELS, parse_review_date
+
+DEFAULT_DB_PATH = 'reviews.sqlite'
+
+# 저장하는 컬럼과 SQLite 타입 (키 컬럼 제외)
+REVIEW_COLUMNS = {
+    'game_name': 'TEXT',
+    'review_text': 'TEXT',
+    'recommended': 'INTEGER',
+    'playtime_at_review': 'REAL',
+    'date_posted': 'TEXT',
+    'review_length': 'INTEGER',
+    'cleaned_text': 'TEXT',
+    'compound_score': 'REAL',
+    'positive_score': 'REAL',
+    'neutral_score': 'REAL',
+    'negative_score': 'REAL',
+    'sentiment_label': 'TEXT'
+}
+KEY_COLUMNS = ('game_id', 'recommendationid')
+# 리뷰 원문이 바뀌면 무효가 되는 분석 결과 컬럼
+ANALYSIS_COLUMNS = ('cleaned_text', 'compound_score', 'positive_score', 'neutral_score',
+                    'negative_score', 'sentiment_label')
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS reviews ("
+    "game_id TEXT NOT NULL, recommendationid TEXT NOT NULL, "
+    + ", ".join(f"{name} {sql_type}" for name, sql_type in REVIEW_COLUMNS.items())
+    + ", updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+    "PRIMARY KEY (game_id, recommendationid))",
+    "CREATE INDEX IF NOT EXISTS idx_reviews_game_date ON reviews (game_id, date_posted)",
+    "CREATE INDEX IF NOT EXISTS idx_reviews_game_recommended ON reviews (game_id, recommended)",
+    "CREATE INDEX IF NOT EXISTS idx_reviews_game_label ON reviews (game_id, sentiment_label)",
+    "CREATE INDEX IF NOT EXISTS idx_reviews_date ON reviews (date_posted)"
+]
+
+
+def review_key(record, game_id=None):
+    """
+    리뷰 키 (recommendationid)
+    ID가 없는 Selenium 리뷰는 게임과 작성자 프로필 링크의 해시를 사용합니다 (작성자는 게임당 리뷰 하나).
+    작성자도 없는 샘플 데이터 등은 게임, 원문, 플레이 시간의 해시를 사용하므로 같은 내용의 리뷰는 한 행이 됩니다.
+    (작성 날짜는 수집 시점에 따라 표시가 달라지므로 키에 넣지 않음)
+    """
+    review_id = record.get('recommendationid')
+    if review_id is not None and not pd.isna(review_id) and str(review_id):
+        return str(review_id)
+    game = str(record.get('game_id', game_id))
+    author = record.get('author')
+    if author is not None and not pd.isna(author) and str(author):
+        parts = [game, 'author', str(author)]
+    else:
+        playtime = record.get('playtime_at_review')
+        try:
+            # 10과 10.0이 같은 키가 되도록 숫자로 맞춤
+            playtime = f"{float(playtime):g}"
+        except (TypeError, ValueError):
+            playtime = str(playtime)
+        parts = [game, str(record.get('review_text', '')), playtime]
+    return 'h' + hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=12).hexdigest()
+
+
+def review_keys(df, game_id=None):
+    """
+    DataFrame 각 행의 리뷰 키 리스트 (recommendationid가 있는 행은 그대로, 없는 행만 review_key로 계산)
+
+    Args:
+        df: 리뷰 DataFrame
+        game_id: game_id 컬럼이 없을 때 사용할 게임 ID
+    """
+    if 'recommendationid' not in df.columns:
+        return [review_key(record, game_id) for record in df.to_dict('records')]
+    ids = df['recommendationid'].astype(object).where(df['recommendationid'].notna(), None).tolist()
+    missing = [i for i, review_id in enumerate(ids) if review_id is None or str(review_id) == '']
+    keys = [str(review_id) for review_id in ids]
+    if missing:
+        records = df.iloc[missing].to_dict('records')
+        for i, record in zip(missing, records):
+            keys[i] = review_key(record, game_id)
+    return keys
+
+
+def normalize_dates(series):
+    """
+    작성 날짜 컬럼을 'YYYY-MM-DD' 문자열 리스트로 변환 (해석할 수 없으면 None)
+    날짜 범위 조회와 정렬이 문자열 비교로 동작하도록 저장 전에 ISO 형식으로 맞춥니다.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return _sql_column(series.dt.strftime('%Y-%m-%d'))
+    values = series.astype(object).where(series.notna(), None).tolist()
+    # 같은 날 작성된 리뷰가 많으므로 서로 다른 값만 한 번씩 해석
+    parsed = {value: parse_review_date(value) for value in set(values)}
+    return [parsed[value] for value in values]
+
+
+def _sql_column(series):
+    """컬럼을 sqlite3가 받는 파이썬 값 리스트로 변환 (결측값은 NULL)"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+class ReviewDatabase:
+    """게임별 리뷰를 보관하는 SQLite 저장소 (스레드 안전)"""
+
+    # 한 번의 executemany에 넘길 행 수
+    BATCH_SIZE = 5000
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        """
+        Args:
+            path: SQLite 파일 경로 (':memory:'이면 메모리에만 저장)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ':memory:':
+            # 읽기가 쓰기를 기다리지 않도록 WAL 모드 사용
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+
+    def upsert(self, df, game_id=None, game_name=None):
+        """
+        리뷰를 한 트랜잭션으로 일괄 저장 (같은 키가 있으면 df에 있는 컬럼만 갱신)
+        분석 결과 없이 원문이 바뀐 리뷰는 기존 분석 결과를 지웁니다.
+
+        Args:
+            df: 리뷰 DataFrame (game_id 컬럼이 없으면 game_id 인자 사용, recommendationid가 없으면 review_key 사용,
+                date_posted는 ISO 날짜로 변환하고 해석할 수 없으면 NULL)
+            game_id: 모든 행의 게임 ID
+            game_name: 모든 행의 게임 이름 (선택)
+
+        Returns:
+            실제로 추가되거나 갱신된 행 수 (df 안에서 키가 겹치는 행은 한 번만 셈)
+        """
+        if df is None or df.empty:
+            return 0
+        if game_id is None and 'game_id' not in df.columns:
+            raise ValueError("game_id 컬럼이나 game_id 인자가 필요합니다.")
+        columns = [name for name in REVIEW_COLUMNS if name in df.columns or (name == 'game_name' and game_name)]
+        names = list(KEY_COLUMNS) + columns
+
+        updates = [f"{name} = excluded.{name}" for name in columns]
+        if 'review_text' in columns and 'compound_score' not in columns:
+            # 원문만 다시 수집한 경우: 원문이 바뀐 리뷰의 분석 결과는 지움 (SET은 기존 행 값을 기준으로 계산)
+            updates += [f"{name} = CASE WHEN reviews.review_text IS excluded.review_text "
+                        f"THEN reviews.{name} ELSE NULL END"
+                        for name in ANALYSIS_COLUMNS if name not in columns]
+        updates.append("updated_at = CURRENT_TIMESTAMP")
+        sql = (f"INSERT INTO reviews ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+               f"ON CONFLICT (game_id, recommendationid) DO UPDATE SET {', '.join(updates)}")
+
+        # 행마다 변환하지 않고 컬럼 단위로 변환하여 행 튜플 구성
+        if 'game_id' in df.columns:
+            game_ids = df['game_id'].astype(str).tolist()
+        else:
+            game_ids = [str(game_id)] * len(df)
+        values = []
+        for name in columns:
+            if name not in df.columns:
+                values.append([game_name] * len(df))
+            elif name == 'recommended':
+                values.append(_sql_column(df[name].astype('boolean').astype('Int64')))
+            elif name == 'date_posted':
+                values.append(normalize_dates(df[name]))
+            else:
+                values.append(_sql_column(df[name]))
+        # 같은 키가 여러 번 나오면 마지막 행만 저장 (순서대로 upsert한 결과와 같음)
+        rows = {row[:2]: row for row in zip(game_ids, review_keys(df, game_id), *values)}
+        rows = list(rows.values())
+
+        with self._lock, self._db:
+            before = self._db.total_changes
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                self._db.executemany(sql, rows[start:start + self.BATCH_SIZE])
+            return self._db.total_changes - before
+
+    @staticmethod
+    def _where(game_id=None, recommended=None, sentiment_label=None, date_from=None, date_to=None,
+               analyzed=None):
+        clauses, params = [], []
+        if game_id is not None:
+            clauses.append("game_id = ?")
+            params.append(str(game_id))
+        if recommended is not None:
+            clauses.append("recommended = ?")
+            params.append(int(bool(recommended)))
+        if sentiment_label is not None:
+            clauses.append("sentiment_label = ?")
+            params.append(sentiment_label)
+        if date_from is not None:
+            clauses.append("date_posted >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            clauses.append("date_posted <= ?")
+            params.append(date_to)
+        if analyzed is not None:
+            clauses.append("compound_score IS NOT NULL" if analyzed else "compound_score IS NULL")
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, game_id=None, columns=None, recommended=None, sentiment_label=None,
+              date_from=None, date_to=None, analyzed=None, limit=None, offset=0):
+        """
+        조건에 맞는 리뷰를 DataFrame으로 반환 (최근 작성 순)
+
+        Args:
+            game_id: 게임 ID (None이면 전체 게임)
+            columns: 읽을 컬럼 리스트 (저장하지 않는 컬럼은 무시, None이면 키와 전체 컬럼)
+            recommended: True/False면 추천 여부로 필터
+            sentiment_label: 감정 레이블로 필터 ('positive', 'neutral', 'negative')
+            date_from, date_to: 작성 날짜 범위 ('YYYY-MM-DD', 양 끝 포함)
+            analyzed: True면 감정 분석된 리뷰만, False면 분석 전 리뷰만
+            limit, offset: 반환할 최대 행 수와 건너뛸 행 수
+
+        Returns:
+            DataFrame (recommended는 bool, sentiment_label은 범주형)
+        """
+        known = list(KEY_COLUMNS) + list(REVIEW_COLUMNS)
+        selected = known if columns is None else [name for name in columns if name in known]
+        if not selected:
+            raise ValueError(f"읽을 수 있는 컬럼이 없습니다: {columns}")
+        where, params = self._where(game_id, recommended, sentiment_label, date_from, date_to, analyzed)
+        sql = (f"SELECT {', '.join(selected)} FROM reviews{where} "
+               f"ORDER BY date_posted DESC, recommendationid")
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else int(limit), int(offset)]
+        with self._lock:
+            df = pd.read_sql_query(sql, self._db, params=params)
+
+        if 'recommended' in df.columns and not df['recommended'].isna().any():
+            df['recommended'] = df['recommended'].astype(bool)
+        if 'sentiment_label' in df.columns:
+            df['sentiment_label'] = pd.Categorical(df['sentiment_label'], categories=SENTIMENT_LABELS)
+        return df
+
+    def count(self, game_id=None, recommended=None, sentiment_label=None, date_from=None, date_to=None,
+              analyzed=None):
+        """조건에 맞는 리뷰 수 (query와 같은 필터)"""
+        where, params = self._where(game_id, recommended, sentiment_label, date_from, date_to, analyzed)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM reviews{where}", params).fetchone()[0]
+
+    def games(self):
+        """저장된 게임 목록 (게임 ID, 이름, 리뷰 수, 분석된 리뷰 수, 가장 최근 작성 날짜)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT game_id, MAX(game_name), COUNT(*), COUNT(compound_score), MAX(date_posted) "
+                "FROM reviews GROUP BY game_id ORDER BY game_id"
+            ).fetchall()
+        return [
+            {'game_id': game_id, 'game_name': game_name, 'reviews': total, 'analyzed': analyzed,
+             'latest_date': latest}
+            for game_id, game_name, total, analyzed, latest in rows
+        ]
+
+    def delete_game(self, game_id):
+        """게임의 리뷰를 모두 삭제하고 삭제한 행 수 반환"""
+        with self._lock, self._db:
+            return self._db.execute("DELETE FROM reviews WHERE game_id = ?", (str(game_id),)).rowcount
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,202 @@
+"""
+리뷰 데이터 파일 입출력 (기본: 압축된 Parquet, CSV는 내보내기용)
+확장자로 형식을 고르며 (.parquet 또는 .csv), Parquet은 컬럼별로 저장하므로 필요한 컬럼만 읽을 수 있고
+bool/float/범주형 등 dtype이 그대로 유지됩니다.
+
+CSV로 내보내기:
+    python review_storage.py <리뷰 파일> [CSV 파일]
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# finalcode, app, visualization이 주고받는 기본 결과 파일
+DEFAULT_REVIEWS_FILE = 'game_reviews.parquet'
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+PARQUET_COMPRESSION = 'zstd'
+
+
+def is_parquet(path):
+    """확장자로 Parquet 파일인지 판단 (그 외는 CSV로 처리)"""
+    return os.path.splitext(str(path))[1].lower() in PARQUET_EXTENSIONS
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet 파일을 사용하려면 pyarrow가 필요합니다: pip install pyarrow "
+            "(또는 .csv 확장자로 저장하세요)"
+        ) from e
+    return pyarrow
+
+
+def save_reviews(df, path):
+    """DataFrame을 확장자에 맞는 형식으로 저장 (Parquet은 zstd 압축, CSV는 UTF-8 BOM)"""
+    if is_parquet(path):
+        _pyarrow()
+        df.to_parquet(path, engine='pyarrow', compression=PARQUET_COMPRESSION, index=False)
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def review_columns(path):
+    """파일의 컬럼 이름 리스트 (데이터는 읽지 않음)"""
+    if is_parquet(path):
+        return list(_pyarrow().parquet.read_schema(path).names)
+    return list(pd.read_csv(path, encoding='utf-8-sig', nrows=0).columns)
+
+
+def load_reviews(path, columns=None):
+    """
+    리뷰 파일 읽기
+
+    Args:
+        path: .parquet 또는 .csv 파일
+        columns: 읽을 컬럼 리스트 (이 순서로 반환, 파일에 없는 컬럼은 무시, None이면 전체)
+    """
+    if columns is not None:
+        available = set(review_columns(path))
+        columns = [column for column in columns if column in available]
+    if is_parquet(path):
+        _pyarrow()
+        return pd.read_parquet(path, engine='pyarrow', columns=columns)
+    df = pd.read_csv(path, encoding='utf-8-sig', usecols=columns)
+    # usecols는 파일의 컬럼 순서를 따르므로 Parquet과 같이 요청한 순서로 맞춤
+    return df if columns is None else df[columns]
+
+
+def iter_review_chunks(path, rows_per_chunk=50000, columns=None):
+    """리뷰 파일을 rows_per_chunk행씩 DataFrame으로 내보내는 제너레이터 (전체를 메모리에 올리지 않음)"""
+    if is_parquet(path):
+        parquet_file = _pyarrow().parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=rows_per_chunk, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, encoding='utf-8-sig', chunksize=rows_per_chunk, usecols=columns)
+
+
+def _review_arrow_types(pa):
+    """알려진 리뷰 컬럼의 Arrow 타입 (청크마다 추론이 달라지지 않도록 고정)"""
+    text = pa.large_string()
+    score = pa.float64()
+    return {
+        'recommendationid': text,
+        'game_id': text,
+        'game_name': text,
+        'review_text': text,
+        'recommended': pa.bool_(),
+        'playtime_at_review': pa.float64(),
+        'date_posted': text,
+        'review_length': pa.int64(),
+        'cleaned_text': text,
+        'compound_score': score,
+        'positive_score': score,
+        'neutral_score': score,
+        'negative_score': score,
+        'sentiment_label': pa.dictionary(pa.int8(), text)
+    }
+
+
+def _review_schema(table):
+    """
+    첫 청크로 파일 스키마 결정
+    알려진 리뷰 컬럼은 고정 타입을 쓰고, 그 외 컬럼은 추론한 타입을 쓰되 값이 모두 비어 있으면 문자열로 둡니다.
+    """
+    pa = _pyarrow()
+    known = _review_arrow_types(pa)
+    fields = []
+    for field, column in zip(table.schema, table.columns):
+        if field.name in known:
+            fields.append(pa.field(field.name, known[field.name]))
+        elif pa.types.is_null(field.type) or (table.num_rows and column.null_count == table.num_rows):
+            # CSV 청크의 빈 컬럼은 float(NaN)로 읽히므로 타입을 알 수 없는 것으로 처리
+            fields.append(pa.field(field.name, pa.large_string()))
+        else:
+            fields.append(pa.field(field.name, field.type))
+    return pa.schema(fields)
+
+
+def _conform(table, schema):
+    """청크를 파일 스키마에 맞춤 (없거나 비어 있는 컬럼은 null, 타입이 다르면 변환)"""
+    pa = _pyarrow()
+    columns = []
+    for field in schema:
+        column = table.column(field.name) if field.name in table.column_names else None
+        if column is None or column.null_count == len(table):
+            # 값이 없는 컬럼은 추론된 타입과 상관없이 null로 채움 (float NaN은 범주형으로 변환할 수 없음)
+            columns.append(pa.nulls(len(table), field.type))
+        else:
+            columns.append(column.cast(field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class ReviewWriter:
+    """
+    청크 단위로 이어 쓰는 리뷰 파일 작성기 (with 문으로 사용)
+    Parquet은 청크마다 row group 하나를 추가하고, 모든 청크를 하나의 스키마로 변환해서 씁니다.
+    (알려진 리뷰 컬럼은 고정 타입이므로 첫 청크의 값이 모두 비어 있어도 이후 청크와 타입이 어긋나지 않음)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._file = None
+        self._writer = None
+
+    def __enter__(self):
+        if not is_parquet(self.path):
+            self._file = open(self.path, 'w', encoding='utf-8-sig', newline='')
+        return self
+
+    def write(self, df):
+        """청크 하나 추가"""
+        if is_parquet(self.path):
+            pa = _pyarrow()
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pa.parquet.ParquetWriter(self.path, _review_schema(table),
+                                                        compression=PARQUET_COMPRESSION)
+            self._writer.write_table(_conform(table, self._writer.schema))
+        else:
+            # BOM과 헤더는 처음에 한 번만 기록
+            df.to_csv(self._file, index=False, header=self.rows == 0)
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def export_csv(path, csv_file=None):
+    """
+    리뷰 파일을 CSV로 내보내기 (청크 단위로 변환)
+
+    Returns:
+        CSV 파일 경로 (기본값: 같은 이름의 .csv)
+    """
+    if csv_file is None:
+        csv_file = os.path.splitext(path)[0] + '.csv'
+    with ReviewWriter(csv_file) as writer:
+        for chunk in iter_review_chunks(path):
+            writer.write(chunk)
+    print(f"{writer.rows}개 리뷰를 '{csv_file}'로 내보냈습니다.")
+    return csv_file
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    export_csv(*sys.argv[1:3])
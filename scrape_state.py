@@ -0,0 +1,256 @@
+"""
+스크래핑 진행 상태를 로컬 디스크에 저장하는 모듈
+- ScrapeCheckpoint: 페이지마다 cursor와 해당 페이지 리뷰를 기록하여 중단된 스크래핑을 이어서 진행
+- SeenReviewIndex: 이미 수집한 리뷰 ID(recommendationid)를 기록하여 다음 실행에서 건너뜀
+- DeltaWatermarks: 게임별로 본 가장 최신 리뷰 작성 시각을 기록하여 새 리뷰만 가져옴
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+DEFAULT_CHECKPOINT_DIR = 'scrape_checkpoints'
+DEFAULT_SEEN_INDEX_PATH = 'seen_reviews.idx'
+DEFAULT_WATERMARK_PATH = 'review_watermarks.json'
+
+
+def _atomic_write_json(path, data):
+    """임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 파일이 깨지지 않도록 저장"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ScrapeCheckpoint:
+    """게임별 스크래핑 체크포인트 (cursor 상태 JSON + 리뷰 JSONL)"""
+
+    def __init__(self, game_id, directory=DEFAULT_CHECKPOINT_DIR):
+        """
+        Args:
+            game_id: Steam 게임 ID
+            directory: 체크포인트 파일을 저장할 디렉토리
+        """
+        self.game_id = str(game_id)
+        self.directory = directory
+        self.state_path = os.path.join(directory, f"{self.game_id}.json")
+        self.reviews_path = os.path.join(directory, f"{self.game_id}.jsonl")
+        os.makedirs(directory, exist_ok=True)
+        self.state = self._read_state()
+
+    def _read_state(self):
+        if not os.path.exists(self.state_path):
+            return {'cursor': '*', 'pages': 0, 'review_count': 0, 'reviews_bytes': 0, 'complete': False}
+        with open(self.state_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    @property
+    def cursor(self):
+        """다음에 요청할 cursor"""
+        return self.state['cursor']
+
+    @property
+    def pages(self):
+        """체크포인트까지 완료된 페이지 수"""
+        return self.state['pages']
+
+    @property
+    def complete(self):
+        """cursor 체인을 끝까지 스크래핑했는지 여부"""
+        return self.state['complete']
+
+    def load_reviews(self):
+        """체크포인트에 저장된 리뷰를 모두 리스트로 읽어옴 (큰 체크포인트는 iter_reviews 사용)"""
+        return [review for batch in self.iter_reviews() for review in batch]
+
+    def iter_reviews(self, batch_size=100):
+        """
+        체크포인트에 저장된 리뷰를 batch_size개씩 읽어 내보냄 (전체를 메모리에 올리지 않음)
+        마지막 상태 저장 이후에 덧붙여진 (커밋되지 않은) 리뷰는 읽기 전에 잘라냄
+
+        Returns:
+            리뷰 레코드 리스트를 내보내는 이터레이터
+        """
+        if not os.path.exists(self.reviews_path):
+            return iter(())
+        committed = self.state['reviews_bytes']
+        if os.path.getsize(self.reviews_path) > committed:
+            with open(self.reviews_path, 'r+b') as f:
+                f.truncate(committed)
+        return self._read_batches(batch_size)
+
+    def _read_batches(self, batch_size):
+        batch = []
+        with open(self.reviews_path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                batch.append(json.loads(line))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def save_page(self, next_cursor, reviews, complete=False):
+        """
+        한 페이지의 리뷰를 덧붙이고 다음 cursor를 기록
+
+        Args:
+            next_cursor: 다음 페이지 cursor
+            reviews: 이번 페이지에서 수집한 리뷰 레코드 리스트
+            complete: cursor 체인의 마지막 페이지인지 여부
+        """
+        # 리뷰를 먼저 디스크에 기록한 뒤 상태를 교체 (상태 파일이 커밋 지점)
+        with open(self.reviews_path, 'ab') as f:
+            f.seek(self.state['reviews_bytes'])
+            f.truncate()
+            for review in reviews:
+                f.write((json.dumps(review, ensure_ascii=False) + '\n').encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+            reviews_bytes = f.tell()
+
+        self.state = {
+            'cursor': next_cursor,
+            'pages': self.state['pages'] + 1,
+            'review_count': self.state['review_count'] + len(reviews),
+            'reviews_bytes': reviews_bytes,
+            'complete': complete,
+            'updated_at': time.time()
+        }
+        _atomic_write_json(self.state_path, self.state)
+
+    def mark_complete(self):
+        """더 이상 가져올 페이지가 없음을 기록"""
+        self.state['complete'] = True
+        _atomic_write_json(self.state_path, self.state)
+
+    def clear(self):
+        """체크포인트 파일 삭제 (처음부터 다시 스크래핑)"""
+        for path in (self.state_path, self.reviews_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.state = self._read_state()
+
+
+class SeenReviewIndex:
+    """
+    실행 간에 유지되는 수집 완료 리뷰 ID 집합
+    디스크에는 ID당 8바이트(uint64)로 덧붙여 저장하고, 메모리에서는 정렬된 배열을 이진 탐색합니다.
+    """
+
+    # 최근 추가된 ID가 이 개수를 넘으면 정렬된 배열로 병합
+    MERGE_THRESHOLD = 65536
+
+    def __init__(self, path=DEFAULT_SEEN_INDEX_PATH):
+        """
+        Args:
+            path: 인덱스 파일 경로
+        """
+        self.path = path
+        if os.path.exists(path):
+            self._sorted = np.unique(np.fromfile(path, dtype='<u8'))
+        else:
+            self._sorted = np.empty(0, dtype='<u8')
+        self._recent = set()
+        self._unsaved = []
+        # 비동기 엔진에서는 여러 게임의 페이지 기록이 작업 스레드에서 동시에 실행됨
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(review_id):
+        """리뷰 ID를 uint64 키로 변환 (숫자가 아닌 ID는 해시 사용)"""
+        try:
+            key = int(review_id)
+            if 0 <= key < 2 ** 64:
+                return key
+        except (TypeError, ValueError):
+            pass
+        digest = hashlib.blake2b(str(review_id).encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
+
+    def _contains_key(self, key):
+        if key in self._recent:
+            return True
+        i = np.searchsorted(self._sorted, np.uint64(key))
+        return i < len(self._sorted) and int(self._sorted[i]) == key
+
+    def __contains__(self, review_id):
+        return self._contains_key(self._key(review_id))
+
+    def __len__(self):
+        return len(self._sorted) + len(self._recent)
+
+    def add(self, review_id):
+        """
+        리뷰 ID를 인덱스에 추가
+
+        Returns:
+            새로 추가되었으면 True, 이미 있던 ID면 False
+        """
+        key = self._key(review_id)
+        with self._lock:
+            if self._contains_key(key):
+                return False
+            self._recent.add(key)
+            self._unsaved.append(key)
+            if len(self._recent) >= self.MERGE_THRESHOLD:
+                self._merge()
+        return True
+
+    def _merge(self):
+        recent = np.fromiter(self._recent, dtype='<u8', count=len(self._recent))
+        self._sorted = np.union1d(self._sorted, recent)
+        self._recent.clear()
+
+    def save(self):
+        """아직 저장되지 않은 ID를 인덱스 파일 끝에 덧붙임"""
+        with self._lock:
+            if not self._unsaved:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'ab') as f:
+                np.asarray(self._unsaved, dtype='<u8').tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            self._unsaved = []
+
+
+class DeltaWatermarks:
+    """게임별 최신 timestamp_created 워터마크 (JSON 파일)"""
+
+    def __init__(self, path=DEFAULT_WATERMARK_PATH):
+        """
+        Args:
+            path: 워터마크 파일 경로
+        """
+        self.path = path
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.marks = json.load(f)
+        else:
+            self.marks = {}
+
+    def get(self, game_id):
+        """게임의 워터마크 반환 (없으면 None)"""
+        return self.marks.get(str(game_id))
+
+    def update(self, game_id, timestamp):
+        """워터마크를 더 최신 timestamp로 앞당김"""
+        game_id = str(game_id)
+        current = self.marks.get(game_id)
+        if current is None or timestamp > current:
+            self.marks[game_id] = int(timestamp)
+
+    def save(self):
+        """워터마크 파일 저장"""
+        _atomic_write_json(self.path, self.marks)
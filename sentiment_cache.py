@@ -0,0 +1,131 @@
+"""
+정리된 리뷰 텍스트별 VADER 점수 캐시
+- 메모리: 최근 사용 순서(LRU)로 max_entries개까지 유지
+- 디스크 (선택): SQLite 파일에 저장하여 재시작 후에도 재사용
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+SCORE_KEYS = ('neg', 'neu', 'pos', 'compound')
+
+
+class SentimentCache:
+    """텍스트 해시를 키로 하는 감정 점수 캐시 (스레드 안전)"""
+
+    # 디스크에 쓰지 않은 점수가 이 개수를 넘으면 한 번에 기록
+    FLUSH_THRESHOLD = 1000
+
+    def __init__(self, max_entries=100000, path=None):
+        """
+        Args:
+            max_entries: 메모리에 유지할 최대 점수 개수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+            path: 디스크 캐시 SQLite 파일 경로 (None이면 메모리만 사용)
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS scores "
+                "(key BLOB PRIMARY KEY, neg REAL, neu REAL, pos REAL, compound REAL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key(text):
+        """텍스트의 캐시 키 (16바이트 blake2b 해시)"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def __len__(self):
+        return len(self._memory)
+
+    def _remember(self, key, values):
+        self._memory[key] = values
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key):
+        values = self._memory.get(key)
+        if values is not None:
+            self._memory.move_to_end(key)
+            return values
+        if self._db is None:
+            return None
+        values = self._pending.get(key)
+        if values is None:
+            row = self._db.execute(
+                "SELECT neg, neu, pos, compound FROM scores WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            values = tuple(row)
+        self._remember(key, values)
+        return values
+
+    def get(self, text):
+        """
+        캐시된 점수 반환
+
+        Returns:
+            analyze_sentiment와 같은 형태의 딕셔너리 (없으면 None)
+        """
+        key = self.key(text)
+        with self._lock:
+            values = self._lookup(key)
+            if values is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return dict(zip(SCORE_KEYS, values))
+
+    def put(self, text, scores):
+        """점수 저장 (디스크 캐시는 FLUSH_THRESHOLD개씩 모아서 기록)"""
+        key = self.key(text)
+        values = tuple(float(scores[name]) for name in SCORE_KEYS)
+        with self._lock:
+            self._remember(key, values)
+            if self._db is not None:
+                self._pending[key] = values
+                if len(self._pending) >= self.FLUSH_THRESHOLD:
+                    self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        self._db.executemany(
+            "INSERT OR REPLACE INTO scores (key, neg, neu, pos, compound) VALUES (?, ?, ?, ?, ?)",
+            [(key,) + values for key, values in self._pending.items()]
+        )
+        self._db.commit()
+        self._pending.clear()
+
+    def flush(self):
+        """아직 기록하지 않은 점수를 디스크 캐시에 저장"""
+        if self._db is None:
+            return
+        with self._lock:
+            self._flush_locked()
+
+    def stats(self):
+        """캐시 적중/실패 횟수와 메모리 항목 수"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._memory)}
+
+    def close(self):
+        """디스크 캐시를 저장하고 연결 종료"""
+        if self._db is None:
+            return
+        with self._lock:
+            self._flush_locked()
+            self._db.close()
+            self._db = None
@@ -1,74 +1,66 @@
 """
-NLTK 데이터 자동 다운로드 스크립트
-이 스크립트는 감정 분석에 필요한 NLTK 데이터를 자동으로 다운로드합니다.
+NLTK 데이터 설치 스크립트
+감정 분석에 필요한 NLTK 데이터(stopwords, vader_lexicon)를 한 번 내려받습니다.
+앱과 작업자는 실행 중에 데이터를 내려받지 않으므로, 배포 전에 네트워크가 되는 환경에서 실행하세요.
+
+실행:
+    python setup_nltk.py [저장 디렉토리]
 """
 
-import nltk
-import ssl
+import sys
+
+import nltk_resources
 
-# SSL 인증서 검증 임시 비활성화 (NLTK 다운로드용)
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
 
-def download_nltk_data():
-    """필요한 NLTK 데이터를 다운로드합니다."""
+def download_nltk_data(download_dir=None):
+    """필요한 NLTK 데이터를 내려받고 불러올 수 있는지 확인합니다."""
     print("=" * 50)
     print("NLTK 데이터 다운로드 시작")
     print("=" * 50)
-    
-    required_data = [
-        ('stopwords', '불용어 데이터'),
-        ('punkt', '토큰화 데이터'),
-        ('punkt_tab', '토큰화 데이터 (최신 버전)'),
-        ('vader_lexicon', 'VADER 감정 분석 사전'),
-        ('averaged_perceptron_tagger', '품사 태거 데이터')
-    ]
-    
-    for data_name, description in required_data:
-        try:
-            print(f"\n[{data_name}] {description} 다운로드 중...")
-            nltk.download(data_name, quiet=False)
-            print(f"✓ {data_name} 다운로드 완료")
-        except Exception as e:
-            print(f"✗ {data_name} 다운로드 실패: {e}")
-    
+
+    descriptions = {
+        'stopwords': '불용어 데이터',
+        'vader_lexicon': 'VADER 감정 분석 사전'
+    }
+    for name in nltk_resources.REQUIRED_RESOURCES:
+        print(f"\n[{name}] {descriptions.get(name, name)} 다운로드 중...")
+        failed = nltk_resources.download([name], download_dir)
+        if failed:
+            print(f"✗ {name} 다운로드 실패")
+        else:
+            print(f"✓ {name} 준비 완료")
+
     print("\n" + "=" * 50)
     print("NLTK 데이터 다운로드 완료!")
     print("=" * 50)
-    
+
     # 다운로드 확인
     print("\n다운로드 확인:")
     try:
-        from nltk.corpus import stopwords
-        from nltk.sentiment import SentimentIntensityAnalyzer
-        from nltk.tokenize import word_tokenize
-        
-        stop_words = stopwords.words('english')
+        if download_dir:
+            import nltk
+            nltk.data.path.insert(0, download_dir)
+
+        stop_words = nltk_resources.english_stopwords()
         print(f"✓ stopwords: {len(stop_words)}개 단어")
-        
-        sia = SentimentIntensityAnalyzer()
+
+        sia = nltk_resources.vader_analyzer()
         test_text = "This is a great game!"
         scores = sia.polarity_scores(test_text)
         print(f"✓ VADER 감정 분석: 테스트 성공 (점수: {scores['compound']:.3f})")
-        
-        tokens = word_tokenize(test_text)
-        print(f"✓ 토큰화: {len(tokens)}개 토큰 생성")
-        
+
         print("\n모든 NLTK 데이터가 정상적으로 작동합니다!")
+        if download_dir:
+            print(f"앱을 실행할 때 NLTK_DATA={download_dir} 환경 변수를 지정하세요.")
         return True
     except Exception as e:
         print(f"\n오류: {e}")
         return False
 
 if __name__ == "__main__":
-    success = download_nltk_data()
+    success = download_nltk_data(*sys.argv[1:2])
     if success:
         print("\n이제 'python app.py'를 실행하여 Flask 앱을 시작할 수 있습니다!")
     else:
         print("\n일부 데이터 다운로드에 실패했습니다. 수동으로 다시 시도해주세요.")
-
-
+        sys.exit(1)
@@ -39,33 +39,21 @@ def test_imports():
         return False
 
 def test_nltk_data():
-    """NLTK 데이터 다운로드 테스트"""
+    """로컬 NLTK 데이터 테스트 (없으면 python setup_nltk.py로 설치)"""
     print("\n=== NLTK 데이터 테스트 ===")
     try:
-        import nltk
-        import ssl
-        
-        # SSL 인증서 검증 임시 비활성화
-        try:
-            _create_unverified_https_context = ssl._create_unverified_context
-        except AttributeError:
-            pass
-        else:
-            ssl._create_default_https_context = _create_unverified_https_context
-        
-        # NLTK 데이터 확인
-        nltk.download('stopwords', quiet=True)
-        nltk.download('punkt', quiet=True)
-        nltk.download('vader_lexicon', quiet=True)
+        import nltk_resources
         
-        from nltk.corpus import stopwords
-        from nltk.sentiment import SentimentIntensityAnalyzer
+        missing = nltk_resources.missing_resources()
+        if missing:
+            print(f"✗ 없는 NLTK 데이터: {', '.join(missing)} (python setup_nltk.py를 실행하세요)")
+            return False
         
         # 테스트
-        stop_words = stopwords.words('english')
+        stop_words = nltk_resources.english_stopwords()
         print(f"✓ stopwords ({len(stop_words)}개 단어)")
         
-        sia = SentimentIntensityAnalyzer()
+        sia = nltk_resources.vader_analyzer()
         test_text = "This is a great game!"
         scores = sia.polarity_scores(test_text)
         print(f"✓ VADER 감정 분석 (테스트 점수: {scores['compound']:.3f})")
@@ -159,6 +147,1660 @@ def test_sample_data():
         traceback.print_exc()
         return False
 
+# 웹 앱이 import 시점에 여는 파일의 경로 (작업 디렉토리 대신 임시 디렉토리 사용)
+WEB_APP_PATHS = {
+    'SENTIMENT_CACHE_PATH': 'sentiment_cache.sqlite',
+    'REVIEW_DB_PATH': 'reviews.sqlite',
+    'DATASET_DIR': 'datasets'
+}
+
+def import_web_app():
+    """
+    웹 앱 모듈 import
+    처음 import할 때 감정 점수 캐시, 리뷰 저장소, 데이터셋 디렉토리를 임시 디렉토리로 지정하여
+    테스트가 작업 디렉토리에 sentiment_cache.sqlite, reviews.sqlite 등을 남기지 않도록 합니다.
+    """
+    if 'app' not in sys.modules:
+        import atexit
+        import shutil
+        import tempfile
+        tmp_dir = tempfile.mkdtemp(prefix='steam_app_test_')
+        atexit.register(shutil.rmtree, tmp_dir, True)
+        saved = {name: os.environ.get(name) for name in WEB_APP_PATHS}
+        os.environ.update({name: os.path.join(tmp_dir, filename) for name, filename in WEB_APP_PATHS.items()})
+        try:
+            import app
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+    return sys.modules['app']
+
+class patched:
+    """with 블록 동안 모듈 전역 변수를 바꾸고 끝나면 원래 값으로 되돌림"""
+    
+    def __init__(self, module, **values):
+        self.module = module
+        self.values = values
+        self.saved = {}
+    
+    def __enter__(self):
+        for name, value in self.values.items():
+            self.saved[name] = getattr(self.module, name)
+            setattr(self.module, name, value)
+        return self.module
+    
+    def __exit__(self, *exc_info):
+        for name, value in self.saved.items():
+            setattr(self.module, name, value)
+
+def start_stub_server(pages_by_game, requested=None, failures=None):
+    """
+    Steam appreviews 엔드포인트를 흉내 내는 로컬 스텁 서버 시작
+    
+    Args:
+        pages_by_game: {게임 ID: {cursor: JSON 응답}} 딕셔너리
+        requested: 요청된 (게임 ID, cursor)를 기록할 리스트 (선택)
+        failures: {(게임 ID, cursor): [HTTP 상태 코드 또는 JSON 응답, ...]} - 정상 응답 전에 순서대로 반환 (선택)
+        
+    Returns:
+        (서버, API URL 템플릿) 튜플 - 사용 후 server.shutdown() 호출 필요
+    """
+    import json
+    import threading
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    from urllib.parse import urlparse, parse_qs
+    
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def do_GET(self):
+            url = urlparse(self.path)
+            game_id = url.path.rstrip('/').split('/')[-1]
+            cursor = parse_qs(url.query).get('cursor', ['*'])[0]
+            if requested is not None:
+                requested.append((game_id, cursor))
+            page = pages_by_game.get(game_id, {}).get(cursor, {'success': 1, 'reviews': []})
+            pending = (failures or {}).get((game_id, cursor))
+            if pending:
+                failure = pending.pop(0)
+                if isinstance(failure, int):
+                    self.send_response(failure)
+                    self.send_header('Retry-After', '0')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                page = failure
+            body = json.dumps(page).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/appreviews/{{game_id}}"
+
+def make_stub_pages(game_id, num_pages, per_page=3):
+    """스텁 서버용 cursor 체인 페이지 생성 (마지막 페이지는 같은 cursor 반환)"""
+    pages = {}
+    cursor = '*'
+    for page in range(num_pages):
+        next_cursor = f"{game_id}+p{page + 1}/=" if page < num_pages - 1 else cursor
+        pages[cursor] = {'success': 1, 'cursor': next_cursor, 'reviews': [
+            {'recommendationid': f"{game_id}{page:03d}{i:03d}",
+             'review': f"Review {i} on page {page} of {game_id}",
+             'voted_up': i % 2 == 0,
+             'timestamp_created': 1705276800 - (page * per_page + i) * 3600,
+             'author': {'playtime_at_review': 60 * (i + 1)}}
+            for i in range(per_page)
+        ]}
+        cursor = next_cursor
+    return pages
+
+def make_review_frame():
+    """웹 API 테스트용 수집 리뷰 DataFrame (감정 분석 전)"""
+    import pandas as pd
+    return pd.DataFrame({'review_text': ['great fun', 'awful bugs', 'okay game'],
+                         'recommended': [True, False, True],
+                         'playtime_at_review': [10.0, 2.0, 5.0],
+                         'date_posted': ['2024-01-01', '2024-01-02', '2024-01-03'],
+                         'review_length': [9, 10, 9]})
+
+def test_http_scrape():
+    """로컬 스텁 서버를 사용한 HTTP API 스크래핑 테스트"""
+    print("\n=== HTTP API 스크래핑 테스트 ===")
+    try:
+        from finalcode import SteamReviewScraper
+        
+        requested = []
+        server, api_url = start_stub_server({'730': make_stub_pages('730', 2)}, requested)
+        try:
+            scraper = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'))
+            scraper.scrape_reviews_http(num_pages=5)
+            scraper.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert scraper.driver is None, "WebDriver가 생성되면 안 됩니다"
+        assert requested == [('730', '*'), ('730', '730+p1/=')], f"cursor 요청 순서 오류: {requested}"
+        assert len(scraper.reviews) == 6
+        assert scraper.reviews[0]['review_text'] == 'Review 0 on page 0 of 730'
+        assert scraper.reviews[1]['recommended'] is False
+        print(f"✓ HTTP API 스크래핑 ({len(scraper.reviews)}개 리뷰, WebDriver 미사용)")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ HTTP API 스크래핑 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_async_scrape():
+    """여러 게임 동시 스크래핑 엔진 테스트"""
+    print("\n=== 비동기 다중 게임 스크래핑 테스트 ===")
+    try:
+        from async_scraper import scrape_games
+        
+        pages_by_game = {game_id: make_stub_pages(game_id, 3) for game_id in ['730', '570', '271590']}
+        server, api_url = start_stub_server(pages_by_game)
+        try:
+            results = scrape_games(['730', ('570', 'Dota 2'), '271590'], num_pages=2,
+                                   max_concurrency=4, requests_per_second=None, api_url=api_url)
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert list(results) == ['730', '570', '271590']
+        assert all(len(reviews) == 6 for reviews in results.values()), {k: len(v) for k, v in results.items()}
+        assert results['570'][0]['review_text'] == 'Review 0 on page 0 of 570'
+        print(f"✓ {len(results)}개 게임 동시 스크래핑 (게임당 {len(results['730'])}개 리뷰)")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 비동기 스크래핑 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_checkpoint_resume():
+    """체크포인트 기반 스크래핑 재개 테스트"""
+    print("\n=== 체크포인트 재개 테스트 ===")
+    try:
+        import tempfile
+        from finalcode import SteamReviewScraper
+        from scrape_state import ScrapeCheckpoint
+        
+        requested = []
+        server, api_url = start_stub_server({'730': make_stub_pages('730', 4)}, requested)
+        try:
+            with tempfile.TemporaryDirectory() as checkpoint_dir:
+                # 첫 실행: 2페이지 후 중단된 상황
+                first = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'))
+                first.scrape_reviews_http(num_pages=2, checkpoint=ScrapeCheckpoint('730', checkpoint_dir))
+                
+                # 상태 저장 전에 중단되어 커밋되지 않은 리뷰 흉내
+                with open(ScrapeCheckpoint('730', checkpoint_dir).reviews_path, 'a', encoding='utf-8') as f:
+                    f.write('{"review_text": "uncommitted"}\n')
+                
+                # 두 번째 실행: 마지막 cursor부터 재개
+                requested.clear()
+                second = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'))
+                checkpoint = ScrapeCheckpoint('730', checkpoint_dir)
+                second.scrape_reviews_http(num_pages=10, checkpoint=checkpoint)
+                second.close()
+                assert checkpoint.complete
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert requested == [('730', '730+p2/='), ('730', '730+p3/=')], f"재개 cursor 오류: {requested}"
+        assert len(second.reviews) == 12, len(second.reviews)
+        assert not any(r['review_text'] == 'uncommitted' for r in second.reviews)
+        print(f"✓ 페이지 3부터 재개 ({len(second.reviews)}개 리뷰, 중복 없음)")
+        
+        # 비동기 엔진: 체크포인트에서 복원한 리뷰도 페이지 크기 배치로 전달
+        import asyncio
+        from async_scraper import AsyncScrapeEngine
+        from finalcode import REVIEWS_PER_PAGE
+        
+        server, api_url = start_stub_server({'570': make_stub_pages('570', 3, per_page=60)})
+        try:
+            with tempfile.TemporaryDirectory() as checkpoint_dir:
+                first = SteamReviewScraper("570", "Test Game", api_url=api_url.format(game_id='570'))
+                first.scrape_reviews_http(num_pages=2, checkpoint=ScrapeCheckpoint('570', checkpoint_dir))
+                first.close()
+                
+                import threading
+                from scrape_state import SeenReviewIndex
+                
+                class RecordingIndex(SeenReviewIndex):
+                    """저장이 어느 스레드에서 실행되는지 기록하는 인덱스"""
+                    saved_on_loop = []
+                    
+                    def save(self):
+                        self.saved_on_loop.append(threading.current_thread() is threading.main_thread())
+                        super().save()
+                
+                seen = RecordingIndex(os.path.join(checkpoint_dir, 'seen.idx'))
+                
+                async def _resume():
+                    async with AsyncScrapeEngine(requests_per_second=None, api_url=api_url,
+                                                 checkpoint_dir=checkpoint_dir, seen_index=seen) as engine:
+                        return [len(batch) async for _, batch in engine.stream_all(['570'], num_pages=3,
+                                                                                   max_pending=1)]
+                
+                batch_sizes = asyncio.run(_resume())
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert batch_sizes == [REVIEWS_PER_PAGE, 120 - REVIEWS_PER_PAGE, 60], batch_sizes
+        # 페이지 기록(fsync)은 이벤트 루프가 아닌 작업 스레드에서 실행
+        assert RecordingIndex.saved_on_loop == [False], RecordingIndex.saved_on_loop
+        print(f"✓ 복원한 리뷰 120개를 페이지 크기로 나누어 전달 (배치 크기 {batch_sizes})")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 체크포인트 재개 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_seen_index():
+    """수집 완료 리뷰 인덱스로 중복 리뷰를 건너뛰는지 테스트"""
+    print("\n=== 리뷰 ID 인덱스 테스트 ===")
+    try:
+        import tempfile
+        from finalcode import SteamReviewScraper
+        from scrape_state import ScrapeCheckpoint, SeenReviewIndex
+        
+        server, api_url = start_stub_server({'730': make_stub_pages('730', 2)})
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                index_path = os.path.join(tmp_dir, 'seen.idx')
+                first = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'),
+                                           seen_index=SeenReviewIndex(index_path))
+                first.scrape_reviews_http(num_pages=1)
+                # 체크포인트 없이 수집한 리뷰는 저장하기 전에 실패하면 다음 실행에서 다시 수집되어야 함
+                assert len(SeenReviewIndex(index_path)) == 0
+                first.save_seen()
+                
+                # 새 프로세스처럼 인덱스를 파일에서 다시 로드
+                index = SeenReviewIndex(index_path)
+                assert len(index) == 3 and '730000000' in index
+                second = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'),
+                                            seen_index=index)
+                second.scrape_reviews_http(num_pages=2)
+                second.close()
+                second.save_seen()
+                assert os.path.getsize(index_path) == 6 * 8
+                
+                # 체크포인트를 쓰면 리뷰가 디스크에 남으므로 페이지마다 인덱스도 바로 기록
+                checkpointed = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'),
+                                                  seen_index=SeenReviewIndex(os.path.join(tmp_dir, 'cp.idx')))
+                checkpointed.scrape_reviews_http(num_pages=1, checkpoint=ScrapeCheckpoint('730', tmp_dir))
+                checkpointed.close()
+                assert len(SeenReviewIndex(os.path.join(tmp_dir, 'cp.idx'))) == 3
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert first.reviews[0]['recommendationid'] == '730000000'
+        assert second.skipped_reviews == 3
+        assert [r['recommendationid'] for r in second.reviews] == ['730001000', '730001001', '730001002']
+        print(f"✓ 두 번째 실행에서 새 리뷰 {len(second.reviews)}개만 수집 ({second.skipped_reviews}개 건너뜀)")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 리뷰 ID 인덱스 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_delta_scrape():
+    """워터마크 기반 증분 스크래핑 테스트"""
+    print("\n=== 증분(delta) 스크래핑 테스트 ===")
+    try:
+        import tempfile
+        from finalcode import SteamReviewScraper
+        from scrape_state import DeltaWatermarks
+        
+        pages_by_game = {'730': make_stub_pages('730', 3)}
+        requested = []
+        server, api_url = start_stub_server(pages_by_game, requested)
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, 'watermarks.json')
+                first = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'))
+                first.scrape_reviews_delta(DeltaWatermarks(path))
+                
+                # 새 리뷰 2개가 최신순 첫 페이지 맨 앞에 추가된 상황
+                old_first_page = pages_by_game['730']['*']
+                new_reviews = [{'recommendationid': f"999{i}", 'review': f"New review {i}", 'voted_up': True,
+                                'timestamp_created': 1705276800 + (2 - i) * 60,
+                                'author': {'playtime_at_review': 10}} for i in range(2)]
+                pages_by_game['730']['*'] = dict(old_first_page, reviews=new_reviews + old_first_page['reviews'])
+                
+                requested.clear()
+                watermarks = DeltaWatermarks(path)
+                second = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'))
+                second.scrape_reviews_delta(watermarks)
+                second.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert len(first.reviews) == 9
+        assert requested == [('730', '*')], f"워터마크에서 중단되지 않음: {requested}"
+        assert [r['review_text'] for r in second.reviews] == ['New review 0', 'New review 1']
+        assert watermarks.get('730') == 1705276800 + 120
+        print(f"✓ 새 리뷰 {len(second.reviews)}개만 1페이지 요청으로 수집")
+        
+        # 첫 실행이 max_pages에서 멈춰도 워터마크를 저장하여 다음 실행부터 증분 수집
+        import asyncio
+        from async_scraper import AsyncScrapeEngine
+        
+        pages_by_game = {'570': make_stub_pages('570', 3), '440': make_stub_pages('440', 3)}
+        requested = []
+        server, api_url = start_stub_server(pages_by_game, requested)
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, 'watermarks.json')
+                first = SteamReviewScraper("570", "Test Game", api_url=api_url.format(game_id='570'))
+                first.scrape_reviews_delta(DeltaWatermarks(path), max_pages=1)
+                first_watermark = DeltaWatermarks(path).get('570')
+                
+                requested.clear()
+                repeat = SteamReviewScraper("570", "Test Game", api_url=api_url.format(game_id='570'))
+                repeat.scrape_reviews_delta(DeltaWatermarks(path), max_pages=1)
+                repeat_requests = list(requested)
+                
+                # 기존 워터마크까지 따라잡지 못한 실행은 워터마크를 유지 (중간 구간 보호)
+                watermarks = DeltaWatermarks(path)
+                watermarks.marks['570'] = first_watermark - 10 * 3600  # update()는 앞당기기만 하므로 직접 설정
+                watermarks.save()
+                behind = SteamReviewScraper("570", "Test Game", api_url=api_url.format(game_id='570'))
+                behind.scrape_reviews_delta(DeltaWatermarks(path), max_pages=1)
+                behind_watermark = DeltaWatermarks(path).get('570')
+                for scraper in (first, repeat, behind):
+                    scraper.close()
+                
+                async def _first_run():
+                    engine = AsyncScrapeEngine(requests_per_second=None, api_url=api_url,
+                                               watermarks=DeltaWatermarks(path))
+                    async with engine:
+                        return await engine.scrape_all(['440'], num_pages=1)
+                
+                async_results = asyncio.run(_first_run())
+                async_watermark = DeltaWatermarks(path).get('440')
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert len(first.reviews) == 3 and first_watermark == 1705276800, first_watermark
+        assert repeat.reviews == [] and repeat_requests == [('570', '*')], repeat_requests
+        assert behind_watermark == first_watermark - 10 * 3600, behind_watermark
+        assert len(async_results['440']) == 3 and async_watermark == 1705276800, async_watermark
+        print("✓ 첫 실행은 max_pages에서 멈춰도 워터마크 저장, 기존 워터마크 미도달 시 유지")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 증분 스크래핑 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_selenium_batch_extraction():
+    """스크롤당 한 번의 스크립트 호출로 리뷰를 추출하는지 테스트 (가짜 WebDriver 사용)"""
+    print("\n=== Selenium 일괄 추출 테스트 ===")
+    try:
+        from finalcode import SteamReviewScraper, EXTRACT_REVIEWS_JS
+        
+        class FakeDriver:
+            """스크롤마다 리뷰 2개씩 로드되는 페이지를 흉내 내는 WebDriver"""
+            def __init__(self, total):
+                self.total = total
+                self.extracted = 0
+                self.calls = 0
+            
+            def get(self, url):
+                pass
+            
+            def find_element(self, by, value):
+                return object()
+            
+            def execute_script(self, script, *args):
+                self.calls += 1
+                if script != EXTRACT_REVIEWS_JS:
+                    return 1000
+                limit = args[0]
+                batch = []
+                while self.extracted < self.total and len(batch) < min(limit, 2):
+                    i = self.extracted
+                    batch.append({'text': f"  Review {i}  ", 'recommended': i % 2 == 0,
+                                  'hours': f"{i}.5 hrs on record", 'date': 'Posted: 15 January'})
+                    self.extracted += 1
+                return {'reviews': batch, 'height': 1000 + 100 * self.extracted}
+        
+        scraper = SteamReviewScraper("730", "Test Game")
+        scraper.driver = FakeDriver(total=5)
+        scraper.scrape_reviews_selenium(num_reviews=10, delay=0)
+        
+        assert [r['review_text'] for r in scraper.reviews] == [f"Review {i}" for i in range(5)]
+        assert scraper.reviews[1]['recommended'] is False and scraper.reviews[3]['playtime_at_review'] == 3.5
+        # 초기 스크롤 1회 + 스크롤당 대기 확인 1회와 추출 1회 (리뷰 2개씩 3회 + 종료 확인 1회)
+        assert scraper.driver.calls == 9, scraper.driver.calls
+        print(f"✓ {len(scraper.reviews)}개 리뷰를 WebDriver 호출 {scraper.driver.calls}회로 추출")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ Selenium 일괄 추출 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_driver_pool():
+    """WebDriver 풀의 대여/반납, 재사용 횟수 제한, 상태 확인 테스트 (가짜 WebDriver 사용)"""
+    print("\n=== WebDriver 풀 테스트 ===")
+    try:
+        from driver_pool import WebDriverPool
+        
+        class FakeDriver:
+            created = 0
+            
+            def __init__(self):
+                FakeDriver.created += 1
+                self.alive = True
+            
+            def execute_script(self, script):
+                if not self.alive:
+                    raise RuntimeError("session deleted")
+                return 1
+            
+            def quit(self):
+                self.alive = False
+        
+        pool = WebDriverPool(max_size=2, warm_size=1, max_uses=2, idle_timeout=60, factory=FakeDriver)
+        pool.prestart()
+        assert FakeDriver.created == 1
+        
+        # 미리 시작된 WebDriver 재사용
+        with pool.driver() as first:
+            pass
+        with pool.driver() as second:
+            assert second is first
+        # max_uses(2)회 사용 후 종료되고 새로 생성
+        assert not first.alive
+        with pool.driver() as third:
+            assert third is not first
+        
+        # 죽은 세션은 대여 전에 교체
+        third.alive = False
+        with pool.driver() as fourth:
+            assert fourth.alive and fourth is not third
+        
+        # 풀이 가득 차면 대기 후 시간 초과
+        a, b = pool.acquire(), pool.acquire()
+        try:
+            pool.acquire(timeout=0.1)
+            raise AssertionError("TimeoutError가 발생해야 합니다")
+        except TimeoutError:
+            pass
+        pool.release(a)
+        pool.release(b)
+        pool.close()
+        assert pool.stats()['total'] == 0
+        print(f"✓ WebDriver 풀 ({FakeDriver.created}개 생성으로 6회 대여 처리)")
+        
+        # 작업 취소 등 일반 예외는 반납, WebDriver 오류만 폐기
+        from jobs import JobCancelled
+        from selenium.common.exceptions import InvalidSessionIdException
+        pool = WebDriverPool(max_size=1, warm_size=1, max_uses=10, idle_timeout=60, factory=FakeDriver)
+        for error in (JobCancelled(), InvalidSessionIdException("invalid session id")):
+            try:
+                with pool.driver() as borrowed:
+                    raise error
+            except type(error):
+                pass
+            if isinstance(error, JobCancelled):
+                assert pool.stats()['idle'] == 1 and borrowed.alive
+            else:
+                assert pool.stats()['total'] == 0 and not borrowed.alive
+        pool.close()
+        print("✓ 작업 취소 시 WebDriver 반납, 세션 오류 시 폐기")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ WebDriver 풀 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_rate_limit_retry():
+    """스로틀링(429)과 일시적 오류 응답 후 재시도 및 감속 테스트"""
+    print("\n=== 적응형 속도 제한 / 재시도 테스트 ===")
+    try:
+        from finalcode import SteamReviewScraper
+        from rate_limiter import AdaptiveRateLimiter
+        
+        failures = {('730', '730+p1/='): [429, {'success': 2}]}
+        requested = []
+        server, api_url = start_stub_server({'730': make_stub_pages('730', 3)}, requested, failures)
+        limiter = AdaptiveRateLimiter(rate=50, burst=5, increase_step=0)
+        try:
+            scraper = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'),
+                                         rate_limiter=limiter)
+            scraper.retry_base_delay = 0.01
+            scraper.scrape_reviews_http(num_pages=5)
+            scraper.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert len(scraper.reviews) == 9, len(scraper.reviews)
+        assert requested.count(('730', '730+p1/=')) == 3
+        assert limiter.rate == 25, limiter.rate
+        print(f"✓ 429와 오류 응답 후 재시도하여 {len(scraper.reviews)}개 수집 (속도 50 → {limiter.rate:g} req/s)")
+        
+        # 재시도 대상: 연결 오류, 429/5xx, 잘린 JSON (일반 ValueError와 4xx는 바로 전달)
+        import json
+        import requests
+        from rate_limiter import call_with_retry, is_retryable
+        
+        def http_error(status):
+            response = requests.Response()
+            response.status_code = status
+            return requests.HTTPError(response=response)
+        
+        assert all(is_retryable(e) for e in [requests.ConnectionError(), http_error(429), http_error(503),
+                                              json.JSONDecodeError("truncated", '{"rev', 5)])
+        assert not any(is_retryable(e) for e in [ValueError("bad argument"), http_error(404)])
+        calls = []
+        try:
+            call_with_retry(lambda: calls.append(1) or int("not a number"), base_delay=0.01)
+            raise AssertionError("ValueError가 전달되어야 합니다")
+        except ValueError:
+            pass
+        assert len(calls) == 1, calls
+        print("✓ 일반 ValueError와 4xx는 재시도하지 않음")
+        
+        # 기본 속도(4 req/s, burst 4)의 공유 제한기가 먼저 만들어져 있으면 엔진의 값은 상한으로만 적용
+        import asyncio
+        import time
+        from async_scraper import AsyncScrapeEngine
+        from rate_limiter import ThrottledError
+        
+        async def _scrape(engine):
+            async with engine:
+                return await engine.scrape_all(['570'], num_pages=4)
+        
+        server, api_url = start_stub_server({'570': make_stub_pages('570', 4)}, [])
+        try:
+            shared = SteamReviewScraper("570", "Test Game", api_url=api_url.format(game_id='570')).rate_limiter
+            engine = AsyncScrapeEngine(requests_per_second=5, burst=1, api_url=api_url)
+            started = time.perf_counter()
+            results = asyncio.run(_scrape(engine))
+            elapsed = time.perf_counter() - started
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert len(results['570']) == 12
+        assert engine._limiter_for(api_url.format(game_id='570')) is shared
+        assert (shared.max_rate, shared.burst) == (4, 1), (shared.max_rate, shared.burst)
+        # burst 1, 4 req/s: 첫 요청 이후 0.25초 간격 (burst 4 그대로면 4페이지가 대기 없이 나감)
+        assert elapsed >= 0.55, elapsed
+        
+        # 마지막 시도의 429도 감속에 반영되고, 새 엔진은 다른 작업자의 감속 상태를 되돌리지 않음
+        def throttled():
+            raise ThrottledError("HTTP 429: 요청 속도 제한")
+        try:
+            call_with_retry(throttled, limiter=shared, max_retries=0)
+            raise AssertionError("ThrottledError가 전달되어야 합니다")
+        except ThrottledError:
+            pass
+        assert shared.rate == 2, shared.rate
+        faster = AsyncScrapeEngine(requests_per_second=50, api_url=api_url)
+        faster._limiter_for(api_url.format(game_id='570'))
+        assert (shared.rate, shared.max_rate, shared.burst) == (2, 4, 1), (shared.rate, shared.max_rate)
+        print(f"✓ 엔진 속도는 상한으로 적용: 4페이지 {elapsed:.2f}초, 감속 상태 유지 ({shared.rate:g} req/s)")
+        
+        # Selenium JSON 경로도 잘린 응답과 JSON이 없는 응답을 재시도해야 함
+        import json
+        import re
+        
+        class FakeDriver:
+            """cursor별 JSON 페이지를 <pre>로 렌더링하는 WebDriver (첫 두 번은 잘린 응답과 빈 페이지)"""
+            def __init__(self, pages):
+                self.pages = pages
+                self.failures = ['<pre>{"success": 1, "revi</pre>', '<html><body></body></html>']
+                self.loads = 0
+                self.page_source = ''
+            
+            def get(self, url):
+                self.loads += 1
+                cursor = re.search(r'cursor=([^&]*)', url).group(1)
+                body = json.dumps(self.pages[cursor])
+                self.page_source = self.failures.pop(0) if self.failures else f"<pre>{body}</pre>"
+            
+            def execute_script(self, script, *args):
+                return True
+        
+        events = []
+        scraper = SteamReviewScraper("730", "Test Game", rate_limiter=AdaptiveRateLimiter(rate=1000, burst=10),
+                                     progress=events.append)
+        scraper.retry_base_delay = 0.01
+        scraper.driver = FakeDriver(make_stub_pages('730', 2))
+        scraper.scrape_reviews(num_pages=5, delay=0)
+        assert len(scraper.reviews) == 6 and scraper.driver.loads == 4, (len(scraper.reviews), scraper.driver.loads)
+        # 페이지마다 진행 이벤트 전달 (작업 취소 확인 지점)
+        assert [(e['done'], e['reviews']) for e in events] == [(1, 3), (2, 6)], events
+        from jobs import JobCancelled
+        
+        def cancel(event):
+            raise JobCancelled()
+        
+        cancelled = SteamReviewScraper("730", "Test Game", rate_limiter=AdaptiveRateLimiter(rate=1000, burst=10),
+                                       progress=cancel)
+        cancelled.driver = FakeDriver(make_stub_pages('730', 2))
+        cancelled.driver.failures = []
+        try:
+            cancelled.scrape_reviews(num_pages=5, delay=0)
+            raise AssertionError("JobCancelled가 전달되어야 합니다")
+        except JobCancelled:
+            pass
+        assert cancelled.driver.loads == 1
+        print(f"✓ Selenium JSON 경로: 잘린 응답/빈 페이지 재시도 후 {len(scraper.reviews)}개 수집")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 속도 제한 / 재시도 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_streaming_api():
+    """페이지 단위 스트리밍 제너레이터 테스트"""
+    print("\n=== 스트리밍 API 테스트 ===")
+    try:
+        import asyncio
+        from finalcode import SteamReviewScraper
+        from async_scraper import AsyncScrapeEngine
+        
+        requested = []
+        pages_by_game = {game_id: make_stub_pages(game_id, 3) for game_id in ['730', '570']}
+        server, api_url = start_stub_server(pages_by_game, requested)
+        try:
+            scraper = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'))
+            stream = scraper.iter_reviews(num_pages=10)
+            first_page = next(stream)
+            # 첫 배치를 받은 시점에는 첫 페이지만 요청됨
+            assert len(first_page) == 3 and len(requested) == 1
+            total = len(first_page) + sum(len(batch) for batch in stream)
+            assert total == 9 and scraper.reviews == []
+            scraper.close()
+            
+            async def _consume():
+                counts = {}
+                async with AsyncScrapeEngine(max_concurrency=2, requests_per_second=None, api_url=api_url) as engine:
+                    async for game_id, batch in engine.stream_all(['730', '570'], num_pages=3, max_pending=1):
+                        counts[game_id] = counts.get(game_id, 0) + len(batch)
+                return counts
+            
+            counts = asyncio.run(_consume())
+            
+            # 큐가 가득 찬 상태에서 소비자가 중간에 멈춰도 스트림이 바로 닫혀야 함
+            early_games = {f"{i}": make_stub_pages(f"{i}", 3) for i in range(100, 110)}
+            pages_by_game.update(early_games)
+            
+            async def _stop_early():
+                async with AsyncScrapeEngine(max_concurrency=4, requests_per_second=None, api_url=api_url) as engine:
+                    stream = engine.stream_all(list(early_games), num_pages=3, max_pending=2)
+                    async for _ in stream:
+                        await asyncio.sleep(0.2)  # 나머지 생산자가 큐를 채울 때까지 대기
+                        break
+                    await asyncio.wait_for(stream.aclose(), timeout=5)
+            
+            asyncio.run(_stop_early())
+            
+            # 한 게임의 생산자가 예상하지 못한 오류로 멈추면 다른 게임 배치를 모두 받은 뒤 그 오류가 전달됨
+            broken = make_stub_pages('2', 3)
+            broken['*']['reviews'][0]['author'] = None
+            pages_by_game.update({'1': make_stub_pages('1', 3), '2': broken})
+            
+            async def _consume_broken():
+                received = []
+                async with AsyncScrapeEngine(requests_per_second=None, api_url=api_url) as engine:
+                    try:
+                        async for game_id, batch in engine.stream_all(['1', '2'], num_pages=3):
+                            received.append((game_id, len(batch)))
+                    except AttributeError:
+                        return received
+                raise AssertionError(f"생산자 오류가 전달되어야 합니다: {received}")
+            
+            assert asyncio.run(_consume_broken()) == [('1', 3)] * 3
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert counts == {'730': 9, '570': 9}, counts
+        print(f"✓ 동기 제너레이터 {total}개, 비동기 스트림 {sum(counts.values())}개 리뷰 (self.reviews 미사용)")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 스트리밍 API 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_batch_cleaning():
+    """일괄 텍스트 정리가 NLTK word_tokenize 기반 정리와 같은 결과를 내는지 테스트"""
+    print("\n=== 일괄 텍스트 정리 테스트 ===")
+    try:
+        import re
+        import pandas as pd
+        import nltk
+        from nltk.tokenize import NLTKWordTokenizer
+        from finalcode import SentimentAnalyzer
+        
+        analyzer = SentimentAnalyzer()
+        try:
+            nltk.data.find('tokenizers/punkt_tab')
+            from nltk.tokenize import word_tokenize
+        except LookupError:
+            # punkt가 없으면 word_tokenize의 단어 분리 단계(Treebank)와 비교
+            word_tokenize = NLTKWordTokenizer().tokenize
+        
+        def reference_clean(text):
+            # 기존 clean_text 구현
+            if not isinstance(text, str):
+                return ""
+            text = re.sub(r'[^a-zA-Z\s]', '', text.lower())
+            tokens = word_tokenize(text)
+            return ' '.join(word for word in tokens if word not in analyzer.stop_words and len(word) > 2)
+        
+        texts = [
+            "This game is AMAZING!!! 10/10 would play again.",
+            "I cannot stop playing, gonna buy the DLC. Wanna join?",
+            "Gotta say... lemme think, gimme a minute. CANNOT wait",
+            "Don't buy it. It's broken; won't launch.\nDr. Smith agrees, e.g. U.S.A. servers",
+            "Café straße İstanbul\ttabs\u00a0nbsp\u2003em-space wanna",
+            "", "   ", None, 3.5, "wanna",
+        ]
+        series = pd.Series(texts, index=range(10, 20))
+        cleaned = analyzer.clean_texts(series)
+        expected = [reference_clean(text) for text in texts]
+        assert list(cleaned) == expected, (list(cleaned), expected)
+        assert list(cleaned.index) == list(series.index)
+        assert [analyzer.clean_text(text) for text in texts] == expected
+        assert analyzer.clean_texts(texts).tolist() == expected
+        
+        # 토큰 캐시는 상한을 넘으면 비워지고, 결과는 그대로
+        analyzer.MAX_CACHED_TOKENS = 5
+        assert analyzer.clean_texts(texts * 3).tolist() == expected * 3
+        assert len(analyzer._token_cache) <= 5 + max(len(str(text).split()) for text in texts)
+        print(f"✓ {len(texts)}개 텍스트의 일괄 정리 결과가 기존 clean_text와 일치")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 일괄 텍스트 정리 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_parallel_analysis():
+    """프로세스 풀 감정 분석이 단일 프로세스 결과와 같은지 테스트"""
+    print("\n=== 병렬 감정 분석 테스트 ===")
+    try:
+        import pandas as pd
+        from finalcode import SentimentAnalyzer
+        
+        texts = ["Great game, love it!", "Terrible. Crashes constantly.", "", None,
+                 "It's okay I guess", "Best multiplayer ever, highly recommend"] * 7
+        df = pd.DataFrame({'review_text': texts, 'recommended': [True, False] * 21})
+        
+        analyzer = SentimentAnalyzer()
+        serial = analyzer.analyze_dataframe(df.copy())
+        parallel = analyzer.analyze_dataframe(df.copy(), n_jobs=2, chunk_size=10)
+        
+        assert list(parallel.columns) == list(serial.columns)
+        pd.testing.assert_frame_equal(parallel, serial)
+        print(f"✓ {len(df)}개 리뷰를 2개 프로세스로 분석한 결과가 단일 프로세스 결과와 일치")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 병렬 감정 분석 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_sentiment_cache():
+    """감정 점수 캐시 테스트 (LRU 제거, 디스크 캐시 재사용)"""
+    print("\n=== 감정 점수 캐시 테스트 ===")
+    try:
+        import tempfile
+        import pandas as pd
+        from finalcode import SentimentAnalyzer
+        from sentiment_cache import SentimentCache
+        
+        texts = ["good game", "Worst game ever", "Terrible servers, refund!", "good game", "10/10"] * 20
+        df = pd.DataFrame({'review_text': texts, 'recommended': [True] * len(texts)})
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'cache.sqlite')
+            expected = SentimentAnalyzer().analyze_dataframe(df.copy())
+            
+            cache = SentimentCache(max_entries=2, path=path)
+            analyzer = SentimentAnalyzer(cache=cache)
+            result = analyzer.analyze_dataframe(df.copy())
+            pd.testing.assert_frame_equal(result, expected)
+            # 서로 다른 정리된 텍스트 3개만 계산되고, 메모리에는 2개만 남음
+            assert cache.stats() == {'hits': 0, 'misses': 3, 'entries': 2}, cache.stats()
+            assert analyzer.analyze_sentiment("good game") == analyzer.sia.polarity_scores("good game")
+            cache.close()
+            
+            # 재시작 후에는 디스크 캐시에서 모두 적중
+            cache = SentimentCache(path=path)
+            result = SentimentAnalyzer(cache=cache).analyze_dataframe(df.copy())
+            pd.testing.assert_frame_equal(result, expected)
+            assert cache.stats()['hits'] == 3 and cache.stats()['misses'] == 0, cache.stats()
+            cache.close()
+        print("✓ 중복 텍스트는 한 번만 계산되고 재시작 후 디스크 캐시에서 재사용")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 감정 점수 캐시 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_batch_vader():
+    """일괄 VADER 엔진이 NLTK polarity_scores와 같은 점수를 내는지 테스트"""
+    print("\n=== 일괄 VADER 엔진 테스트 ===")
+    try:
+        import random
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        from vader_batch import BatchVader
+        
+        sia = SentimentIntensityAnalyzer()
+        engine = BatchVader.from_analyzer(sia)
+        
+        # 규칙별 사례: 부스터/대문자/부정/never so/least/but/kind of/관용구/구두점 강조/반복 토큰/이모티콘
+        texts = [
+            "The game is very good", "The game is VERY GOOD", "GREAT game, bad servers",
+            "This is not good", "I don't like it", "never so good", "never this bad",
+            "at least good", "least good", "very least good", "it is the least fun",
+            "good graphics but terrible gameplay", "BUT why", "kind of good", "sort of bad, kinda fun",
+            "the shit", "this game is the bomb", "yeah right, great game", "it cut the mustard fine",
+            "Amazing!!!", "Bad???", "Good?!?", "good!!!!!! great!!!", "(nice) :) :( good. !good ?bad --great",
+            "good bad good bad good", "fun FUN fun boring", "I hardly ever lose", "not bad at all",
+            "", "   ", "a", "!!", "x y z", "don't isn't can't won't", "no way this is good.",
+        ]
+        random.seed(0)
+        vocab = [w for t in texts for w in t.split()] + list(sia.lexicon)[:2000:20]
+        texts += [' '.join(random.choice(vocab) for _ in range(random.randint(1, 25))) for _ in range(2000)]
+        
+        scores = engine.score_batch(texts)
+        for k, text in enumerate(texts):
+            expected = sia.polarity_scores(text)
+            got = {name: scores[name][k] for name in ('compound', 'pos', 'neu', 'neg')}
+            assert got == {name: expected[name] for name in got}, (text, got, expected)
+        assert scores['compound'].dtype.name == 'float64' and len(scores['neg']) == len(texts)
+        print(f"✓ {len(texts)}개 텍스트의 점수가 NLTK VADER와 일치")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 일괄 VADER 엔진 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_columnar_scores():
+    """점수 컬럼이 float 배열, 레이블이 범주형으로 생성되고 행별 분석과 같은 값인지 테스트"""
+    print("\n=== 컬럼형 점수 출력 테스트 ===")
+    try:
+        import pandas as pd
+        from finalcode import SentimentAnalyzer
+        
+        texts = ["Great game, love it!", "Terrible. Crashes constantly.", "", None,
+                 "It's okay I guess", "not bad", "Best multiplayer ever, highly recommend"]
+        analyzer = SentimentAnalyzer()
+        df = analyzer.analyze_dataframe(pd.DataFrame({'review_text': texts}))
+        
+        columns = {'compound_score': 'compound', 'positive_score': 'pos',
+                   'neutral_score': 'neu', 'negative_score': 'neg'}
+        for column, key in columns.items():
+            assert df[column].dtype == 'float64', (column, df[column].dtype)
+            expected = [analyzer.analyze_sentiment(text)[key] for text in df['cleaned_text']]
+            assert df[column].tolist() == expected, column
+        
+        assert isinstance(df['sentiment_label'].dtype, pd.CategoricalDtype)
+        expected_labels = ['positive' if x >= 0.05 else ('negative' if x <= -0.05 else 'neutral')
+                           for x in df['compound_score']]
+        assert df['sentiment_label'].astype(str).tolist() == expected_labels
+        print(f"✓ 점수 컬럼 float64, 레이블 범주형 ({df['sentiment_label'].value_counts().to_dict()})")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 컬럼형 점수 출력 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_linear_backend():
+    """해시 BoW 선형 모델 엔진 학습/저장/선택 및 비교 스크립트 테스트"""
+    print("\n=== 선형 감정 모델 엔진 테스트 ===")
+    try:
+        import random
+        import tempfile
+        import pandas as pd
+        from finalcode import SentimentAnalyzer
+        from linear_sentiment import LinearSentimentModel
+        from benchmark_backends import run_benchmark
+        
+        random.seed(0)
+        positive = "great fun amazing love best awesome recommend".split()
+        negative = "terrible boring broken waste crash refund awful".split()
+        filler = "game play time friends graphics servers story price".split()
+        rows = []
+        for i in range(600):
+            recommended = i % 3 != 0
+            words = random.sample(positive if recommended else negative, 2) + random.sample(filler, 4)
+            random.shuffle(words)
+            rows.append({'review_text': ' '.join(words) + '!', 'recommended': recommended})
+        df = pd.DataFrame(rows)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            analyzer = SentimentAnalyzer(linear_model=os.path.join(tmp_dir, 'missing.npz'))
+            try:
+                analyzer.analyze_dataframe(df.copy(), backend='linear')
+                raise AssertionError("모델 파일이 없으면 FileNotFoundError가 발생해야 합니다")
+            except FileNotFoundError:
+                pass
+            try:
+                analyzer.score_batch(['good'], backend='unknown')
+                raise AssertionError("알 수 없는 엔진은 ValueError가 발생해야 합니다")
+            except ValueError:
+                pass
+            
+            cleaned = analyzer.clean_texts(df['review_text']).tolist()
+            model_path = os.path.join(tmp_dir, 'model.npz')
+            LinearSentimentModel().fit(cleaned, df['recommended']).save(model_path)
+            
+            analyzer = SentimentAnalyzer(linear_model=model_path)
+            result = analyzer.analyze_dataframe(df.copy(), backend='linear')
+            accuracy = ((result['compound_score'] >= 0) == result['recommended']).mean()
+            assert accuracy > 0.95, accuracy
+            assert result['compound_score'].dtype == 'float64'
+            assert analyzer.score_batch(['', 'great fun'], backend='linear')['compound'][0] == 0.0
+            
+            csv_path = os.path.join(tmp_dir, 'reviews.csv')
+            df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+            report = run_benchmark(csv_path, repeat=1)
+            assert report['test_reviews'] == 120 and 0 <= report['label_agreement'] <= 1
+        print(f"✓ 선형 모델 추천 여부 정확도 {accuracy * 100:.1f}%, "
+              f"VADER와 레이블 일치율 {report['label_agreement'] * 100:.1f}%")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 선형 감정 모델 엔진 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_lazy_nltk_loading():
+    """import 시 NLTK를 불러오지 않고, 데이터가 없으면 바로 오류가 나는지 테스트"""
+    print("\n=== NLTK 지연 로드 테스트 ===")
+    try:
+        import subprocess
+        import tempfile
+        import time
+        import nltk_resources
+        
+        # finalcode import는 NLTK를 불러오거나 내려받지 않음
+        output = subprocess.run(
+            [sys.executable, '-c', "import sys, finalcode; print('nltk' in sys.modules)"],
+            capture_output=True, text=True, timeout=60, cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        assert output.returncode == 0, output.stderr
+        assert output.stdout.strip().splitlines()[-1] == 'False', output.stdout
+        
+        with tempfile.TemporaryDirectory() as empty_dir:
+            assert nltk_resources.missing_resources(paths=[empty_dir]) == ['stopwords', 'vader_lexicon']
+            start = time.monotonic()
+            try:
+                nltk_resources.require(paths=[empty_dir])
+                raise AssertionError("데이터가 없으면 NLTKResourceError가 발생해야 합니다")
+            except nltk_resources.NLTKResourceError as e:
+                assert 'setup_nltk.py' in str(e)
+            assert time.monotonic() - start < 1.0
+        
+        assert nltk_resources.english_stopwords() is nltk_resources.english_stopwords()
+        print("✓ import 시 NLTK 미사용, 데이터가 없으면 설치 명령과 함께 즉시 오류")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ NLTK 지연 로드 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_shared_analyzer():
+    """Flask 앱이 감정 분석기를 한 번만 만들어 공유하고 준비 상태를 알려주는지 테스트"""
+    print("\n=== 공유 감정 분석기 테스트 ===")
+    try:
+        import time
+        import threading
+        import pandas as pd
+        web_app = import_web_app()
+        
+        client = web_app.app.test_client()
+        response = client.get('/api/ready')
+        deadline = time.monotonic() + 30
+        while response.status_code == 503 and time.monotonic() < deadline:
+            assert response.get_json()['analyzer'] in ('warming', 'failed'), response.get_json()
+            time.sleep(0.05)
+            response = client.get('/api/ready')
+        assert response.status_code == 200 and response.get_json()['ready'], response.get_json()
+        
+        # 여러 스레드에서 동시에 요청해도 같은 분석기를 사용
+        shared = web_app.get_analyzer()
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(web_app.get_analyzer())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(analyzer is shared for analyzer in seen)
+        
+        import tempfile
+        from dataset_store import DatasetStore
+        with tempfile.TemporaryDirectory() as tmp_dir, patched(web_app, dataset_store=DatasetStore(directory=tmp_dir)):
+            dataset_id = web_app.dataset_store.create(pd.DataFrame({'review_text': ['great fun', 'awful bugs'],
+                                                                    'recommended': [True, False]}))
+            result = client.post('/api/analyze', json={'dataset_id': dataset_id}).get_json()
+        assert result['success'], result
+        assert web_app.get_analyzer() is shared
+        print("✓ 워밍업 후 /api/ready 200, 요청 간에 같은 분석기 재사용")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 공유 감정 분석기 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_chunked_csv_analysis():
+    """CSV를 청크 단위로 분석한 결과와 요약 통계가 전체 분석과 같은지 테스트"""
+    print("\n=== 청크 단위 CSV 분석 테스트 ===")
+    try:
+        import tempfile
+        import pandas as pd
+        from finalcode import SentimentAnalyzer, SentimentSummary
+        
+        texts = ["Great game, love it!", "Terrible. Crashes constantly.", "", "It's okay I guess",
+                 "not bad", "Best multiplayer ever, highly recommend", "Waste of money", "meh"]
+        df = pd.DataFrame({'review_text': texts * 3, 'recommended': [True, False, True] * 8,
+                           'playtime_at_review': range(24)})
+        analyzer = SentimentAnalyzer()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_file = os.path.join(tmp_dir, 'reviews.csv')
+            output_file = os.path.join(tmp_dir, 'analyzed.csv')
+            df.to_csv(input_file, index=False, encoding='utf-8-sig')
+            
+            summary = analyzer.analyze_file(input_file, output_file, rows_per_chunk=5)
+            with open(output_file, 'rb') as f:
+                raw = f.read()
+            assert raw.startswith(b'\xef\xbb\xbf') and raw.count(b'\xef\xbb\xbf') == 1, "BOM은 한 번만"
+            assert raw.count(b'review_text') == 1, "헤더는 한 번만"
+            chunked = pd.read_csv(output_file, encoding='utf-8-sig')
+            
+            full = analyzer.analyze_dataframe(pd.read_csv(input_file, encoding='utf-8-sig'))
+            assert len(chunked) == len(full) == 24
+            assert chunked['compound_score'].tolist() == full['compound_score'].tolist()
+            assert chunked['sentiment_label'].tolist() == full['sentiment_label'].astype(str).tolist()
+            
+            expected = SentimentSummary().update(full).to_dict()
+            stats = summary.to_dict()
+            assert stats['total_reviews'] == 24 and stats['recommended'] == 16
+            assert stats['sentiment_distribution'] == expected['sentiment_distribution']
+            for key in ('avg_compound', 'avg_compound_recommended', 'avg_compound_not_recommended'):
+                assert abs(stats[key] - expected[key]) < 1e-12, key
+            assert abs(stats['avg_compound'] - full['compound_score'].mean()) < 1e-12
+            
+            try:
+                analyzer.analyze_file(input_file, input_file)
+                raise AssertionError("입력 파일을 덮어쓰면 안 됩니다")
+            except ValueError:
+                pass
+        print(f"✓ 5개씩 청크 분석 결과와 요약 통계가 전체 분석과 동일 ({stats['sentiment_distribution']})")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 청크 단위 CSV 분석 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_review_pipeline():
+    """스크래핑/정리/점수 계산 단계가 겹쳐 실행되고 큐 크기로 배압이 걸리는지 테스트"""
+    print("\n=== 리뷰 파이프라인 테스트 ===")
+    try:
+        import time
+        import pandas as pd
+        from finalcode import SentimentAnalyzer
+        from pipeline import ReviewPipeline
+        
+        texts = ["Great game, love it!", "Terrible. Crashes constantly.", "It's okay I guess", "not bad"]
+        pages = [[{'review_text': text, 'recommended': i % 2 == 0} for i, text in enumerate(texts)]
+                 for _ in range(6)]
+        produced = []
+        
+        def slow_pages(delay=0.1):
+            for page in pages:
+                time.sleep(delay)
+                produced.append(len(page))
+                yield page
+        
+        class SlowAnalyzer(SentimentAnalyzer):
+            def add_scores(self, df, *args, **kwargs):
+                time.sleep(0.1)
+                return super().add_scores(df, *args, **kwargs)
+        
+        # 결과는 전체를 한 번에 분석한 것과 같음
+        analyzer = SentimentAnalyzer()
+        result = ReviewPipeline(analyzer).run(slow_pages(0))
+        expected = analyzer.analyze_dataframe(pd.DataFrame([r for page in pages for r in page]))
+        assert result['compound_score'].tolist() == expected['compound_score'].tolist()
+        assert result['sentiment_label'].astype(str).tolist() == expected['sentiment_label'].astype(str).tolist()
+        
+        # 스크래핑과 점수 계산이 겹쳐 전체 시간이 두 단계의 합보다 짧음
+        pipeline = ReviewPipeline(SlowAnalyzer(), queue_size=1)
+        produced.clear()
+        ahead = []
+        for df in pipeline.iter_scored(slow_pages()):
+            ahead.append(len(produced) - len(ahead) - 1)
+        stats = pipeline.stats
+        assert stats['wall'] < stats['scrape'] + stats['score'] - 0.25, stats
+        # 점수 계산이 느려도 앞서 가져온 페이지는 큐 두 개 + 단계별 처리 중인 것으로 제한
+        assert max(ahead) <= 4, ahead
+        
+        # 중간에 멈추면 스크래핑도 멈춤
+        produced.clear()
+        stream = ReviewPipeline(SlowAnalyzer(), queue_size=1).iter_scored(slow_pages(0))
+        next(stream)
+        stream.close()
+        assert len(produced) < len(pages), produced
+        
+        # 스크래핑 단계의 예외는 소비하는 쪽에서 다시 발생
+        def failing_pages():
+            yield pages[0]
+            raise RuntimeError("network down")
+        try:
+            list(ReviewPipeline(analyzer).iter_scored(failing_pages()))
+            raise AssertionError("스크래핑 오류가 전달되어야 합니다")
+        except RuntimeError as e:
+            assert str(e) == "network down"
+        print(f"✓ 전체 {stats['wall']:.2f}초 (스크래핑 {stats['scrape']:.2f}초 + 점수 계산 {stats['score']:.2f}초 겹침), "
+              f"최대 {max(ahead)}페이지 앞섬")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 리뷰 파이프라인 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_job_manager():
+    """작업 관리자의 즉시 반환, 단계 연결, 취소, 대기열 제한 및 작업 API 테스트"""
+    print("\n=== 백그라운드 작업 테스트 ===")
+    try:
+        import time
+        import tempfile
+        import threading
+        import pandas as pd
+        from jobs import JobManager, JobQueueFull
+        
+        def wait(job, timeout=30):
+            deadline = time.monotonic() + timeout
+            while job.status in ('queued', 'running') and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return job.status
+        
+        manager = JobManager(max_workers=1, max_pending=2)
+        release = threading.Event()
+        
+        def blocking(job, params):
+            while not release.wait(0.01):
+                job.check_cancelled()
+            return 'released'
+        
+        running = manager.submit([('block', blocking)])
+        queued = manager.submit([('block', blocking)])
+        try:
+            manager.submit([('block', blocking)])
+            raise AssertionError("대기열이 가득 차면 JobQueueFull이 발생해야 합니다")
+        except JobQueueFull:
+            pass
+        
+        # 대기 중인 작업은 바로, 실행 중인 작업은 check_cancelled()에서 취소
+        assert manager.cancel(queued.id).status == 'cancelled'
+        manager.cancel(running.id)
+        assert wait(running) == 'cancelled'
+        
+        # 단계는 순서대로 실행되고, 실패하면 이후 단계는 실행하지 않음
+        calls = []
+        chain = manager.submit([('first', lambda job, p: calls.append('first') or p['x'] + 1),
+                                ('second', lambda job, p: calls.append('second') or job.result['first'] * 10)],
+                               {'x': 1})
+        assert wait(chain) == 'succeeded' and chain.result == {'first': 2, 'second': 20}
+        failing = manager.submit([('boom', lambda job, p: 1 / 0), ('never', lambda job, p: calls.append('never'))])
+        assert wait(failing) == 'failed' and failing.current_step == 'boom' and 'never' not in calls
+        manager.shutdown(wait=True)
+        print("✓ 작업 관리자: 단계 연결, 취소, 대기열 제한")
+        
+        # 웹 API: 분석 → 시각화를 하나의 작업으로 실행
+        web_app = import_web_app()
+        client = web_app.app.test_client()
+        from dataset_store import DatasetStore
+        assert client.post('/api/jobs', json={'steps': ['mine']}).status_code == 400
+        assert client.get('/api/jobs/unknown').status_code == 404
+        with tempfile.TemporaryDirectory() as tmp_dir, patched(web_app, dataset_store=DatasetStore(directory=tmp_dir)):
+            dataset_id = web_app.dataset_store.create(make_review_frame())
+            response = client.post('/api/jobs', json={'steps': ['analyze', 'visualize'], 'backend': 'vader',
+                                                      'dataset_id': dataset_id})
+            assert response.status_code == 202, response.get_json()
+            job_id = response.get_json()['job_id']
+            wait(web_app.job_manager.get(job_id), timeout=120)
+            job = client.get(f'/api/jobs/{job_id}').get_json()
+        assert job['status'] == 'succeeded', job
+        assert job['result']['analyze']['stats']['total_reviews'] == 3
+        assert 'sentiment_distribution.png' in job['result']['visualize']['images']
+        assert any(item['job_id'] == job_id for item in client.get('/api/jobs').get_json()['jobs'])
+        print("✓ /api/jobs: 202로 바로 반환, 분석 → 시각화 연결 작업 완료")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 백그라운드 작업 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_progress_events():
+    """스크래퍼/분석기/시각화의 진행 이벤트와 작업 이벤트 스트림(SSE) 테스트"""
+    print("\n=== 진행 이벤트 스트림 테스트 ===")
+    try:
+        import json
+        import tempfile
+        import pandas as pd
+        from finalcode import SteamReviewScraper, SentimentAnalyzer
+        from jobs import Job
+        
+        # 스크래퍼: 페이지마다 이벤트
+        events = []
+        server, api_url = start_stub_server({'730': make_stub_pages('730', 3)})
+        try:
+            scraper = SteamReviewScraper("730", "Test Game", api_url=api_url.format(game_id='730'),
+                                         progress=events.append)
+            scraper.scrape_reviews_http(num_pages=5)
+            scraper.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert [(e['stage'], e['done'], e['total'], e['unit'], e['reviews']) for e in events] == \
+            [('scrape', 1, 5, 'pages', 3), ('scrape', 2, 5, 'pages', 6), ('scrape', 3, 5, 'pages', 9)], events
+        
+        # 분석기: 청크마다 이벤트, 마지막에 감정 분포 포함
+        events = []
+        df = pd.DataFrame({'review_text': ['great fun', 'awful bugs', 'okay game', 'love it', 'meh']})
+        SentimentAnalyzer().analyze_dataframe(df, chunk_size=2, progress=events.append)
+        assert [e['done'] for e in events] == [2, 4, 5, 5], events
+        assert all(e['stage'] == 'analyze' and e['total'] == 5 for e in events)
+        assert sum(events[-1]['sentiment_distribution'].values()) == 5
+        
+        # 진행 콜백에서 취소 요청 확인
+        def cancelled_midway(job, params):
+            for i in range(3):
+                job.report({'done': i})
+                job._cancel_event.set()
+        job = Job([('step', cancelled_midway)])
+        job.run()
+        assert job.status == 'cancelled' and job.progress['done'] == 1, job.to_dict()
+        print("✓ 스크래핑 페이지별, 분석 청크별 진행 이벤트 및 진행 콜백에서의 취소")
+        
+        # 작업 이벤트 스트림: 분석 → 시각화
+        web_app = import_web_app()
+        client = web_app.app.test_client()
+        from dataset_store import DatasetStore
+        with tempfile.TemporaryDirectory() as tmp_dir, patched(web_app, dataset_store=DatasetStore(directory=tmp_dir)):
+            dataset_id = web_app.dataset_store.create(make_review_frame())
+            job_id = client.post('/api/jobs', json={'steps': ['analyze', 'visualize'],
+                                                    'dataset_id': dataset_id}).get_json()['job_id']
+            response = client.get(f'/api/jobs/{job_id}/events')
+            body = response.get_data(as_text=True)
+        assert response.mimetype == 'text/event-stream'
+        streamed = [json.loads(line[len('data: '):]) for line in body.splitlines() if line.startswith('data: ')]
+        kinds = [(e['type'], e.get('stage') or e.get('status') or e['step']) for e in streamed]
+        assert kinds[0] == ('status', 'running') and kinds[-1] == ('status', 'succeeded'), kinds
+        assert ('step', 'analyze') in kinds and ('step', 'visualize') in kinds
+        charts = [e for e in streamed if e['type'] == 'progress' and e['stage'] == 'visualize']
+        assert [e['done'] for e in charts] == list(range(1, 11)), charts
+        assert [e['seq'] for e in streamed] == sorted(e['seq'] for e in streamed)
+        
+        # 다시 연결하면 Last-Event-ID 이후 이벤트만 받음
+        resumed = client.get(f'/api/jobs/{job_id}/events', headers={'Last-Event-ID': str(streamed[-2]['seq'])})
+        resumed = [line for line in resumed.get_data(as_text=True).splitlines() if line.startswith('data: ')]
+        assert len(resumed) == 1 and json.loads(resumed[0][len('data: '):])['status'] == 'succeeded'
+        assert client.get(f'/api/jobs/{job_id}').get_json()['progress']['stage'] == 'visualize'
+        print(f"✓ SSE 스트림: 이벤트 {len(streamed)}개 (그래프 {len(charts)}개 진행), Last-Event-ID로 재개")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 진행 이벤트 스트림 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_dataset_store():
+    """데이터셋 저장소의 메모리 예산, LRU 디스크 내림/재로드 및 데이터셋별 웹 API 테스트"""
+    print("\n=== 데이터셋 저장소 테스트 ===")
+    try:
+        import tempfile
+        import pandas as pd
+        from dataset_store import DatasetStore
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            frames = [pd.DataFrame({'review_text': [f'review {i} {j}' for j in range(200)],
+                                    'compound_score': [float(i)] * 200}) for i in range(3)]
+            frames[0]['sentiment_label'] = pd.Categorical(['positive'] * 200,
+                                                          categories=['positive', 'neutral', 'negative'])
+            size = max(int(df.memory_usage(index=True, deep=True).sum()) for df in frames)
+            store = DatasetStore(max_bytes=size * 2, directory=tmp_dir)
+            ids = [store.create(df) for df in frames]
+            
+            # 예산을 넘으면 가장 오래 사용하지 않은 데이터셋을 디스크로 내림
+            stats = store.stats()
+            assert stats['in_memory'] == 2 and stats['spills'] == 1 and stats['memory_bytes'] <= size * 2, stats
+            assert os.path.exists(os.path.join(tmp_dir, ids[0], 'data.parquet'))
+            
+            # 다시 요청하면 디스크에서 그대로 불러오고, 대신 다른 데이터셋이 내려감
+            reloaded = store.get(ids[0])
+            pd.testing.assert_frame_equal(reloaded, frames[0])
+            assert isinstance(reloaded['sentiment_label'].dtype, pd.CategoricalDtype)
+            assert store.stats()['loads'] == 1 and store.stats()['spills'] == 2
+            pd.testing.assert_frame_equal(store.get(ids[1]), frames[1])
+            
+            # 잘못된 ID는 경로로 사용하지 않음
+            assert store.get('../etc') is None and store.get('0' * 32) is None
+            assert ids[2] in store and store.delete(ids[2]) and ids[2] not in store
+            
+            # 재시작 후에도 flush()한 데이터셋을 불러옴
+            store.flush()
+            pd.testing.assert_frame_equal(DatasetStore(directory=tmp_dir).get(ids[1]), frames[1])
+        print("✓ 메모리 예산 초과 시 LRU 디스크 내림, 요청 시 재로드")
+        
+        # 웹 API: 데이터셋마다 독립된 분석 결과와 이미지
+        web_app = import_web_app()
+        client = web_app.app.test_client()
+        with tempfile.TemporaryDirectory() as tmp_dir, patched(web_app, dataset_store=DatasetStore(directory=tmp_dir)):
+            first = web_app.dataset_store.create(make_review_frame())
+            second = web_app.dataset_store.create(make_review_frame().head(2))
+            
+            assert client.post('/api/analyze', json={}).status_code == 400
+            assert client.post('/api/visualize', json={'dataset_id': first}).status_code == 400
+            assert client.post('/api/analyze', json={'dataset_id': first}).get_json()['stats']['total_reviews'] == 3
+            assert client.post('/api/analyze', json={'dataset_id': second}).get_json()['stats']['total_reviews'] == 2
+            
+            data = client.get(f'/api/data?dataset_id={second}').get_json()
+            assert data['total_count'] == 2 and 'compound_score' in data['data'][0]
+            download = client.get(f'/api/download?dataset_id={first}')
+            assert download.status_code == 200
+            assert download.data.startswith(b'\xef\xbb\xbf') and download.data.count(b'\n') == 4
+            
+            result = client.post('/api/visualize', json={'dataset_id': first}).get_json()
+            assert result['success'] and 'sentiment_distribution.png' in result['images'], result
+            assert os.path.exists(os.path.join(tmp_dir, first, 'sentiment_distribution.png'))
+            image = client.get(result['image_urls'][0])
+            assert image.status_code == 200 and image.mimetype == 'image/png'
+            assert client.get(f'/api/datasets/{first}/images/data.parquet').status_code == 404
+            # 작업 디렉토리의 파일(리뷰 DB, 캐시 등)을 그대로 제공하던 이전 이미지 경로는 없음
+            assert client.get('/images/app.py').status_code == 404
+            
+            assert client.delete(f'/api/datasets/{first}').status_code == 200
+            assert client.get(f'/api/data?dataset_id={first}').status_code == 400
+            assert client.get(f'/api/data?dataset_id={second}').get_json()['total_count'] == 2
+        print("✓ 데이터셋 ID별 분석/조회/다운로드/시각화, 다른 데이터셋에 영향 없음")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 데이터셋 저장소 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_review_storage():
+    """Parquet 저장/읽기의 dtype 유지, 컬럼 선택, 청크 쓰기 및 CSV 내보내기 테스트"""
+    print("\n=== 리뷰 파일 저장 형식 테스트 ===")
+    try:
+        import tempfile
+        import time
+        import pandas as pd
+        from finalcode import SentimentAnalyzer
+        from review_storage import ReviewWriter, export_csv, iter_review_chunks, load_reviews, save_reviews
+        from visualization import VISUALIZATION_COLUMNS, load_data
+        
+        texts = ["Great game, love it!", "Terrible. Crashes constantly.", "It's okay I guess", "not bad"]
+        df = pd.DataFrame({'review_text': texts * 500, 'recommended': [True, False] * 1000,
+                           'playtime_at_review': [float(i % 97) for i in range(2000)],
+                           'date_posted': ['2024-01-15'] * 2000,
+                           'review_length': [len(t) for t in texts] * 500})
+        df = SentimentAnalyzer().analyze_dataframe(df)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parquet_file = os.path.join(tmp_dir, 'reviews.parquet')
+            csv_file = os.path.join(tmp_dir, 'reviews.csv')
+            save_reviews(df, parquet_file)
+            save_reviews(df, csv_file)
+            
+            # dtype(bool, float, 범주형 레이블)이 그대로 유지됨 (문자열 컬럼은 pandas 버전에 따라 str로 읽힘)
+            loaded = load_reviews(parquet_file)
+            pd.testing.assert_frame_equal(loaded, df, check_dtype=False)
+            for column in ('recommended', 'compound_score', 'playtime_at_review', 'review_length',
+                           'sentiment_label'):
+                assert loaded[column].dtype == df[column].dtype, column
+            assert not df['sentiment_label'].cat.categories.difference(
+                loaded['sentiment_label'].cat.categories).size
+            assert os.path.getsize(parquet_file) * 3 < os.path.getsize(csv_file), "Parquet이 훨씬 작아야 합니다"
+            print(f"✓ 저장/읽기 결과 동일, 파일 크기 Parquet {os.path.getsize(parquet_file)}B "
+                  f"/ CSV {os.path.getsize(csv_file)}B")
+            
+            # 컬럼 선택 (없는 컬럼은 무시), 그래프용 로드는 사용하는 컬럼만 읽음
+            projected = load_reviews(parquet_file, columns=['compound_score', 'missing'])
+            assert list(projected.columns) == ['compound_score']
+            chart_df = load_data(parquet_file)
+            assert list(chart_df.columns) == VISUALIZATION_COLUMNS
+            raw_df = load_data(csv_file, columns=['cleaned_text', 'recommended'])
+            assert list(raw_df.columns) == ['cleaned_text', 'recommended']
+            
+            def best_time(func):
+                best = None
+                for _ in range(3):
+                    start = time.perf_counter()
+                    func()
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                return best
+            
+            parquet_time = best_time(lambda: load_reviews(parquet_file))
+            csv_time = best_time(lambda: load_reviews(csv_file))
+            print(f"✓ 다시 읽기: Parquet {parquet_time * 1000:.1f}ms / CSV {csv_time * 1000:.1f}ms")
+            
+            # 청크 단위로 이어 쓴 파일과 CSV 내보내기
+            chunked_file = os.path.join(tmp_dir, 'chunked.parquet')
+            with ReviewWriter(chunked_file) as writer:
+                for start in range(0, len(df), 700):
+                    writer.write(df.iloc[start:start + 700])
+            pd.testing.assert_frame_equal(load_reviews(chunked_file), df, check_dtype=False)
+            exported = export_csv(chunked_file)
+            assert exported == os.path.join(tmp_dir, 'chunked.csv')
+            with open(exported, 'rb') as f:
+                raw = f.read()
+            assert raw.startswith(b'\xef\xbb\xbf') and raw.count(b'review_text') == 1
+            assert pd.read_csv(exported, encoding='utf-8-sig')['compound_score'].tolist() == \
+                df['compound_score'].tolist()
+            
+            # 첫 청크의 컬럼이 모두 비어 있어도 (CSV에서는 float NaN으로 읽힘) 이후 청크와 같은 스키마로 변환
+            sparse_csv = os.path.join(tmp_dir, 'sparse.csv')
+            sparse = pd.DataFrame({'review_text': ['a', 'b', 'great', 'bad'],
+                                   'cleaned_text': [None, None, 'great', 'bad'],
+                                   'sentiment_label': [None, None, 'positive', 'negative'],
+                                   'review_length': [1, 1, 5, 3],
+                                   'note': [None, None, 'edited', None]})
+            save_reviews(sparse, sparse_csv)
+            converted = os.path.join(tmp_dir, 'sparse.parquet')
+            with ReviewWriter(converted) as writer:
+                for chunk in iter_review_chunks(sparse_csv, rows_per_chunk=2):
+                    writer.write(chunk)
+            result = load_reviews(converted)
+            assert result['cleaned_text'].tolist()[2:] == ['great', 'bad'] and result['cleaned_text'][:2].isna().all()
+            assert result['sentiment_label'].dtype == 'category' and result['note'].tolist()[2] == 'edited'
+            assert result['review_length'].tolist() == [1, 1, 5, 3]
+        print("✓ 청크 쓰기와 CSV 내보내기 결과 동일 (첫 청크가 비어 있는 CSV 변환 포함)")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 리뷰 파일 저장 형식 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_review_db():
+    """SQLite 리뷰 저장소의 upsert, 인덱스 조회, 재시작 후 유지 및 저장소 기반 웹 API 테스트"""
+    print("\n=== 리뷰 저장소 테스트 ===")
+    try:
+        import tempfile
+        import pandas as pd
+        from finalcode import SentimentAnalyzer, SteamReviewScraper
+        from review_db import ReviewDatabase, review_key
+        
+        analyzer = SentimentAnalyzer()
+        scraped = make_review_frame()
+        scraped['recommendationid'] = ['101', '102', '103']
+        analyzed = analyzer.analyze_dataframe(scraped.copy())
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, 'reviews.sqlite')
+            review_db = ReviewDatabase(db_path)
+            assert review_db.upsert(scraped, game_id='730', game_name='Counter Strike 2') == 3
+            assert review_db.upsert(analyzed, game_id='730') == 3
+            assert review_db.upsert(make_review_frame(), game_id='570') == 3
+            assert review_db.count() == 6 and review_db.count('730', analyzed=True) == 3
+            
+            # 같은 키는 덮어씀: 원문이 그대로면 분석 결과 유지, 바뀌면 분석 결과 삭제
+            rescraped = scraped.copy()
+            rescraped.loc[0, 'review_text'] = 'great fun, edited'
+            review_db.upsert(rescraped, game_id='730')
+            assert review_db.count('730') == 3 and review_db.count('730', analyzed=True) == 2
+            rows = review_db.query('730', columns=['recommendationid', 'review_text', 'compound_score'])
+            edited = rows.set_index('recommendationid').loc['101']
+            assert edited['review_text'] == 'great fun, edited' and pd.isna(edited['compound_score'])
+            review_db.close()
+            
+            # 재시작 후에도 유지, 필요한 컬럼과 조건에 맞는 행만 조회
+            review_db = ReviewDatabase(db_path)
+            negative = review_db.query('730', columns=['review_text', 'recommended', 'sentiment_label'],
+                                       sentiment_label='negative')
+            assert list(negative.columns) == ['review_text', 'recommended', 'sentiment_label']
+            assert negative['review_text'].tolist() == ['awful bugs']
+            assert negative['recommended'].dtype == bool and negative['sentiment_label'].dtype == 'category'
+            assert review_db.count('730', recommended=True) == 2
+            assert review_db.count(date_from='2024-01-02', date_to='2024-01-02') == 2
+            assert review_db.query('570', limit=1, offset=1, columns=['date_posted'])['date_posted'].tolist() == \
+                ['2024-01-02']
+            # ID가 없는 리뷰는 게임/원문/플레이 시간 해시가 키
+            assert review_db.query('570', columns=['recommendationid'])['recommendationid'].tolist()[-1] == \
+                review_key(make_review_frame().iloc[0].to_dict(), '570')
+            assert review_db.games()[0] == {'game_id': '570', 'game_name': None, 'reviews': 3, 'analyzed': 0,
+                                            'latest_date': '2024-01-03'}
+            
+            # Selenium 리뷰: 페이지 날짜 표시는 ISO로 저장 (해석 불가면 NULL), 다시 수집해도 날짜와 무관하게 같은 키
+            dom_reviews = pd.DataFrame([
+                SteamReviewScraper.parse_dom_review({'text': 'fun', 'hours': '3.0 hrs', 'date': 'Posted: 3 March, 2023'}),
+                SteamReviewScraper.parse_dom_review({'text': 'meh', 'hours': '1 hrs', 'date': 'Posted: sometime'})
+            ])
+            assert dom_reviews['date_posted'].tolist()[0] == '2023-03-03' and pd.isna(dom_reviews['date_posted'][1])
+            assert review_db.upsert(dom_reviews, game_id='440') == 2
+            redated = dom_reviews.assign(date_posted=['Posted: 3 March, 2023', '2024-01-02 10:00:00'],
+                                         playtime_at_review=[3, 1])
+            review_db.upsert(redated, game_id='440')
+            stored_dates = review_db.query('440', columns=['date_posted'])['date_posted'].tolist()
+            assert review_db.count('440') == 2 and stored_dates == ['2024-01-02', '2023-03-03'], stored_dates
+            assert review_key({'review_text': 'fun', 'playtime_at_review': 3.0}, '440') != \
+                review_key({'review_text': 'fun', 'playtime_at_review': 3.0}, '570')
+            
+            # 원문과 플레이 시간이 같은 짧은 리뷰도 리뷰 ID나 작성자가 다르면 각각 저장
+            same_text = pd.DataFrame([
+                SteamReviewScraper.parse_dom_review({'text': 'good game', 'hours': '2 hrs', 'author': author, 'id': review_id})
+                for author, review_id in [('https://steamcommunity.com/id/a/', None),
+                                          ('https://steamcommunity.com/profiles/7656/', None),
+                                          (None, '9001'), (None, '9001')]
+            ])
+            assert review_db.upsert(same_text, game_id='440') == 3
+            assert review_db.count('440') == 5
+            review_db.delete_game('440')
+            
+            # 필터 조회는 인덱스를 사용
+            with review_db._lock:
+                plan = review_db._db.execute(
+                    "EXPLAIN QUERY PLAN SELECT review_text FROM reviews WHERE game_id = ? AND sentiment_label = ?",
+                    ('730', 'negative')).fetchall()
+            assert any('idx_reviews_game_label' in row[-1] for row in plan), plan
+            review_db.close()
+        print("✓ 일괄 upsert, 원문 변경 시 분석 결과 무효화, 재시작 후 유지, 인덱스 조회")
+        
+        # 웹 API: 스크래핑/분석 결과 누적, 저장소 조회와 시각화
+        web_app = import_web_app()
+        from dataset_store import DatasetStore
+        client = web_app.app.test_client()
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+            patched(web_app, dataset_store=DatasetStore(directory=tmp_dir), review_db=ReviewDatabase(':memory:')):
+            frame = make_review_frame()
+            frame['game_id'] = '730'
+            dataset_id = web_app.dataset_store.create(frame)
+            assert client.post('/api/analyze', json={'dataset_id': dataset_id}).status_code == 200
+            assert web_app.review_db.count('730', analyzed=True) == 3
+            
+            data = client.get('/api/data?game_id=730&recommended=true&limit=1').get_json()
+            assert data['total_count'] == 2 and data['sample_count'] == 1
+            assert data['data'][0]['date_posted'] == '2024-01-03' and data['data'][0]['recommended'] is True
+            assert client.get('/api/data?game_id=730&sentiment_label=bad').status_code == 400
+            assert client.get('/api/games').get_json()['games'][0]['analyzed'] == 3
+            
+            assert client.post('/api/visualize', json={'game_id': '999'}).status_code == 400
+            result = client.post('/api/visualize', json={'game_id': '730'}).get_json()
+            assert result['success'] and 'sentiment_distribution.png' in result['images'], result
+            stored = web_app.dataset_store.get(result['dataset_id'])
+            assert set(stored.columns) <= set(web_app.VISUALIZATION_COLUMNS) and len(stored) == 3
+            web_app.review_db.close()
+        print("✓ 분석 결과 저장, 조건 조회, 저장소 기반 시각화")
+        
+        return True
+    except Exception as e:
+        print(f"\n✗ 리뷰 저장소 테스트 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     """메인 테스트 함수"""
     print("=" * 50)
@@ -172,6 +1814,30 @@ def main():
     results.append(("NLTK 데이터", test_nltk_data()))
     results.append(("클래스", test_classes()))
     results.append(("샘플 데이터 파이프라인", test_sample_data()))
+    results.append(("HTTP API 스크래핑", test_http_scrape()))
+    results.append(("비동기 다중 게임 스크래핑", test_async_scrape()))
+    results.append(("체크포인트 재개", test_checkpoint_resume()))
+    results.append(("리뷰 ID 인덱스", test_seen_index()))
+    results.append(("증분 스크래핑", test_delta_scrape()))
+    results.append(("Selenium 일괄 추출", test_selenium_batch_extraction()))
+    results.append(("WebDriver 풀", test_driver_pool()))
+    results.append(("적응형 속도 제한 / 재시도", test_rate_limit_retry()))
+    results.append(("스트리밍 API", test_streaming_api()))
+    results.append(("일괄 텍스트 정리", test_batch_cleaning()))
+    results.append(("병렬 감정 분석", test_parallel_analysis()))
+    results.append(("감정 점수 캐시", test_sentiment_cache()))
+    results.append(("일괄 VADER 엔진", test_batch_vader()))
+    results.append(("컬럼형 점수 출력", test_columnar_scores()))
+    results.append(("선형 감정 모델 엔진", test_linear_backend()))
+    results.append(("NLTK 지연 로드", test_lazy_nltk_loading()))
+    results.append(("공유 감정 분석기", test_shared_analyzer()))
+    results.append(("청크 단위 CSV 분석", test_chunked_csv_analysis()))
+    results.append(("리뷰 파이프라인", test_review_pipeline()))
+    results.append(("백그라운드 작업", test_job_manager()))
+    results.append(("진행 이벤트 스트림", test_progress_events()))
+    results.append(("데이터셋 저장소", test_dataset_store()))
+    results.append(("리뷰 파일 저장 형식", test_review_storage()))
+    results.append(("리뷰 저장소", test_review_db()))
     
     # 결과 요약
     print("\n" + "=" * 50)
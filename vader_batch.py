@@ -0,0 +1,285 @@
+"""
+여러 텍스트를 한 번에 처리하는 VADER 점수 계산 엔진
+NLTK SentimentIntensityAnalyzer.polarity_scores와 같은 규칙을 같은 순서로 적용하되,
+사전/규칙 표는 한 번만 준비하고 토큰별 정보(소문자, 사전 값, 부스터, 부정어)는 캐시하여 재사용합니다.
+"""
+
+import math
+import string
+
+import numpy as np
+
+SCORE_COLUMNS = ('compound', 'pos', 'neu', 'neg')
+
+# VADER가 구두점 제거에 사용하는 문자 집합 (string.punctuation)
+_PUNCTUATION = frozenset(string.punctuation)
+
+
+class BatchVader:
+    """NLTK VADER와 같은 점수를 내는 일괄 처리 엔진"""
+
+    # 토큰 캐시가 이 크기를 넘으면 비움 (메모리 상한)
+    MAX_CACHED_TOKENS = 500000
+
+    def __init__(self, lexicon, constants):
+        """
+        Args:
+            lexicon: {소문자 단어: 감정 값} 사전 (SentimentIntensityAnalyzer.lexicon)
+            constants: nltk.sentiment.vader.VaderConstants
+        """
+        self.lexicon = lexicon
+        self.boosters = constants.BOOSTER_DICT
+        self.negate = frozenset(constants.NEGATE)
+        self.idioms = constants.SPECIAL_CASE_IDIOMS
+        self.punc_list = frozenset(constants.PUNC_LIST)
+        self.b_decr = constants.B_DECR
+        self.c_incr = constants.C_INCR
+        self.n_scalar = constants.N_SCALAR
+        # 관용구/부스터 바이그램에 등장하는 단어 (텍스트에 하나도 없으면 관용구 검사 생략)
+        phrases = list(self.idioms) + [key for key in self.boosters if ' ' in key]
+        self.idiom_words = frozenset(word for phrase in phrases for word in phrase.split())
+        self._tokens = {}
+        self._infos = {}
+
+    @classmethod
+    def from_analyzer(cls, sia):
+        """SentimentIntensityAnalyzer의 사전과 상수로 엔진 생성"""
+        return cls(sia.lexicon, sia.constants)
+
+    def _strip_token(self, raw):
+        """
+        SentiText._words_and_emoticons와 같은 토큰 정리
+        PUNC_LIST의 구두점 하나가 앞이나 뒤에만 붙은 단어는 구두점을 떼고, 한 글자 토큰은 버림 ('' 반환)
+        """
+        n = len(raw)
+        if n <= 1:
+            return ''
+        lead = 0
+        while lead < n and raw[lead] in _PUNCTUATION:
+            lead += 1
+        if lead:
+            word = raw[lead:]
+            if len(word) > 1 and raw[:lead] in self.punc_list and not any(c in _PUNCTUATION for c in word):
+                return word
+            return raw
+        trail = n
+        while trail > 0 and raw[trail - 1] in _PUNCTUATION:
+            trail -= 1
+        if trail < n:
+            word = raw[:trail]
+            if len(word) > 1 and raw[trail:] in self.punc_list and not any(c in _PUNCTUATION for c in word):
+                return word
+        return raw
+
+    def _token_info(self, token):
+        """(소문자, 대문자 여부, 사전 값 또는 None, 부스터 값 또는 None, 부정어 여부)"""
+        lower = token.lower()
+        return (
+            lower,
+            token.isupper(),
+            self.lexicon.get(lower),
+            self.boosters.get(lower),
+            lower in self.negate or "n't" in lower
+        )
+
+    def _idioms_check(self, valence, words, i):
+        """SentimentIntensityAnalyzer._idioms_check와 같은 관용구/부스터 바이그램 처리"""
+        idioms = self.idioms
+        onezero = f"{words[i - 1]} {words[i]}"
+        twoonezero = f"{words[i - 2]} {words[i - 1]} {words[i]}"
+        twoone = f"{words[i - 2]} {words[i - 1]}"
+        threetwoone = f"{words[i - 3]} {words[i - 2]} {words[i - 1]}"
+        threetwo = f"{words[i - 3]} {words[i - 2]}"
+        for seq in (onezero, twoonezero, twoone, threetwoone, threetwo):
+            if seq in idioms:
+                valence = idioms[seq]
+                break
+        if len(words) - 1 > i:
+            zeroone = f"{words[i]} {words[i + 1]}"
+            if zeroone in idioms:
+                valence = idioms[zeroone]
+        if len(words) - 1 > i + 1:
+            zeroonetwo = f"{words[i]} {words[i + 1]} {words[i + 2]}"
+            if zeroonetwo in idioms:
+                valence = idioms[zeroonetwo]
+        if threetwo in self.boosters or twoone in self.boosters:
+            valence = valence + self.b_decr
+        return valence
+
+    def _sentiments(self, text):
+        """텍스트의 토큰별 감정 값 리스트 (polarity_scores의 but 규칙 적용 전까지와 동일)"""
+        tokens_cache = self._tokens
+        infos_cache = self._infos
+        if len(infos_cache) > self.MAX_CACHED_TOKENS:
+            tokens_cache.clear()
+            infos_cache.clear()
+
+        words = []
+        infos = []
+        for raw in text.split():
+            word = tokens_cache.get(raw)
+            if word is None:
+                word = tokens_cache[raw] = self._strip_token(raw)
+            if not word:
+                continue
+            info = infos_cache.get(word)
+            if info is None:
+                info = infos_cache[word] = self._token_info(word)
+            words.append(word)
+            infos.append(info)
+
+        n = len(words)
+        allcaps = sum(1 for info in infos if info[1])
+        is_cap_diff = 0 < n - allcaps < n
+        check_idioms = n > 3 and any(info[0] in self.idiom_words for info in infos)
+        c_incr = self.c_incr
+        n_scalar = self.n_scalar
+
+        # 반복된 토큰은 NLTK와 같이 첫 등장 위치의 문맥으로 계산
+        first_index = {}
+        for idx, word in enumerate(words):
+            if word not in first_index:
+                first_index[word] = idx
+
+        sentiments = []
+        for word in words:
+            i = first_index[word]
+            lower, is_upper, lex_value, booster, _ = infos[i]
+            if (i < n - 1 and lower == "kind" and infos[i + 1][0] == "of") or booster is not None:
+                sentiments.append(0)
+                continue
+            if lex_value is None:
+                sentiments.append(0)
+                continue
+
+            valence = lex_value
+            if is_upper and is_cap_diff:
+                if valence > 0:
+                    valence += c_incr
+                else:
+                    valence -= c_incr
+
+            for start_i in range(3):
+                if i > start_i and infos[i - (start_i + 1)][2] is None:
+                    prev = infos[i - (start_i + 1)]
+                    # scalar_inc_dec
+                    s = 0.0
+                    if prev[3] is not None:
+                        s = prev[3]
+                        if valence < 0:
+                            s *= -1
+                        if prev[1] and is_cap_diff:
+                            if valence > 0:
+                                s += c_incr
+                            else:
+                                s -= c_incr
+                    if start_i == 1 and s != 0:
+                        s = s * 0.95
+                    if start_i == 2 and s != 0:
+                        s = s * 0.9
+                    valence = valence + s
+
+                    # _never_check
+                    if start_i == 0:
+                        if infos[i - 1][4]:
+                            valence = valence * n_scalar
+                    elif start_i == 1:
+                        if words[i - 2] == "never" and (words[i - 1] == "so" or words[i - 1] == "this"):
+                            valence = valence * 1.5
+                        elif infos[i - 2][4]:
+                            valence = valence * n_scalar
+                    else:
+                        if (words[i - 3] == "never" and (words[i - 2] == "so" or words[i - 2] == "this")
+                                or (words[i - 1] == "so" or words[i - 1] == "this")):
+                            valence = valence * 1.25
+                        elif infos[i - 3][4]:
+                            valence = valence * n_scalar
+                        if check_idioms:
+                            valence = self._idioms_check(valence, words, i)
+
+            # _least_check
+            if i > 1 and infos[i - 1][2] is None and infos[i - 1][0] == "least":
+                if infos[i - 2][0] != "at" and infos[i - 2][0] != "very":
+                    valence = valence * n_scalar
+            elif i > 0 and infos[i - 1][2] is None and infos[i - 1][0] == "least":
+                valence = valence * n_scalar
+
+            sentiments.append(valence)
+
+        # _but_check
+        for idx, info in enumerate(infos):
+            if info[0] == "but":
+                for sidx, sentiment in enumerate(sentiments):
+                    if sidx < idx:
+                        sentiments[sidx] = sentiment * 0.5
+                    elif sidx > idx:
+                        sentiments[sidx] = sentiment * 1.5
+                break
+        return sentiments
+
+    @staticmethod
+    def _score_valence(sentiments, text):
+        """SentimentIntensityAnalyzer.score_valence와 같은 계산 (compound, pos, neu, neg)"""
+        if not sentiments:
+            return 0.0, 0.0, 0.0, 0.0
+        sum_s = float(sum(sentiments))
+
+        ep_count = min(text.count("!"), 4)
+        qm_count = text.count("?")
+        qm_amplifier = 0
+        if qm_count > 1:
+            qm_amplifier = qm_count * 0.18 if qm_count <= 3 else 0.96
+        punct_emph_amplifier = ep_count * 0.292 + qm_amplifier
+
+        if sum_s > 0:
+            sum_s += punct_emph_amplifier
+        elif sum_s < 0:
+            sum_s -= punct_emph_amplifier
+        compound = sum_s / math.sqrt((sum_s * sum_s) + 15)
+
+        pos_sum = 0.0
+        neg_sum = 0.0
+        neu_count = 0
+        for sentiment in sentiments:
+            if sentiment > 0:
+                pos_sum += float(sentiment) + 1
+            if sentiment < 0:
+                neg_sum += float(sentiment) - 1
+            if sentiment == 0:
+                neu_count += 1
+
+        if pos_sum > math.fabs(neg_sum):
+            pos_sum += punct_emph_amplifier
+        elif pos_sum < math.fabs(neg_sum):
+            neg_sum -= punct_emph_amplifier
+        total = pos_sum + math.fabs(neg_sum) + neu_count
+        return (
+            round(compound, 4),
+            round(math.fabs(pos_sum / total), 3),
+            round(math.fabs(neu_count / total), 3),
+            round(math.fabs(neg_sum / total), 3)
+        )
+
+    def score(self, text):
+        """
+        텍스트 하나의 점수
+
+        Returns:
+            (compound, pos, neu, neg) 튜플 (문자열이 아니거나 공백뿐이면 모두 0.0)
+        """
+        if not isinstance(text, str) or not text.strip():
+            return 0.0, 0.0, 0.0, 0.0
+        return self._score_valence(self._sentiments(text), text)
+
+    def score_batch(self, texts):
+        """
+        여러 텍스트의 점수를 NumPy 배열로 계산
+
+        Args:
+            texts: 텍스트 리스트 또는 Series
+
+        Returns:
+            {'compound', 'pos', 'neu', 'neg': float64 배열} 딕셔너리
+        """
+        scores = np.array([self.score(text) for text in texts], dtype=np.float64).reshape(-1, 4)
+        return {name: scores[:, k] for k, name in enumerate(SCORE_COLUMNS)}
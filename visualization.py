@@ -1,13 +1,21 @@
 """
 Steam 리뷰 감정 분석 시각화 스크립트
+
+실행:
+    python visualization.py [리뷰 파일]                 # 기본값: game_reviews.parquet
+    python visualization.py --game <게임 ID> [DB 파일]  # 리뷰 저장소(reviews.sqlite)에서 조회
 """
 
+import os
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from collections import Counter
 
+from review_storage import DEFAULT_REVIEWS_FILE, load_reviews, review_columns
+
 # wordcloud는 선택적 (컴파일러가 필요한 경우 설치 실패할 수 있음)
 try:
     from wordcloud import WordCloud
@@ -21,16 +29,44 @@ except ImportError:
 plt.rcParams['font.family'] = 'Malgun Gothic'
 plt.rcParams['axes.unicode_minus'] = False
 
-def load_data(csv_file='game_reviews.csv'):
-    """CSV 파일에서 데이터 로드"""
+# 그래프에 사용하는 컬럼 (파일에서 이 컬럼만 읽음)
+VISUALIZATION_COLUMNS = [
+    'recommended', 'compound_score', 'sentiment_label', 'cleaned_text',
+    'playtime_at_review', 'review_length', 'date_posted'
+]
+
+def load_data(csv_file=DEFAULT_REVIEWS_FILE, columns=VISUALIZATION_COLUMNS):
+    """리뷰 파일(Parquet 또는 CSV)에서 데이터 로드 (columns만 읽음, None이면 전체)"""
     try:
-        df = pd.read_csv(csv_file, encoding='utf-8-sig')
-        return df
+        if columns is not None and 'cleaned_text' in columns and \
+                'cleaned_text' not in review_columns(csv_file):
+            # 정리된 텍스트가 없으면 워드 클라우드에 원문 사용
+            columns = list(columns) + ['review_text']
+        return load_reviews(csv_file, columns=columns)
     except FileNotFoundError:
         print(f"파일 '{csv_file}'을 찾을 수 없습니다.")
         return None
 
-def plot_recommendation_distribution(df):
+def load_game_data(game_id, db_path=None, columns=VISUALIZATION_COLUMNS, **filters):
+    """
+    리뷰 저장소(SQLite)에서 게임의 분석된 리뷰 중 조건에 맞는 행의 columns만 로드 (없으면 None)
+    
+    Args:
+        filters: ReviewDatabase.query의 필터 (recommended, sentiment_label, date_from, date_to)
+    """
+    from review_db import DEFAULT_DB_PATH, ReviewDatabase
+    
+    review_db = ReviewDatabase(db_path or DEFAULT_DB_PATH)
+    try:
+        df = review_db.query(game_id, columns=columns, analyzed=True, **filters)
+    finally:
+        review_db.close()
+    if df.empty:
+        print(f"리뷰 저장소에 게임 {game_id}의 분석된 리뷰가 없습니다.")
+        return None
+    return df
+
+def plot_recommendation_distribution(df, output_dir='.'):
     """추천 분포 막대 그래프"""
     plt.figure(figsize=(10, 6))
     recommendation_counts = df['recommended'].value_counts()
@@ -49,11 +85,12 @@ def plot_recommendation_distribution(df):
                 ha='center', va='bottom', fontsize=12, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('recommendation_distribution.png', dpi=300, bbox_inches='tight')
-    print("추천 분포 그래프가 'recommendation_distribution.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'recommendation_distribution.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"추천 분포 그래프가 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_sentiment_boxplot(df):
+def plot_sentiment_boxplot(df, output_dir='.'):
     """감정 점수 박스 플롯"""
     plt.figure(figsize=(12, 7))
     
@@ -84,14 +121,16 @@ def plot_sentiment_boxplot(df):
     plt.axhline(y=0, color='gray', linestyle='--', linewidth=1, alpha=0.5)
     
     plt.tight_layout()
-    plt.savefig('sentiment_boxplot.png', dpi=300, bbox_inches='tight')
-    print("감정 점수 박스 플롯이 'sentiment_boxplot.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'sentiment_boxplot.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"감정 점수 박스 플롯이 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_sentiment_distribution(df):
+def plot_sentiment_distribution(df, output_dir='.'):
     """감정 레이블 분포"""
     plt.figure(figsize=(10, 6))
     sentiment_counts = df['sentiment_label'].value_counts()
+    sentiment_counts = sentiment_counts[sentiment_counts > 0]
     colors_map = {'positive': '#2ecc71', 'negative': '#e74c3c', 'neutral': '#f39c12'}
     colors = [colors_map.get(label, '#95a5a6') for label in sentiment_counts.index]
     
@@ -109,11 +148,12 @@ def plot_sentiment_distribution(df):
                 f'{int(height)}', ha='center', va='bottom', fontsize=12, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('sentiment_distribution.png', dpi=300, bbox_inches='tight')
-    print("감정 분포 그래프가 'sentiment_distribution.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'sentiment_distribution.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"감정 분포 그래프가 '{path}'에 저장되었습니다.")
     plt.close()
 
-def create_wordcloud(df, background_color='white', max_words=100):
+def create_wordcloud(df, background_color='white', max_words=100, output_dir='.'):
     """워드 클라우드 생성"""
     if not WORDCLOUD_AVAILABLE:
         print("워드 클라우드를 생성할 수 없습니다. wordcloud 패키지가 설치되지 않았습니다.")
@@ -143,11 +183,12 @@ def create_wordcloud(df, background_color='white', max_words=100):
     plt.axis('off')
     plt.title('Steam 리뷰 워드 클라우드', fontsize=20, fontweight='bold', pad=20)
     plt.tight_layout()
-    plt.savefig('wordcloud.png', dpi=300, bbox_inches='tight')
-    print("워드 클라우드가 'wordcloud.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'wordcloud.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"워드 클라우드가 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_playtime_vs_sentiment(df):
+def plot_playtime_vs_sentiment(df, output_dir='.'):
     """플레이 시간과 감정 점수의 관계"""
     plt.figure(figsize=(12, 7))
     
@@ -167,15 +208,17 @@ def plot_playtime_vs_sentiment(df):
     plt.legend(handles=legend_elements, loc='best')
     
     plt.tight_layout()
-    plt.savefig('playtime_vs_sentiment.png', dpi=300, bbox_inches='tight')
-    print("플레이 시간 vs 감정 점수 그래프가 'playtime_vs_sentiment.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'playtime_vs_sentiment.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"플레이 시간 vs 감정 점수 그래프가 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_sentiment_pie_chart(df):
+def plot_sentiment_pie_chart(df, output_dir='.'):
     """감정 분포 파이 차트"""
     plt.figure(figsize=(10, 8))
     
     sentiment_counts = df['sentiment_label'].value_counts()
+    sentiment_counts = sentiment_counts[sentiment_counts > 0]
     colors_map = {'positive': '#2ecc71', 'negative': '#e74c3c', 'neutral': '#f39c12'}
     colors = [colors_map.get(label, '#95a5a6') for label in sentiment_counts.index]
     
@@ -194,11 +237,12 @@ def plot_sentiment_pie_chart(df):
     plt.title('감정 분포 (파이 차트)', fontsize=16, fontweight='bold', pad=20)
     
     plt.tight_layout()
-    plt.savefig('sentiment_pie_chart.png', dpi=300, bbox_inches='tight')
-    print("감정 분포 파이 차트가 'sentiment_pie_chart.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'sentiment_pie_chart.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"감정 분포 파이 차트가 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_review_length_distribution(df):
+def plot_review_length_distribution(df, output_dir='.'):
     """리뷰 길이 분포 히스토그램"""
     plt.figure(figsize=(12, 7))
     
@@ -219,11 +263,12 @@ def plot_review_length_distribution(df):
     plt.legend()
     
     plt.tight_layout()
-    plt.savefig('review_length_distribution.png', dpi=300, bbox_inches='tight')
-    print("리뷰 길이 분포 히스토그램이 'review_length_distribution.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'review_length_distribution.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"리뷰 길이 분포 히스토그램이 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_sentiment_score_histogram(df):
+def plot_sentiment_score_histogram(df, output_dir='.'):
     """감정 점수 히스토그램"""
     plt.figure(figsize=(12, 7))
     
@@ -242,11 +287,12 @@ def plot_sentiment_score_histogram(df):
     plt.axvline(x=0, color='gray', linestyle='--', linewidth=1, alpha=0.5)
     
     plt.tight_layout()
-    plt.savefig('sentiment_score_histogram.png', dpi=300, bbox_inches='tight')
-    print("감정 점수 히스토그램이 'sentiment_score_histogram.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'sentiment_score_histogram.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"감정 점수 히스토그램이 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_playtime_distribution(df):
+def plot_playtime_distribution(df, output_dir='.'):
     """플레이 시간 분포 (추천/비추천별)"""
     if 'playtime_at_review' not in df.columns:
         return
@@ -266,19 +312,19 @@ def plot_playtime_distribution(df):
     plt.grid(axis='y', alpha=0.3, linestyle='--')
     
     plt.tight_layout()
-    plt.savefig('playtime_distribution.png', dpi=300, bbox_inches='tight')
-    print("플레이 시간 분포 그래프가 'playtime_distribution.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'playtime_distribution.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"플레이 시간 분포 그래프가 '{path}'에 저장되었습니다.")
     plt.close()
 
-def plot_date_sentiment_trend(df):
+def plot_date_sentiment_trend(df, output_dir='.'):
     """날짜별 감정 점수 추이"""
     if 'date_posted' not in df.columns:
         return
     
     try:
         # 날짜 변환
-        df['date'] = pd.to_datetime(df['date_posted'], errors='coerce')
-        df_with_date = df.dropna(subset=['date'])
+        df_with_date = df.assign(date=pd.to_datetime(df['date_posted'], errors='coerce')).dropna(subset=['date'])
         
         if df_with_date.empty:
             return
@@ -298,13 +344,14 @@ def plot_date_sentiment_trend(df):
         plt.xticks(rotation=45)
         
         plt.tight_layout()
-        plt.savefig('date_sentiment_trend.png', dpi=300, bbox_inches='tight')
-        print("날짜별 감정 점수 추이가 'date_sentiment_trend.png'에 저장되었습니다.")
+        path = os.path.join(output_dir, 'date_sentiment_trend.png')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
+        print(f"날짜별 감정 점수 추이가 '{path}'에 저장되었습니다.")
         plt.close()
     except Exception as e:
         print(f"날짜별 추이 그래프 생성 오류: {e}")
 
-def create_simple_wordcloud(df):
+def create_simple_wordcloud(df, output_dir='.'):
     """간단한 워드 클라우드 (wordcloud 없이 matplotlib만 사용)"""
     if 'cleaned_text' in df.columns:
         text = ' '.join(df['cleaned_text'].dropna().astype(str))
@@ -339,95 +386,123 @@ def create_simple_wordcloud(df):
     plt.gca().invert_yaxis()
     
     plt.tight_layout()
-    plt.savefig('wordcloud_simple.png', dpi=300, bbox_inches='tight')
-    print("간단한 단어 빈도 그래프가 'wordcloud_simple.png'에 저장되었습니다.")
+    path = os.path.join(output_dir, 'wordcloud_simple.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"간단한 단어 빈도 그래프가 '{path}'에 저장되었습니다.")
     plt.close()
 
-def generate_all_visualizations(csv_file='game_reviews.csv'):
-    """모든 시각화 생성"""
-    df = load_data(csv_file)
+def generate_all_visualizations(csv_file=DEFAULT_REVIEWS_FILE, progress=None, output_dir='.'):
+    """
+    모든 시각화 생성
+    
+    Args:
+        csv_file: 감정 분석 결과 파일 (.parquet 또는 .csv, 또는 감정 분석 결과 DataFrame)
+        progress: 진행 상황 콜백 - 그래프 하나를 처리할 때마다
+            progress({'stage': 'visualize', 'done', 'total', 'unit': 'charts', 'chart'})로 호출 (선택)
+        output_dir: 이미지 파일을 저장할 디렉토리
+    """
+    df = csv_file if isinstance(csv_file, pd.DataFrame) else load_data(csv_file)
     
     if df is None:
         return
     
     print("\n=== 시각화 생성 시작 ===\n")
     
+    def report(done, chart):
+        if progress is not None:
+            progress({'stage': 'visualize', 'done': done, 'total': 10, 'unit': 'charts', 'chart': chart})
+    
     # 1. 추천 분포
     try:
-        plot_recommendation_distribution(df)
+        plot_recommendation_distribution(df, output_dir=output_dir)
     except Exception as e:
         print(f"추천 분포 그래프 생성 오류: {e}")
+    report(1, 'recommendation_distribution')
     
     # 2. 감정 점수 박스 플롯
     try:
-        plot_sentiment_boxplot(df)
+        plot_sentiment_boxplot(df, output_dir=output_dir)
     except Exception as e:
         print(f"감정 점수 박스 플롯 생성 오류: {e}")
+    report(2, 'sentiment_boxplot')
     
     # 3. 감정 레이블 분포
     try:
-        plot_sentiment_distribution(df)
+        plot_sentiment_distribution(df, output_dir=output_dir)
     except Exception as e:
         print(f"감정 레이블 분포 그래프 생성 오류: {e}")
+    report(3, 'sentiment_distribution')
     
     # 4. 워드 클라우드 (선택적, 실패해도 계속 진행)
     if WORDCLOUD_AVAILABLE:
         try:
-            create_wordcloud(df)
+            create_wordcloud(df, output_dir=output_dir)
         except Exception as e:
             print(f"워드 클라우드 생성 오류 (건너뜀): {e}")
             # 대체 방법 사용
             try:
-                create_simple_wordcloud(df)
+                create_simple_wordcloud(df, output_dir=output_dir)
             except Exception as e2:
                 print(f"간단한 워드 클라우드 생성 오류: {e2}")
     else:
         # wordcloud가 없으면 간단한 버전 사용
         try:
-            create_simple_wordcloud(df)
+            create_simple_wordcloud(df, output_dir=output_dir)
         except Exception as e:
             print(f"간단한 워드 클라우드 생성 오류: {e}")
+    report(4, 'wordcloud')
     
     # 5. 플레이 시간 vs 감정 점수
     if 'playtime_at_review' in df.columns:
         try:
-            plot_playtime_vs_sentiment(df)
+            plot_playtime_vs_sentiment(df, output_dir=output_dir)
         except Exception as e:
             print(f"플레이 시간 vs 감정 점수 그래프 생성 오류: {e}")
+    report(5, 'playtime_vs_sentiment')
     
     # 6. 감정 분포 파이 차트
     try:
-        plot_sentiment_pie_chart(df)
+        plot_sentiment_pie_chart(df, output_dir=output_dir)
     except Exception as e:
         print(f"감정 분포 파이 차트 생성 오류: {e}")
+    report(6, 'sentiment_pie_chart')
     
     # 7. 리뷰 길이 분포
     try:
-        plot_review_length_distribution(df)
+        plot_review_length_distribution(df, output_dir=output_dir)
     except Exception as e:
         print(f"리뷰 길이 분포 그래프 생성 오류: {e}")
+    report(7, 'review_length_distribution')
     
     # 8. 감정 점수 히스토그램
     try:
-        plot_sentiment_score_histogram(df)
+        plot_sentiment_score_histogram(df, output_dir=output_dir)
     except Exception as e:
         print(f"감정 점수 히스토그램 생성 오류: {e}")
+    report(8, 'sentiment_score_histogram')
     
     # 9. 플레이 시간 분포
     if 'playtime_at_review' in df.columns:
         try:
-            plot_playtime_distribution(df)
+            plot_playtime_distribution(df, output_dir=output_dir)
         except Exception as e:
             print(f"플레이 시간 분포 그래프 생성 오류: {e}")
+    report(9, 'playtime_distribution')
     
     # 10. 날짜별 감정 추이
     try:
-        plot_date_sentiment_trend(df)
+        plot_date_sentiment_trend(df, output_dir=output_dir)
     except Exception as e:
         print(f"날짜별 감정 추이 그래프 생성 오류: {e}")
+    report(10, 'date_sentiment_trend')
     
     print("\n=== 시각화 생성이 완료되었습니다! ===\n")
 
 if __name__ == "__main__":
-    generate_all_visualizations()
+    if len(sys.argv) > 2 and sys.argv[1] == '--game':
+        game_df = load_game_data(*sys.argv[2:4])
+        if game_df is not None:
+            generate_all_visualizations(game_df)
+    else:
+        generate_all_visualizations(*sys.argv[1:2])
 